@@ -0,0 +1,51 @@
+"""
+Memory held by the ASTs of a catalogue of expressions, and the time to compare them.
+
+    python -m benchmarks.bench_ast_memory
+"""
+
+import itertools
+import time
+import tracemalloc
+
+from benchmarks.bench_warmup import catalogue
+from pyopath.xpath.AST.parser import parse
+
+
+def overlapping_catalogue():
+    """
+    Expressions built from a handful of steps and predicates, like the queries of a single service tend to be.
+    """
+    steps = ("country", "rank", "year", "neighbor", "gdppc", "@name", "text()")
+    predicates = ("", "[1]", "[@name eq 'x']", "[rank/text() eq '1']")
+    for first, second, third in itertools.product(steps[:5], steps[:5], steps):
+        for predicate in predicates:
+            yield f"{first}{predicate}/{second}/{third}"
+
+
+def measure(name, expressions):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    asts = [parse(expression) for expression in expressions]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    again = [parse(expression) for expression in expressions]
+    start = time.perf_counter()
+    for _ in range(10):
+        assert all(a == b for a, b in zip(asts, again))
+    compared = (time.perf_counter() - start) / 10
+
+    print(
+        f"{name}, {len(expressions)} expressions: {(after - before) / 1024:.0f} KiB of ASTs,"
+        f" comparing all {compared * 1000:.2f} ms"
+    )
+
+
+def main():
+    measure("distinct", list(catalogue(5000)))
+    measure("overlapping", list(overlapping_catalogue()))
+
+
+if __name__ == "__main__":
+    main()
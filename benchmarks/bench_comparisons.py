@@ -0,0 +1,41 @@
+"""
+General comparisons of two long sequences, going through every pair and with the fast paths of comparisons.py.
+
+    python -m benchmarks.bench_comparisons
+"""
+
+import pyopath
+from benchmarks.bench_evaluate import document
+from benchmarks.timing import timed
+from pyopath.comparisons import GENERAL_OPERATORS, compare_pair
+
+COUNT = 2000
+
+# The left-hand sides and operators, compared with $values
+COMPARISONS = (
+    ("country/rank/text()", "="),
+    ("country/rank/text()", "!="),
+    ("country/rank/text()", "<"),
+    ("country/@name", "<="),
+)
+
+
+def main():
+    data = document(COUNT)
+    # None of them equal to, or less than, any of the ranks
+    values = [-n for n in range(1, COUNT + 1)]
+    print("     pairs      fast")
+    for path, op in COMPARISONS:
+        expression = f"{path}{op}$values"
+        compiled = pyopath.compile(expression)
+        left = pyopath.query(data, path)
+        operator = GENERAL_OPERATORS[op]
+        pairs = timed(
+            lambda: any(compare_pair(lhs, rhs, operator) for lhs in left for rhs in values), number=1, repeat=3
+        )
+        fast = timed(lambda: compiled.evaluate(data, variables=dict(values=values)), number=1, repeat=3)
+        print(f"{pairs * 1000:8.2f} ms {fast * 1000:8.2f} ms  {expression}")
+
+
+if __name__ == "__main__":
+    main()
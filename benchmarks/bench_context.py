@@ -0,0 +1,52 @@
+"""
+Cost of the dynamic contexts created while evaluating, on a document of about 100k elements.
+Measures the time and the peak memory of the interpreter and the closures.
+
+    python -m benchmarks.bench_context
+"""
+
+import time
+import timeit
+import tracemalloc
+
+from benchmarks.bench_evaluate import document
+from pyopath.closures import compile_node
+from pyopath.doer import DynamicContext, create_context, evaluate
+from pyopath.xpath.AST.parser import parse
+
+EXPRESSIONS = (
+    "country/rank/text()",
+    "country[rank/text() eq '7']/year/text()",
+)
+
+
+def measure(function, data):
+    seconds = float("inf")
+    for _ in range(5):
+        start = time.process_time()
+        function(create_context(data))
+        seconds = min(seconds, time.process_time() - start)
+
+    tracemalloc.start()
+    function(create_context(data))
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return seconds, peak
+
+
+def main():
+    context = create_context(document(1))
+    seconds = min(timeit.repeat(lambda: DynamicContext(context, None, 1, 1, None), number=100000, repeat=5))
+    print(f"{seconds * 10:.2f} us per DynamicContext")
+
+    data = document(20000)
+    for expression in EXPRESSIONS:
+        node = parse(expression)
+        evaluator = compile_node(node)
+        for name, function in (("interpreted", lambda context: evaluate(node, context)), ("closures", evaluator)):
+            seconds, peak = measure(function, data)
+            print(f"{name:>12} {seconds * 1000:8.1f} ms {peak / 2**20:8.1f} MiB peak  {expression}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+Descendant axes over a deep and a wide tree, with the interpreter, the closures and the generated source.
+
+    python -m benchmarks.bench_descendants
+"""
+
+import xml.etree.ElementTree as XMLET
+
+import pyopath
+import pyopath.nodewrappers.etree  # noqa: F401
+from benchmarks.timing import timed
+from pyopath.doer import create_context, evaluate
+
+EXPRESSIONS = (
+    "//a[@last]/@last",
+    "descendant::a[@last]/@last",
+    "//text()",
+)
+
+
+def deep(depth: int) -> XMLET.Element:
+    top = node = XMLET.Element("a")
+    for _ in range(depth):
+        node = XMLET.SubElement(node, "a")
+    node.set("last", "1")
+    return top
+
+
+def wide(width: int) -> XMLET.Element:
+    top = XMLET.Element("r")
+    for _ in range(width):
+        XMLET.SubElement(XMLET.SubElement(top, "b"), "a")
+    top[-1][0].set("last", "1")
+    return top
+
+
+def main():
+    for name, data in (("deep", deep(20000)), ("wide", wide(20000))):
+        print(f"{name:5} interpreted   closures    codegen")
+        for expression in EXPRESSIONS:
+            compiled = pyopath.compile(expression)
+            interpreted = timed(lambda: evaluate(compiled.plan, create_context(data)), number=5, repeat=3)
+            times = []
+            for evaluator in pyopath.compiled.EVALUATORS:
+                pyopath.compiled.set_default_evaluator(evaluator)
+                times.append(timed(lambda: compiled.evaluate(data), number=5, repeat=3))
+            pyopath.compiled.set_default_evaluator("codegen")
+            closures, codegen = times
+            print(f"   {interpreted * 1000:9.2f} ms {closures * 1000:7.2f} ms {codegen * 1000:7.2f} ms  {expression}")
+
+
+if __name__ == "__main__":
+    main()
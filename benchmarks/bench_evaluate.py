@@ -0,0 +1,72 @@
+"""
+Evaluation throughput of the interpreter, the compiled closures and the generated python source,
+ on a generated document. A hand-written loop over the node wrappers is included as a lower bound.
+
+    python -m benchmarks.bench_evaluate
+"""
+
+import timeit
+import xml.etree.ElementTree as XMLET
+
+import pyopath.nodewrappers.etree  # noqa: F401
+from pyopath.closures import compile_node, is_text
+from pyopath.codegen import compile_query
+from pyopath.doer import create_context, evaluate
+from pyopath.xpath.AST.parser import parse
+
+EXPRESSIONS = (
+    "country/rank/text()",
+    "country[@name]/rank/text()",
+    "country[2]/neighbor/@name",
+    "country[rank/text() eq '7']/year/text()",
+    "country[neighbor/@direction eq 'N']/@name",
+)
+
+
+def document(countries: int) -> XMLET.Element:
+    root = XMLET.Element("data")
+    for n in range(countries):
+        country = XMLET.SubElement(root, "country", name=f"country{n}")
+        XMLET.SubElement(country, "rank").text = str(n)
+        XMLET.SubElement(country, "year").text = str(2000 + n % 20)
+        XMLET.SubElement(country, "gdppc").text = str(n * 100)
+        XMLET.SubElement(country, "neighbor", name=f"neighbor{n}", direction="NESW"[n % 4])
+    return root
+
+
+def hand_written(context):
+    """
+    country[@name]/rank/text()
+    """
+    results = []
+    for country in context.item.children():
+        if country.node_name() == "country" and any(a.node_name() == "name" for a in country.attributes()):
+            for rank in country.children():
+                if rank.node_name() == "rank":
+                    for text in rank.children():
+                        if is_text(text):
+                            results.append(text)
+    return results
+
+
+def timed(function, data) -> float:
+    number = 10
+    return timeit.timeit(lambda: list(function(create_context(data))), number=number) / number
+
+
+def main():
+    data = document(1000)
+    print("interpreted   closures    codegen")
+    for expression in EXPRESSIONS:
+        node = parse(expression)
+        evaluator = compile_node(node)
+        generated = compile_query(node)
+        interpreted = timed(lambda context: evaluate(node, context), data)
+        closures = timed(evaluator, data)
+        codegen = timed(generated, data)
+        print(f"{interpreted * 1000:8.2f} ms {closures * 1000:7.2f} ms {codegen * 1000:7.2f} ms  {expression}")
+    print(f"{'':>23} {timed(hand_written, data) * 1000:7.2f} ms  hand-written {EXPRESSIONS[1]}")
+
+
+if __name__ == "__main__":
+    main()
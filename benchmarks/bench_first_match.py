@@ -0,0 +1,39 @@
+"""
+First-match lookups on a wide node; positional predicates, [last()] and existence predicates,
+ with the interpreter, the closures and the generated source.
+
+    python -m benchmarks.bench_first_match
+"""
+
+import pyopath
+from benchmarks.bench_evaluate import document
+from benchmarks.timing import timed
+from pyopath.doer import create_context, evaluate
+from pyopath.xpath.AST.parser import parse
+
+EXPRESSIONS = (
+    "country[1]/@name",
+    "country[10]/@name",
+    "country[last()]/@name",
+    "country[@name][1]/rank/text()",
+)
+
+
+def main():
+    data = document(100000)
+    print("interpreted   closures    codegen")
+    for expression in EXPRESSIONS:
+        node = parse(expression)
+        compiled = pyopath.compile(expression)
+        interpreted = timed(lambda: evaluate(node, create_context(data)), number=10, repeat=3)
+        times = []
+        for evaluator in pyopath.compiled.EVALUATORS:
+            pyopath.compiled.set_default_evaluator(evaluator)
+            times.append(timed(lambda: compiled.evaluate(data), number=10, repeat=3))
+        pyopath.compiled.set_default_evaluator("codegen")
+        closures, codegen = times
+        print(f"{interpreted * 1000:8.2f} ms {closures * 1000:7.2f} ms {codegen * 1000:7.2f} ms  {expression}")
+
+
+if __name__ == "__main__":
+    main()
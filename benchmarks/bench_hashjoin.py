@@ -0,0 +1,43 @@
+"""
+A predicate comparing each country with the names of another document's neighbors, as a nested loop and as a hash
+ join, where the names are looked up once and hashed.
+
+    python -m benchmarks.bench_hashjoin
+"""
+
+import xml.etree.ElementTree as XMLET
+
+import pyopath
+from benchmarks.bench_evaluate import document
+from benchmarks.timing import timed
+from pyopath.doer import create_context, evaluate
+
+EXPRESSIONS = (
+    # ./$other depends on the context item, so the names are looked up and compared for every country
+    ("nested loop", "country[@name=./$other//neighbor/@name]/@name"),
+    ("hash join", "country[@name=$other//neighbor/@name]/@name"),
+)
+
+
+def others(count: int) -> XMLET.Element:
+    top = XMLET.Element("others")
+    for n in range(0, count * 2, 2):
+        XMLET.SubElement(top, "neighbor", name=f"country{n}")
+    return top
+
+
+def main():
+    data = document(200)
+    variables = dict(other=others(200))
+    print("interpreted   closures")
+    for name, expression in EXPRESSIONS:
+        compiled = pyopath.compile(expression)
+        interpreted = timed(
+            lambda: evaluate(compiled.plan, create_context(data, variables=variables)), number=1, repeat=3
+        )
+        closures = timed(lambda: compiled.evaluate(data, variables=variables), number=1, repeat=3)
+        print(f"{interpreted * 1000:8.2f} ms {closures * 1000:8.2f} ms  {name}: {expression}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+"""
+Predicates comparing with variables, whose value is the same for every item tested.
+
+    python -m benchmarks.bench_hoisting
+"""
+
+import timeit
+import xml.etree.ElementTree as XMLET
+
+import pyopath
+import pyopath.nodewrappers.etree  # noqa: F401
+from pyopath.doer import create_context, evaluate
+from pyopath.xpath.AST.parser import parse
+
+EXPRESSIONS = (
+    "item[@price ne $limit]",
+    "item[@price ne $limits/limit/text()]",
+)
+
+
+def main():
+    data = XMLET.fromstring("<data>" + "".join(f"<item price='{n % 100}'/>" for n in range(20000)) + "</data>")
+    limits = XMLET.fromstring("<limits><limit>3</limit></limits>")
+    variables = dict(limit="3", limits=limits)
+    print("interpreted   closures")
+    for expression in EXPRESSIONS:
+        node = parse(expression)
+        compiled = pyopath.compile(expression)
+        interpreted = min(timeit.repeat(lambda: evaluate(node, create_context(data, variables=variables)), number=1))
+        closures = min(timeit.repeat(lambda: compiled.evaluate(data, variables=variables), number=1))
+        print(f"{interpreted * 1000:8.2f} ms {closures * 1000:7.2f} ms  {expression}")
+
+
+if __name__ == "__main__":
+    main()
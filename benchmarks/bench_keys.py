@@ -0,0 +1,32 @@
+"""
+Lookups of countries by name, with a predicate over every country and with a declared key.
+
+    python -m benchmarks.bench_keys
+"""
+
+import pyopath
+from benchmarks.bench_evaluate import document
+from benchmarks.timing import timed
+from pyopath.doer import StaticContext
+
+EXPRESSIONS = (
+    ("country[@name eq 'country12345']/rank/text()", "key('countries','country12345')/rank/text()"),
+    ("country[@name eq 'country7']/year/text()", "key('countries','country7')/year/text()"),
+)
+
+
+def main():
+    data = document(20000)
+    countries = pyopath.Index(data, match="country", use="@name")
+    static_context = StaticContext(indexes={"countries": countries})
+    build = timed(lambda: (countries.rebuild(), len(countries)), number=10, repeat=3)
+    print(f"building the key {build * 1000:.2f} ms")
+    print(" predicate        key")
+    for predicate, key in EXPRESSIONS:
+        walked = timed(lambda: pyopath.query(data, predicate), number=10, repeat=3)
+        looked_up = timed(lambda: pyopath.query(data, key, static_context=static_context), number=10, repeat=3)
+        print(f"{walked * 1000:8.2f} ms {looked_up * 1000:8.2f} ms  {key}")
+
+
+if __name__ == "__main__":
+    main()
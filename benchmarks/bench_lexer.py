@@ -0,0 +1,31 @@
+"""
+Lexing time on long generated expressions, ply's lexer versus the single pass Tokenizer.
+
+    python -m benchmarks.bench_lexer
+"""
+
+import timeit
+
+from pyopath.xpath.AST.lexer import lex, ply_lex
+
+
+def long_path(steps: int) -> str:
+    return "/".join(f"child::step{n}[@attribute{n}]" for n in range(steps))
+
+
+def deep_predicates(depth: int) -> str:
+    return "a[" * depth + "text() eq '1'" + "]" * depth
+
+
+def main():
+    for name, generate in (("path", long_path), ("nesting", deep_predicates)):
+        for size in (10, 100, 1000):
+            expression = generate(size)
+            for lexer_name, lexer in (("ply", ply_lex), ("tokenizer", lex)):
+                number = max(1, 2000 // size)
+                seconds = timeit.timeit(lambda: list(lexer(expression)), number=number) / number
+                print(f"{name:>8} {size:5} {lexer_name:>10} {seconds * 1000:9.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
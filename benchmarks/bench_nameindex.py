@@ -0,0 +1,35 @@
+"""
+Repeated lookups on the same document, walking the tree and from the element-name and attribute-value indexes.
+
+    python -m benchmarks.bench_nameindex
+"""
+
+import pyopath
+from benchmarks.bench_evaluate import document
+from benchmarks.timing import timed
+
+EXPRESSIONS = (
+    "//rank/text()",
+    "//neighbor[@direction eq 'N']/@name",
+    "descendant::country[10]/@name",
+    "country[@name eq 'country12345']/rank/text()",
+    "//neighbor[@name eq 'neighbor777']/@direction",
+)
+
+
+def main():
+    data = document(20000)
+    print("    walked     indexed")
+    for expression in EXPRESSIONS:
+        compiled = pyopath.compile(expression)
+        pyopath.set_index_size(0)
+        walked = timed(lambda: compiled.evaluate(data), number=10, repeat=3)
+        pyopath.set_index_size(1000000)
+        indexed = timed(lambda: compiled.evaluate(data), number=10, repeat=3)
+        pyopath.clear_index()
+        print(f"{walked * 1000:8.2f} ms {indexed * 1000:8.2f} ms  {expression}")
+    pyopath.set_index_size(0)
+
+
+if __name__ == "__main__":
+    main()
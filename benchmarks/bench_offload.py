@@ -0,0 +1,42 @@
+"""
+Queries over an lxml document evaluated by lxml's XPath engine, against the python evaluators, which evaluated all
+ queries before offload.py; the first with generated python source where there is any, otherwise closures.
+
+    python -m benchmarks.bench_offload
+"""
+
+import xml.etree.ElementTree as XMLET
+
+import lxml.etree as LXMLET
+
+import pyopath
+from benchmarks.bench_evaluate import document
+from benchmarks.timing import timed
+from pyopath.offload import set_offload
+
+EXPRESSIONS = (
+    "country/neighbor/@name",
+    "country[@name='Panama']/rank",
+    "//neighbor[@direction='N']/@name",
+    "country[neighbor[2]][last()]/@name",
+    "country/@name='Nowhere'",
+)
+
+
+def main():
+    data = LXMLET.fromstring(XMLET.tostring(document(5000)))
+    print("      lxml     python")
+    for expression in EXPRESSIONS:
+        compiled = pyopath.compile(expression)
+        assert compiled.xpath is not None, expression
+        times = []
+        for offloaded in (True, False):
+            set_offload(offloaded)
+            compiled.evaluate(data)
+            times.append(timed(lambda: compiled.evaluate(data)))
+        set_offload(True)
+        print("  ".join(f"{time * 1000:8.2f} ms" for time in times) + f"  {expression}")
+
+
+if __name__ == "__main__":
+    main()
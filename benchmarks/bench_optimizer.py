@@ -0,0 +1,55 @@
+"""
+Evaluation time of queries with and without the optimizer rules, on a generated document and a deep tree.
+
+    python -m benchmarks.bench_optimizer
+"""
+
+import sys
+import timeit
+import xml.etree.ElementTree as XMLET
+
+import pyopath
+from benchmarks.bench_evaluate import document
+from pyopath.optimizer import RULES, set_rule
+
+EXPRESSIONS = (
+    ".//rank/text()",
+    ".//neighbor[@direction eq 'N']/@name",
+    "country[1 eq 1][.]/rank/text()",
+)
+DEEP_EXPRESSIONS = (".//leaf", ".//node//leaf")
+
+
+def deep(depth: int) -> XMLET.Element:
+    root = XMLET.Element("node")
+    parent = root
+    for _ in range(depth):
+        XMLET.SubElement(parent, "leaf")
+        parent = XMLET.SubElement(parent, "node")
+    return root
+
+
+def timed(expression: str, data) -> float:
+    pyopath.clear_cache()
+    compiled = pyopath.compile(expression)
+    return min(timeit.repeat(lambda: compiled.evaluate(data), number=1, repeat=5))
+
+
+def main():
+    sys.setrecursionlimit(10000)
+    cases = [(expression, document(2000)) for expression in EXPRESSIONS]
+    cases += [(expression, deep(200)) for expression in DEEP_EXPRESSIONS]
+    print("   without    optimized")
+    for expression, data in cases:
+        for rule in RULES:
+            set_rule(rule, False)
+        without = timed(expression, data)
+        for rule in RULES:
+            set_rule(rule, True)
+        optimized = timed(expression, data)
+        print(f"{without * 1000:8.2f} ms {optimized * 1000:8.2f} ms  {expression}")
+    pyopath.clear_cache()
+
+
+if __name__ == "__main__":
+    main()
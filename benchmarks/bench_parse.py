@@ -0,0 +1,30 @@
+"""
+Uncached parse latency per backend.
+
+    python -m benchmarks.bench_parse
+"""
+
+import timeit
+
+from pyopath.xpath.AST.parser import BACKENDS, parse
+
+EXPRESSIONS = (
+    "country",
+    "country[1]/rank/text() eq '1'",
+    "country[rank/text() eq '1']/year/text()",
+    "child::country[@name][neighbor[@direction]]/attribute::name",
+    "a/b/c/d/e/f/g/h/i/j",
+)
+
+
+def main():
+    for backend in BACKENDS:
+        parse("a", backend=backend)
+        for expression in EXPRESSIONS:
+            number = 2000
+            seconds = timeit.timeit(lambda: parse(expression, backend=backend), number=number)
+            print(f"{backend:>8} {seconds / number * 1e6:8.1f} us  {expression}")
+
+
+if __name__ == "__main__":
+    main()
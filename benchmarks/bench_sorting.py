@@ -0,0 +1,39 @@
+"""
+Paths whose results the static properties prove to be in document order, against sorting those results anyway,
+ which every path did before properties.py. Also paths that are sorted, which are left to the closures.
+
+    python -m benchmarks.bench_sorting
+"""
+
+import pyopath
+from benchmarks.bench_evaluate import document
+from benchmarks.timing import timed
+from pyopath.doer import DynamicContext, create_context, in_document_order, keyed_nodes
+from pyopath.properties import needs_sorting
+
+EXPRESSIONS = (
+    "country/neighbor",
+    "country/neighbor/@name",
+    "country[2]/descendant::neighbor",
+    "descendant::country/rank",
+    "//neighbor[1]",
+    "country/(neighbor,rank)",
+)
+
+
+def main():
+    data = document(5000)
+    pyopath.query(data, "country[1]|country[2]")
+    print("       path   +sorting  sorted")
+    for expression in EXPRESSIONS:
+        compiled = pyopath.compile(expression)
+        path = timed(lambda: compiled.evaluate(data, unwrap_nodes=False))
+        context = create_context(data)
+        items = [DynamicContext(context, node, 1) for node in compiled.evaluate(data, unwrap_nodes=False)]
+        sorting = timed(lambda: in_document_order(keyed_nodes(items)))
+        sorted_by_path = "yes" if needs_sorting(compiled.plan) else "no"
+        print(f"{path * 1000:8.2f} ms {sorting * 1000:8.2f} ms  {sorted_by_path:6}  {expression}")
+
+
+if __name__ == "__main__":
+    main()
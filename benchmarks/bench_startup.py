@@ -0,0 +1,63 @@
+"""
+Cold first-query latency, measured in fresh interpreters.
+
+    python -m benchmarks.bench_startup [runs]
+
+"ply prebuilt" loads the shipped LALR tables once per process.
+"ply runtime" forces ply to generate the grammar tables from scratch on every parse, as it used to.
+"descent" uses the recursive descent backend, which has no tables at all.
+"""
+
+import subprocess
+import sys
+from statistics import median
+
+SNIPPET = """
+import time
+start = time.perf_counter()
+import xml.etree.ElementTree as ET
+import pyopath, pyopath.nodewrappers.etree
+import pyopath.xpath.AST.parser as parser
+parser.set_default_backend("{backend}")
+if {runtime}:
+    import ply.yacc
+    def build_parser(write_tables=False, debug=False, outputdir=None):
+        path_parser = parser.PathParser()
+        path_parser.tokens = parser.PathLexer.tokens
+        return ply.yacc.yacc(module=path_parser, tabmodule="no_such_parsetab", write_tables=False,
+                             debug=False, errorlog=ply.yacc.NullLogger())
+    parser.get_parser = build_parser
+pyopath.query(ET.fromstring("<a><b>1</b></a>"), "b/text()")
+first = time.perf_counter()
+pyopath.clear_cache()
+pyopath.query(ET.fromstring("<a><b>1</b></a>"), "b/text()")
+second = time.perf_counter()
+print(first - start, second - first)
+"""
+
+
+def measure(backend: str, runtime: bool, runs: int):
+    firsts, seconds = [], []
+    for _ in range(runs):
+        out = subprocess.check_output(
+            [sys.executable, "-c", SNIPPET.format(backend=backend, runtime=runtime)], text=True
+        )
+        first, second = map(float, out.split())
+        firsts.append(first)
+        seconds.append(second)
+    return median(firsts), median(seconds)
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    for name, backend, runtime in (
+        ("ply runtime", "ply", True),
+        ("ply prebuilt", "ply", False),
+        ("descent", "descent", False),
+    ):
+        first, second = measure(backend, runtime, runs)
+        print(f"{name:>12}: import + first query {first * 1000:8.2f} ms, next uncached parse {second * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
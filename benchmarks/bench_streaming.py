@@ -0,0 +1,54 @@
+"""
+Time to the first result and peak memory when streaming results, versus evaluating the whole query,
+ on a document of about 100k elements.
+
+    python -m benchmarks.bench_streaming
+"""
+
+import time
+import tracemalloc
+
+import pyopath
+from benchmarks.bench_evaluate import document
+
+EXPRESSIONS = (
+    "country/rank/text()",
+    "country[neighbor/@direction eq 'N']/@name",
+    "country[last()]/@name",
+)
+
+
+def main():
+    data = document(20000)
+    for evaluator in pyopath.compiled.EVALUATORS:
+        pyopath.compiled.set_default_evaluator(evaluator)
+        for expression in EXPRESSIONS:
+            compiled = pyopath.compile(expression)
+
+            start = time.perf_counter()
+            compiled.evaluate(data)
+            everything = time.perf_counter() - start
+
+            start = time.perf_counter()
+            next(compiled.iter(data))
+            first = time.perf_counter() - start
+
+            tracemalloc.start()
+            compiled.evaluate(data, unwrap_nodes=False)
+            evaluated_peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.reset_peak()
+            for _ in compiled.iter(data, unwrap_nodes=False):
+                pass
+            streamed_peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+            print(
+                f"{evaluator:>8} all {everything * 1000:7.1f} ms, first {first * 1000:7.3f} ms,"
+                f" peak {evaluated_peak / 2**20:5.1f} MiB evaluated {streamed_peak / 2**20:5.1f} MiB streamed"
+                f"  {expression}"
+            )
+    pyopath.compiled.set_default_evaluator("codegen")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""
+String values of etree elements; of the elements a predicate tests, and of a large subtree tested once per item,
+ with and without the string values cached. Also lxml's itertext against serializing the text, which it uses.
+
+    python -m benchmarks.bench_string_value
+"""
+
+import xml.etree.ElementTree as XMLET
+
+import lxml.etree as LXMLET
+
+import pyopath
+from benchmarks.bench_evaluate import document
+from benchmarks.timing import timed
+from pyopath.nodewrappers import etree
+
+EXPRESSIONS = (
+    "country[.='nothing']",
+    "country[rank='7']/@name",
+    "country[position() le 100][string(/) eq '']",
+)
+
+
+def main():
+    xml_data = document(5000)
+    lxml_data = LXMLET.fromstring(XMLET.tostring(xml_data))
+    print("      xml   xml cached        lxml  lxml cached")
+    for expression in EXPRESSIONS:
+        times = []
+        for data in (xml_data, lxml_data):
+            for cached in (False, True):
+                etree.set_string_cache(cached)
+                pyopath.query(data, expression)
+                times.append(timed(lambda: pyopath.query(data, expression)))
+        etree.set_string_cache(False)
+        print("  ".join(f"{time * 1000:8.2f} ms" for time in times) + f"  {expression}")
+
+    itertext = timed(lambda: "".join(lxml_data.itertext()))
+    serialized = timed(lambda: etree.subtree_text(lxml_data))
+    print(
+        f"lxml string value of the document, itertext {itertext * 1000:.2f} ms, serialized {serialized * 1000:.2f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+Combining node sequences; the paths on their own, and combined with union, intersect and except, which sort the
+ nodes into document order by their order keys. Also sorting by the keys etree numbers for, against the generic
+ keys made from the positions among siblings.
+
+    python -m benchmarks.bench_union
+"""
+
+import random
+
+import pyopath
+from benchmarks.bench_evaluate import document
+from benchmarks.timing import timed
+from pyopath.nodewrappers.base import ancestry_key, order_key
+from pyopath.nodewrappers.etree import clear_document_order
+
+EXPRESSIONS = (
+    ("country/year", "country/rank"),
+    ("country/neighbor/@name", "country/@name"),
+    ("country[rank/text() eq '7']", "country[year/text() eq '2007']"),
+)
+
+
+def main():
+    # Combined paths are evaluated by the closures, which the paths on their own are compared with too
+    pyopath.compiled.set_default_evaluator("closures")
+    data = document(5000)
+    clear_document_order()
+    first = timed(lambda: (clear_document_order(), pyopath.query(data, "country[1]|country[2]")))
+    print(f"numbering the document {first * 1000:.2f} ms")
+    print("    paths      union  intersect     except")
+    for lhs, rhs in EXPRESSIONS:
+        paths = timed(lambda: (pyopath.query(data, lhs), pyopath.query(data, rhs)))
+        union = timed(lambda: pyopath.query(data, f"{lhs}|{rhs}"))
+        intersect = timed(lambda: pyopath.query(data, f"{lhs} intersect {rhs}"))
+        excepted = timed(lambda: pyopath.query(data, f"{lhs} except {rhs}"))
+        print(
+            f"{paths * 1000:6.2f} ms  {union * 1000:6.2f} ms  {intersect * 1000:6.2f} ms  {excepted * 1000:6.2f} ms"
+            f"  {lhs} | {rhs}"
+        )
+
+    nodes = pyopath.compile("country/neighbor|country/rank").evaluate(document(500), unwrap_nodes=False)
+    random.Random(1).shuffle(nodes)
+    numbered = timed(lambda: sorted(nodes, key=order_key))
+    positions = timed(lambda: sorted(nodes, key=ancestry_key))
+    print(
+        f"sorting {len(nodes)} nodes by order_key {numbered * 1000:.2f} ms, by ancestry_key {positions * 1000:.2f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""
+Worker warm-up time for a catalogue of expressions, parsing versus loading from the disk cache.
+
+    python -m benchmarks.bench_warmup
+"""
+
+import tempfile
+import time
+
+import pyopath
+from pyopath.xpath.AST.parser import parse
+
+
+def catalogue(size: int):
+    names = ("country", "rank", "year", "neighbor", "gdppc")
+    for n in range(size):
+        name = names[n % len(names)]
+        yield f"{name}[@name eq 'x{n}']/{names[(n + 1) % len(names)]}[{n % 7 + 1}]/text() eq '{n}'"
+
+
+def main():
+    expressions = list(catalogue(300))
+    with tempfile.TemporaryDirectory() as directory:
+        start = time.perf_counter()
+        for expression in expressions:
+            parse(expression)
+        parsed = time.perf_counter() - start
+
+        pyopath.preload(expressions, cache=pyopath.AstDiskCache(directory))
+        pyopath.clear_cache()
+
+        start = time.perf_counter()
+        found = pyopath.preload(cache=pyopath.AstDiskCache(directory))
+        loaded = time.perf_counter() - start
+
+    print(
+        f"{len(expressions)} expressions: parsing {parsed * 1000:.2f} ms, "
+        f"disk cache {loaded * 1000:.2f} ms ({found} hits)"
+    )
+
+
+if __name__ == "__main__":
+    main()
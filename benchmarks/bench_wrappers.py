@@ -0,0 +1,67 @@
+"""
+Wrappers allocated and time taken by queries over the same document, with the wrappers kept per document and with
+ none kept, as before; the first query of a document wraps the nodes it walks past, the ones after find them.
+
+    python -m benchmarks.bench_wrappers
+"""
+
+from collections import Counter
+
+import pyopath
+from benchmarks.bench_evaluate import document
+from benchmarks.timing import timed
+from pyopath.nodewrappers import etree
+
+EXPRESSIONS = (
+    "country/rank/text()",
+    "country[neighbor/@direction eq 'N']/@name",
+    "country[rank/text() eq '7']/year/text()",
+    "descendant::neighbor/@name",
+)
+
+WRAPPER_TYPES = (etree.EtreeElement, etree.EtreeText, etree.EtreeAttribute)
+
+
+def count_wrappers(function) -> int:
+    """
+    The wrappers made while calling the function.
+    """
+    made: Counter = Counter()
+    originals = {typ: typ.__init__ for typ in WRAPPER_TYPES}
+
+    def counting(typ):
+        def init(self, *args):
+            made[typ] += 1
+            originals[typ](self, *args)
+
+        return init
+
+    for typ in WRAPPER_TYPES:
+        typ.__init__ = counting(typ)
+    try:
+        function()
+    finally:
+        for typ, init in originals.items():
+            typ.__init__ = init
+    return sum(made.values())
+
+
+def main():
+    data = document(5000)
+    print("  wrappers made            time")
+    print("   none kept   kept     none kept      kept")
+    for expression in EXPRESSIONS:
+        compiled = pyopath.compile(expression)
+        etree.set_wrapper_cache_size(0)
+        none_kept = count_wrappers(lambda: compiled.evaluate(data))
+        none_kept_time = timed(lambda: compiled.evaluate(data), repeat=10)
+        etree.set_wrapper_cache_size(etree.WRAPPER_CACHE_SIZE)
+        compiled.evaluate(data)
+        kept = count_wrappers(lambda: compiled.evaluate(data))
+        kept_time = timed(lambda: compiled.evaluate(data), repeat=10)
+        print(f"{none_kept:10} {kept:6} {none_kept_time * 1000:10.2f} ms {kept_time * 1000:6.2f} ms  {expression}")
+        etree.clear_wrappers()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,12 @@
+"""
+Timing shared by the benchmarks.
+"""
+
+import timeit
+
+
+def timed(function, number: int = 3, repeat: int = 5) -> float:
+    """
+    The seconds a call of the function takes, the best of repeat runs of number calls.
+    """
+    return min(timeit.repeat(function, number=number, repeat=repeat)) / number
@@ -1,3 +1,31 @@
-from .doer import query
+from .compiled import (
+    CompiledQuery,
+    cache_info,
+    clear_cache,
+    compile,
+    iterquery,
+    preload,
+    query,
+    set_cache_size,
+    set_disk_cache,
+)
+from .diskcache import AstDiskCache
+from .keys import Index
+from .nameindex import clear_index, index_info, set_index_size
 
-__all__ = ("query",)
+__all__ = (
+    "query",
+    "iterquery",
+    "compile",
+    "CompiledQuery",
+    "cache_info",
+    "clear_cache",
+    "set_cache_size",
+    "AstDiskCache",
+    "set_disk_cache",
+    "preload",
+    "set_index_size",
+    "index_info",
+    "clear_index",
+    "Index",
+)
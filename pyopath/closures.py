@@ -0,0 +1,593 @@
+"""
+Compiles an AST into a tree of closures, once, ahead of evaluation.
+
+The interpreter in doer dispatches on the type of every AST node, node test and operator for every item.
+Here those decisions are made when compiling, so evaluating only does the work that depends on the data.
+Each evaluator takes a dynamic context and returns the resulting sequence as an iterable, which for paths
+ is a generator producing the items as they are found. Sizes of sequences are not counted up front,
+ they are LazySizes that count when last() asks for them, and only where last() is used at all.
+AST nodes without a specialized form are evaluated by the interpreter, so both always agree.
+"""
+
+from collections import deque
+from functools import partial
+from itertools import chain, islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union, cast
+
+from pyopath.comparisons import GENERAL_OPERATORS, Operand, compare_general, general_operand
+from pyopath.doer import (
+    ATOMIC_TYPES,
+    FOCUS_FUNCTIONS,
+    OPERATORS,
+    DynamicContext,
+    LazySize,
+    assert_is_node,
+    combine_nodes,
+    evaluate_ast_node,
+    function_arguments,
+    hoisted_operand,
+    is_context_independent,
+    is_last,
+    is_positional,
+    sorted_path,
+    uses_last,
+)
+from pyopath.nameindex import Equality, equality_value, indexed_equality, indexed_nodes, named_descendants
+from pyopath.nodewrappers.base import NodeBase, descendants, is_text, reversed_children, root
+from pyopath.properties import needs_sorting
+from pyopath.xpath.AST.ast import (
+    AnyKindTest,
+    ASTNode,
+    AxisStep,
+    Context,
+    GeneralCompare,
+    IntersectExpr,
+    Literal,
+    NameTest,
+    NodeTest,
+    PathOperator,
+    Predicate,
+    Root,
+    StaticFunctionCall,
+    TextTest,
+    UnionExpr,
+    ValueCompare,
+    VarRef,
+)
+
+Evaluator = Callable[[DynamicContext], Iterable[DynamicContext]]
+NodeFilter = Callable[[NodeBase], bool]
+
+# The node wrappers are protocols, which are slow to isinstance-check, so the answer is remembered per type.
+# Protocol classes also hash slowly, hence the id keys. The types are kept alive by the entries.
+_node_types: Dict[int, Tuple[type, bool]] = {}
+_atomic_types = frozenset(ATOMIC_TYPES)
+
+
+def is_node(item: Any) -> bool:
+    typ = type(item)
+    known = _node_types.get(id(typ), None)
+    if known is None:
+        known = _node_types[id(typ)] = (typ, isinstance(item, NodeBase))
+    return known[1]
+
+
+_compilers: Dict[type, Callable[[Any], Optional[Evaluator]]] = {}
+
+
+def compiles(node_type: type):
+    """
+    Registers a function that compiles AST nodes of node_type.
+    It may return None for nodes it can not specialize, which are then left to the interpreter.
+    """
+
+    def register(compiler: Callable[[Any], Optional[Evaluator]]) -> Callable[[Any], Optional[Evaluator]]:
+        _compilers[node_type] = compiler
+        return compiler
+
+    return register
+
+
+def compile_node(node: ASTNode) -> Evaluator:
+    compiler = _compilers.get(type(node), None)
+    evaluator = compiler(node) if compiler else None
+    if evaluator is None:
+        evaluator = interpret(node)
+    return evaluator
+
+
+def interpret(node: ASTNode) -> Evaluator:
+    def interpreted(data: DynamicContext) -> Iterable[DynamicContext]:
+        return evaluate_ast_node(node, data)
+
+    return interpreted
+
+
+def count(evaluator: Evaluator, data: DynamicContext) -> int:
+    return sum(1 for _ in evaluator(data))
+
+
+def rescope(items: Iterable[DynamicContext], size: Optional[LazySize] = None) -> Iterator[DynamicContext]:
+    position = 0
+    for item in items:
+        position += 1
+        yield DynamicContext(item, item.item, position, size, item.name)
+
+
+# Evaluators of these nodes produce sequences where each item has its position in the sequence
+SCOPED_NODES = (
+    AxisStep,
+    Literal,
+    Root,
+    ValueCompare,
+    GeneralCompare,
+    VarRef,
+    StaticFunctionCall,
+    UnionExpr,
+    IntersectExpr,
+)
+
+
+@compiles(Literal)
+def compile_literal(node: Literal) -> Evaluator:
+    value = node.value
+
+    def literal(data: DynamicContext) -> Iterable[DynamicContext]:
+        return (DynamicContext(data, value, 1, 1, None),)
+
+    return literal
+
+
+@compiles(Context)
+def compile_context(node: Context) -> Evaluator:
+    def context(data: DynamicContext) -> Iterable[DynamicContext]:
+        return (data,)
+
+    return context
+
+
+@compiles(Root)
+def compile_root(node: Root) -> Evaluator:
+    def root_node(data: DynamicContext) -> Iterable[DynamicContext]:
+        assert_is_node(data.item)
+        top = root(data.item)
+        return (DynamicContext(data, top, 1, 1, top.node_name()),)
+
+    return root_node
+
+
+@compiles(VarRef)
+def compile_variable_reference(node: VarRef) -> Evaluator:
+    name = node.name
+
+    def variable_reference(data: DynamicContext) -> Iterable[DynamicContext]:
+        value = data.static.varibles.get(name, None)
+        if value is None:
+            raise ValueError(f"Variable {name} does not exist")
+        if type(value) is tuple:
+            # A sequence of items
+            size = len(value)
+            return (DynamicContext(data, item, position, size, name) for position, item in enumerate(value, 1))
+        return (DynamicContext(data, value, 1, 1, name),)
+
+    return variable_reference
+
+
+@compiles(StaticFunctionCall)
+def compile_static_function_call(node: StaticFunctionCall) -> Optional[Evaluator]:
+    focus_function = FOCUS_FUNCTIONS.get(node.name, None)
+    if focus_function is None or function_arguments(node):
+        return None
+
+    def static_function_call(data: DynamicContext) -> Iterable[DynamicContext]:
+        return (DynamicContext(data, focus_function(data), 1, 1, None),)
+
+    return static_function_call
+
+
+@compiles(PathOperator)
+def compile_path_operator(node: PathOperator) -> Evaluator:
+    lhs = compile_node(node.a)
+    rhs = compile_node(node.b)
+    lhs_scoped = isinstance(node.a, SCOPED_NODES)
+    sized = uses_last(node.b)
+
+    # The result is not rescoped, since nothing observes the positions of the items a path produces.
+    # Paths on the left-hand side of other paths are rescoped there, and predicates only look at the values.
+    def path_operator(data: DynamicContext) -> Iterator[DynamicContext]:
+        items = lhs(data)
+        if sized:
+            items = rescope(items, LazySize(partial(count, lhs, data)))
+        elif not lhs_scoped:
+            items = rescope(items)
+        for item in items:
+            yield from rhs(item)
+
+    if needs_sorting(node):
+        # The results might not be in document order, see properties.py
+
+        def sorted_path_operator(data: DynamicContext) -> Iterable[DynamicContext]:
+            return sorted_path(path_operator(data))
+
+        return sorted_path_operator
+    return path_operator
+
+
+def compile_nodetest(test: NodeTest) -> Optional[NodeFilter]:
+    """
+    Returns a filter for the nodes passing the test, or None if all nodes pass.
+    """
+    if isinstance(test, NameTest):
+        name = test.name
+        return lambda node: node.node_name() == name
+    if isinstance(test, AnyKindTest):
+        return None
+    if isinstance(test, TextTest):
+        return is_text
+    assert False, f"Support for nodetest {type(test)} not implemented yet"
+
+
+AXES: Dict[str, Callable[[NodeBase], Iterable[NodeBase]]] = {
+    "child": lambda node: node.children(),
+    "attribute": lambda node: node.attributes(),
+    "descendant": descendants,
+    "descendant-or-self": lambda node: chain((node,), descendants(node)),
+}
+
+# Axes that wrappers may be able to produce backwards, see reversed_children
+REVERSED_AXES: Dict[str, Callable[[NodeBase], Optional[Iterable[NodeBase]]]] = {
+    "child": reversed_children,
+}
+
+
+@compiles(AxisStep)
+def compile_axis_step(node: AxisStep) -> Optional[Evaluator]:
+    """
+    An axis step is a chain of stages; the nodes of the axis passing the node test, then one stage per predicate.
+    Each stage numbers the items it lets through, and knows how to count them if the next predicate uses last().
+    Stages are generators, so a predicate that has found what it selects, like a[1], stops the stages before it.
+    """
+    axis = AXES.get(node.axis, None)
+    if axis is None:
+        return None
+    nodetest = compile_nodetest(node.nodetest)
+    known_name = node.nodetest.name if isinstance(node.nodetest, NameTest) else None
+    if known_name is not None and node.axis == "descendant":
+        # Already only the nodes passing the test, possibly from the index
+        axis = partial(named_descendants, name=known_name)
+        nodetest = None
+    predicates = node.predicates or ()
+    reversed_axis = REVERSED_AXES.get(node.axis, None)
+    if predicates and is_last(predicates[0]) and reversed_axis is not None:
+        predicates = predicates[1:]
+        return chain_predicates(compile_last_of_axis(axis, reversed_axis, nodetest, known_name), predicates)
+    sized = bool(predicates) and uses_last(predicates[0].predicate)
+
+    def select(data: DynamicContext) -> Iterator[DynamicContext]:
+        item = data.item
+        if not is_node(item):
+            assert_is_node(item)
+        nodes = axis(item) if nodetest is None else filter(nodetest, axis(item))
+        size = LazySize(partial(count, select, data)) if sized else None
+        position = 0
+        for node in nodes:
+            position += 1
+            yield DynamicContext(data, node, position, size, known_name if known_name is not None else node.node_name())
+
+    equality = indexed_equality(node)
+    if equality is not None:
+        return compile_indexed_step(node, equality, select, predicates)
+    return chain_predicates(select, predicates)
+
+
+def compile_indexed_step(
+    node: AxisStep, equality: Equality, select: Evaluator, predicates: Sequence[Predicate]
+) -> Evaluator:
+    """
+    A step whose first predicate an attribute-value index may answer, see nameindex.indexed_equality.
+    Without the index, or for values that are not strings, the first predicate is a stage like any other.
+    """
+    attribute, operand = equality
+    axis = node.axis
+    name = cast(NameTest, node.nodetest).name
+    sized = len(predicates) > 1 and uses_last(predicates[1].predicate)
+    first = compile_predicate(predicates[0], select, sized)
+
+    def indexed(data: DynamicContext) -> Iterable[DynamicContext]:
+        item = data.item
+        value = equality_value(operand, data.static.varibles)
+        nodes = indexed_nodes(item, axis, name, attribute, value) if value is not None and is_node(item) else None
+        if nodes is None:
+            return first(data)
+        size = len(nodes) if sized else None
+        return (DynamicContext(data, found, position, size, name) for position, found in enumerate(nodes, 1))
+
+    return chain_predicates(indexed, predicates[1:])
+
+
+def compile_last_of_axis(
+    axis: Callable[[NodeBase], Iterable[NodeBase]],
+    reversed_axis: Callable[[NodeBase], Optional[Iterable[NodeBase]]],
+    nodetest: Optional[NodeFilter],
+    known_name: Optional[str],
+) -> Evaluator:
+    """
+    The stage for axis::test[last()]; the first node passing the test when going backwards, if the wrapper can.
+    """
+
+    def select_last(data: DynamicContext) -> Iterator[DynamicContext]:
+        item = data.item
+        if not is_node(item):
+            assert_is_node(item)
+        nodes = reversed_axis(item)
+        if nodes is None:
+            nodes = deque(axis(item) if nodetest is None else filter(nodetest, axis(item)), 1)
+        elif nodetest is not None:
+            nodes = filter(nodetest, nodes)
+        for node in nodes:
+            yield DynamicContext(data, node, 1, 1, known_name if known_name is not None else node.node_name())
+            return
+
+    return select_last
+
+
+def chain_predicates(stage: Evaluator, predicates: Sequence[Predicate]) -> Evaluator:
+    sized = [uses_last(predicate.predicate) for predicate in predicates] + [False]
+    for predicate, stage_sized in zip(predicates, sized[1:]):
+        stage = compile_predicate(predicate, stage, stage_sized)
+    return stage
+
+
+def compile_predicate(node: Predicate, previous: Evaluator, sized: bool) -> Evaluator:
+    """
+    https://www.w3.org/TR/xpath-31/#id-filter-expression
+    Compiles to a stage filtering the items of the previous stage.
+    """
+    expression = node.predicate
+
+    if is_positional(node):
+        # a[2] is the second item, which is also where the previous stage can stop
+        return compile_positional_predicate(expression.value, previous)  # type: ignore
+    if is_last(node):
+        return compile_last_predicate(previous)
+
+    new_test = compile_predicate_test(expression)
+
+    def predicate_filter(data: DynamicContext) -> Iterator[DynamicContext]:
+        size = LazySize(partial(count, predicate_filter, data)) if sized else None
+        keep = new_test()
+        position = 0
+        for item in previous(data):
+            if keep(item):
+                position += 1
+                yield DynamicContext(item, item.item, position, size, item.name)
+
+    return predicate_filter
+
+
+def predicate_truth(results: Iterable[DynamicContext], position: int) -> bool:
+    """
+    Whether the value of a predicate keeps the item at the position; numbers select a position,
+     anything else is reduced to its effective boolean value.
+    """
+    results = iter(results)
+    first = next(results, None)
+    if first is None:
+        return False
+    value = first.item
+    if is_node(value):
+        return True
+    if next(results, None) is not None:
+        raise TypeError("Could not reduce to effective boolean value!")
+    if type(value) is bool:
+        return value
+    if isinstance(value, (int, float)):
+        return value == position
+    if isinstance(value, str):
+        return len(value) != 0
+    raise TypeError("Could not reduce to effective boolean value!")
+
+
+def compile_predicate_test(expression: ASTNode) -> Callable[[], Callable[[DynamicContext], bool]]:
+    """
+    Returns a function that makes the test for the items of one application of the predicate.
+    Parts of the predicate that do not depend on the focus are evaluated once per application, with the first item,
+     and kept by the test.
+    """
+    side = hoisted_operand(expression)
+    if side is not None:
+        assert isinstance(expression, (ValueCompare, GeneralCompare))
+        invariant = compile_node(getattr(expression, side))
+        other = compile_node(expression.rhs if side == "lhs" else expression.lhs)
+        if isinstance(expression, GeneralCompare):
+            if expression.op in GENERAL_OPERATORS:
+                return partial(new_hash_join, invariant, other, side == "lhs", expression.op)
+        else:
+            operator = OPERATORS.get(expression.op, None)
+            if operator is not None:
+                return partial(new_hoisted_compare, invariant, other, side == "lhs", operator)
+
+    evaluator = compile_node(expression)
+
+    if is_context_independent(expression):
+
+        def new_invariant_test() -> Callable[[DynamicContext], bool]:
+            hoisted: List[Tuple[DynamicContext, ...]] = []
+
+            def keep(item: DynamicContext) -> bool:
+                if not hoisted:
+                    hoisted.append(tuple(evaluator(item)))
+                return predicate_truth(hoisted[0], item.position)
+
+            return keep
+
+        return new_invariant_test
+
+    def keep(item: DynamicContext) -> bool:
+        return predicate_truth(evaluator(item), item.position)
+
+    return lambda: keep
+
+
+def new_hoisted_compare(
+    invariant: Evaluator, other: Evaluator, invariant_left: bool, operator: Callable[[Any, Any], Any]
+) -> Callable[[DynamicContext], bool]:
+    """
+    The test for a comparison of an operand that is the same for all items with one that is not, ie. @price gt $limit.
+    """
+    hoisted: List[List[Any]] = []
+
+    def keep(item: DynamicContext) -> bool:
+        if not hoisted:
+            hoisted.append(list(islice(atomize(invariant(item)), 2)))
+        values = list(islice(atomize(other(item)), 2))
+        left, right = (hoisted[0], values) if invariant_left else (values, hoisted[0])
+        return compare_operands(left, right, operator) is True
+
+    return keep
+
+
+def new_hash_join(
+    invariant: Evaluator, other: Evaluator, invariant_left: bool, op: str
+) -> Callable[[DynamicContext], bool]:
+    """
+    The test for a general comparison of an operand that is the same for all items with one that is not,
+     ie. @name = $other//neighbor/@name. The values of the first are atomized once, and for = hashed, so that testing
+     an item is a lookup per value of its own operand, see comparisons.ValueSet.
+    """
+    hoisted: List[Operand] = []
+
+    def keep(item: DynamicContext) -> bool:
+        if not hoisted:
+            hoisted.append(general_operand(atomize(invariant(item)), op))
+        values = list(atomize(other(item)))
+        left, right = (hoisted[0], values) if invariant_left else (values, hoisted[0])
+        return compare_general(left, right, op)
+
+    return keep
+
+
+def compile_positional_predicate(position: Any, previous: Evaluator) -> Evaluator:
+    # The previous stage numbers its items 1, 2, 3.., so the item is found by its index
+    if position < 1 or not float(position).is_integer():
+        return lambda data: ()
+    index = int(position) - 1
+
+    def positional_predicate(data: DynamicContext) -> Iterator[DynamicContext]:
+        for item in islice(previous(data), index, index + 1):
+            yield DynamicContext(item, item.item, 1, 1, item.name)
+
+    return positional_predicate
+
+
+def compile_last_predicate(previous: Evaluator) -> Evaluator:
+    # Only the last item is kept while going through the previous stage, rather than counting it first
+    def last_predicate(data: DynamicContext) -> Iterator[DynamicContext]:
+        for item in deque(previous(data), 1):
+            yield DynamicContext(item, item.item, 1, 1, item.name)
+
+    return last_predicate
+
+
+def atomize(items: Iterable[DynamicContext]) -> Iterator[Any]:
+    """
+    https://www.w3.org/TR/xpath-31/#id-atomization
+    """
+    for item in items:
+        value = item.item
+        if type(value) in _atomic_types:
+            yield value
+        elif is_node(value):
+            yield from value.typed_value()
+
+
+@compiles(ValueCompare)
+def compile_value_compare(node: ValueCompare) -> Optional[Evaluator]:
+    """
+    https://www.w3.org/TR/xpath-31/#id-value-comparisons
+    """
+    operator = OPERATORS.get(node.op, None)
+    if operator is None:
+        return None
+    lhs = compile_node(node.lhs)
+    rhs = compile_node(node.rhs)
+
+    def value_compare(data: DynamicContext) -> Iterable[DynamicContext]:
+        # Two values are enough to tell that an operand is not a single value
+        left_values = list(islice(atomize(lhs(data)), 2))
+        right_values = list(islice(atomize(rhs(data)), 2))
+        result = compare_operands(left_values, right_values, operator)
+        if result is None:
+            return ()
+        return (DynamicContext(data, result, 1, 1, None),)
+
+    return value_compare
+
+
+@compiles(GeneralCompare)
+def compile_general_compare(node: GeneralCompare) -> Optional[Evaluator]:
+    """
+    https://www.w3.org/TR/xpath-31/#id-general-comparisons
+    """
+    op = node.op
+    if op not in GENERAL_OPERATORS:
+        return None
+    lhs = compile_node(node.lhs)
+    rhs = compile_node(node.rhs)
+
+    def general_compare(data: DynamicContext) -> Iterable[DynamicContext]:
+        result = compare_general(list(atomize(lhs(data))), list(atomize(rhs(data))), op)
+        return (DynamicContext(data, result, 1, 1, None),)
+
+    return general_compare
+
+
+@compiles(UnionExpr)
+@compiles(IntersectExpr)
+def compile_set_operator(node: Union[UnionExpr, IntersectExpr]) -> Evaluator:
+    """
+    https://www.w3.org/TR/xpath-31/#combining_seq
+    """
+    op = node.op if isinstance(node, IntersectExpr) else "union"
+    lhs = compile_node(node.a)
+    rhs = compile_node(node.b)
+
+    def set_operator(data: DynamicContext) -> Iterable[DynamicContext]:
+        nodes = combine_nodes(op, lhs(data), rhs(data))
+        size = len(nodes)
+        return (DynamicContext(item, item.item, position, size, item.name) for position, item in enumerate(nodes, 1))
+
+    return set_operator
+
+
+def compare_operands(
+    left_values: List[Any], right_values: List[Any], operator: Callable[[Any, Any], Any]
+) -> Optional[bool]:
+    """
+    Steps 2 to 6 of https://www.w3.org/TR/xpath-31/#id-value-comparisons, for the first two atomized values of each
+     operand. None for the empty sequence.
+    """
+    if not left_values or not right_values:
+        return None
+    if len(left_values) != 1:
+        raise TypeError("The left-hand side of the comparison was not atomic")
+    if len(right_values) != 1:
+        raise TypeError("The right-hand side of the comparison was not atomic")
+    return compare_atomics(left_values[0], right_values[0], operator)
+
+
+def compare_atomics(left: Any, right: Any, operator: Callable[[Any, Any], Any]) -> bool:
+    """
+    Steps 5 and 6 of https://www.w3.org/TR/xpath-31/#id-value-comparisons
+    """
+    if type(left) is not type(right):
+        if isinstance(left, str) and isinstance(right, str):
+            left, right = str(left), str(right)
+        elif isinstance(left, float) and isinstance(right, float):
+            left, right = float(left), float(right)
+        else:
+            raise TypeError("Left and right side of comparison are not stringy/floaty")
+
+    result = operator(left, right)
+    assert isinstance(result, bool), f"The result {result} is of type {type(result)}, what happened??"
+    return result
@@ -0,0 +1,348 @@
+"""
+Generates python source for a query, a tier above the closures in closures.py.
+
+Paths become nested for-loops over the axes of the nodes, with the node tests, positional predicates, [last()] and
+ comparisons with literals written out inline, ie. `country[@name]/rank` becomes
+
+    def p1(n0):
+        for n1 in n0.attributes():
+            if n1.node_name() == 'name':
+                return True
+        return False
+
+    def query(context):
+        ...
+        for n1 in n0.children():
+            if n1.node_name() == 'country':
+                if p1(n1):
+                    for n2 in n1.children():
+                        if n2.node_name() == 'rank':
+                            yield n2
+
+The generated function is a generator; it takes the dynamic context and yields the resulting items.
+Queries using anything else are left to the closures, generate_source returns None for them.
+"""
+
+from itertools import chain
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from weakref import WeakKeyDictionary
+
+from pyopath.closures import compare_atomics, is_node
+from pyopath.doer import OPERATORS, DynamicContext, assert_is_node, is_last, is_positional
+from pyopath.nameindex import indexed_equality, indexed_nodes, named_descendants
+from pyopath.nodewrappers.base import descendants, is_text, reversed_children, root
+from pyopath.properties import needs_sorting
+from pyopath.xpath.AST.ast import (
+    AnyKindTest,
+    ASTNode,
+    AxisStep,
+    Context,
+    Literal,
+    NameTest,
+    NodeTest,
+    PathOperator,
+    Root,
+    TextTest,
+    ValueCompare,
+)
+
+GeneratedQuery = Callable[[DynamicContext], Iterator[Any]]
+
+# The iterable of each axis, formatted with the variable of the node
+AXES = {
+    "child": "{0}.children()",
+    "attribute": "{0}.attributes()",
+    "descendant": "descendants({0})",
+    "descendant-or-self": "chain(({0},), descendants({0}))",
+}
+REVERSED_AXES = {"child": "reversed_children"}
+
+INLINE_OPERATORS = {
+    "=": "==",
+    "eq": "==",
+    "!=": "!=",
+    "ne": "!=",
+    ">": ">",
+    "gt": ">",
+    ">=": ">=",
+    "ge": ">=",
+    "<": "<",
+    "lt": "<",
+    "<=": "<=",
+    "le": "<=",
+}
+
+# Names the generated source may refer to
+NAMESPACE: Dict[str, Any] = {
+    "is_node": is_node,
+    "is_text": is_text,
+    "assert_is_node": assert_is_node,
+    "reversed_children": reversed_children,
+    "descendants": descendants,
+    "named_descendants": named_descendants,
+    "indexed_nodes": indexed_nodes,
+    "root": root,
+    "chain": chain,
+    "compare_atomics": compare_atomics,
+    "OPERATORS": OPERATORS,
+}
+
+
+class Unsupported(Exception):
+    """
+    Raised while generating, for AST nodes without a generated form.
+    """
+
+
+class SourceWriter:
+    lines: List[str]
+    indent: int
+
+    def __init__(self, indent: int = 0):
+        self.lines = []
+        self.indent = indent
+
+    def line(self, text: str) -> None:
+        self.lines.append("    " * self.indent + text)
+
+
+def path_steps(node: ASTNode, ordered: bool = True) -> List[ASTNode]:
+    """
+    Flattens a path into its steps, a/b/c -> [a, b, c].
+    The loops produce the nodes of the steps as they come, so paths that have to be sorted are left to the closures,
+     unless only whether there are any nodes matters, see properties.py.
+    """
+    if isinstance(node, PathOperator):
+        if ordered and needs_sorting(node):
+            raise Unsupported(node)
+        return path_steps(node.a, ordered) + path_steps(node.b, ordered)
+    if not isinstance(node, (AxisStep, Context, Root)):
+        raise Unsupported(node)
+    return [node]
+
+
+class QueryGenerator:
+    """
+    Writes the source for one query; helper functions for predicates first, then the query function.
+    """
+
+    helpers: List[str]
+    counter: int
+
+    def __init__(self):
+        self.helpers = []
+        self.counter = 0
+
+    def name(self, prefix: str) -> str:
+        self.counter += 1
+        return f"{prefix}{self.counter}"
+
+    def generate(self, node: ASTNode) -> str:
+        writer = SourceWriter(1)
+        writer.line("n0 = context.item")
+        self.steps(writer, path_steps(node), "n0", lambda var: writer.line(f"yield {var}"), checked=False)
+        return "\n".join([f"# {node!r}", ""] + self.helpers + ["def query(context):"] + writer.lines) + "\n"
+
+    def nodetest(self, test: NodeTest, var: str) -> Optional[str]:
+        if isinstance(test, NameTest):
+            return f"{var}.node_name() == {test.name!r}"
+        if isinstance(test, TextTest):
+            return f"is_text({var})"
+        if isinstance(test, AnyKindTest):
+            return None
+        raise Unsupported(test)
+
+    def steps(
+        self, writer: SourceWriter, steps: List[ASTNode], var: str, body: Callable[[str], None], checked: bool = True
+    ) -> None:
+        """
+        Writes the loops for steps, starting from the node in var, and calls body with the variable of each result.
+        """
+        if not steps:
+            body(var)
+            return
+        step, rest = steps[0], steps[1:]
+        if isinstance(step, Context):
+            self.steps(writer, rest, var, body, checked)
+            return
+
+        if isinstance(step, AxisStep) and step.axis not in AXES:
+            raise Unsupported(step)
+        if not checked:
+            writer.line(f"if not is_node({var}):")
+            writer.line(f"    assert_is_node({var})")
+        if isinstance(step, Root):
+            new = self.name("n")
+            writer.line(f"{new} = root({var})")
+            self.steps(writer, rest, new, body)
+            return
+
+        assert isinstance(step, AxisStep)
+        axis = AXES[step.axis].format(var)
+        new = self.name("n")
+        test = self.nodetest(step.nodetest, new)
+        if step.axis == "descendant" and isinstance(step.nodetest, NameTest):
+            # Already only the nodes passing the test, possibly from the index
+            axis = f"named_descendants({var}, {step.nodetest.name!r})"
+            test = None
+        indent = writer.indent
+        predicates = list(step.predicates or ())
+
+        # A first predicate comparing an attribute with a string is answered by the attribute-value index if it can,
+        #  and tested on every node otherwise
+        equality = indexed_equality(step)
+        indexed = None
+        if equality is not None and isinstance(equality[1], Literal):
+            attribute, operand = equality
+            indexed = self.name("h")
+            arguments = f"{var}, {step.axis!r}, {step.nodetest.name!r}, {attribute!r}, {operand.value!r}"  # type: ignore
+            writer.line(f"{indexed} = indexed_nodes({arguments})")
+            axis = f"({indexed} if {indexed} is not None else {axis})"
+            test = f"{test} and " if test else ""
+            test = f"{indexed} is not None or ({test}{self.condition(predicates.pop(0).predicate)}({new}))"
+
+        # The predicates up to a [last()] are tested in the loop, which remembers the last node passing them.
+        # The rest are tested on that node, after the loop.
+        split = next((index for index, predicate in enumerate(predicates) if is_last(predicate)), None)
+        looped, after = (predicates, []) if split is None else (predicates[:split], predicates[split + 1 :])
+        last = self.name("l") if split is not None else None
+        # [last()] first is the first node going backwards, if the wrapper can go backwards
+        backwards = self.name("r") if split == 0 and step.axis in REVERSED_AXES and not indexed else None
+
+        # Positional predicates count the items that passed the node test and the predicates before them
+        counters = [self.name("c") if is_positional(predicate) else None for predicate in looped]
+        for counter in counters:
+            if counter:
+                writer.line(f"{counter} = 0")
+        if last:
+            writer.line(f"{last} = None")
+        if backwards:
+            writer.line(f"{backwards} = {REVERSED_AXES[step.axis]}({var})")
+            axis = f"({backwards} if {backwards} is not None else {axis})"
+        writer.line(f"for {new} in {axis}:")
+        writer.indent += 1
+        if test:
+            writer.line(f"if {test}:")
+            writer.indent += 1
+        # A positional predicate has found its node once it matches, the loop ends after the body for it
+        breaks = []
+        for predicate, counter in zip(looped, counters):
+            if counter:
+                writer.line(f"{counter} += 1")
+                writer.line(f"if {counter} == {predicate.predicate.value!r}:")  # type: ignore
+                breaks.append(writer.indent + 1)
+            else:
+                writer.line(f"if {self.condition(predicate.predicate)}({new}):")
+            writer.indent += 1
+
+        if last:
+            writer.line(f"{last} = {new}")
+            if backwards:
+                writer.line(f"if {backwards} is not None:")
+                writer.line("    break")
+        else:
+            self.steps(writer, rest, new, body)
+        for level in reversed(breaks):
+            writer.indent = level
+            writer.line("break")
+
+        if last:
+            writer.indent = indent
+            writer.line(f"if {last} is not None:")
+            writer.indent += 1
+            writer.line(f"{new} = {last}")
+            for predicate in after:
+                # The only node is at position 1, and is also the last
+                if is_positional(predicate):
+                    if predicate.predicate.value != 1:  # type: ignore
+                        raise Unsupported(predicate)
+                elif not is_last(predicate):
+                    writer.line(f"if {self.condition(predicate.predicate)}({new}):")
+                    writer.indent += 1
+            self.steps(writer, rest, new, body)
+        writer.indent = indent
+
+    def condition(self, expression: ASTNode) -> str:
+        """
+        Writes a helper function deciding if a node passes a predicate, and returns its name.
+        """
+        function = self.name("p")
+        writer = SourceWriter(1)
+        if isinstance(expression, ValueCompare):
+            self.value_compare(writer, expression)
+        else:
+            # A sequence of nodes is true if it is not empty
+            self.steps(writer, path_steps(expression, ordered=False), "n0", lambda var: writer.line("return True"))
+            writer.line("return False")
+        self.helpers += [f"def {function}(n0):"] + writer.lines + [""]
+        return function
+
+    def value_compare(self, writer: SourceWriter, node: ValueCompare) -> None:
+        """
+        https://www.w3.org/TR/xpath-31/#id-value-comparisons
+        """
+        if node.op not in OPERATORS:
+            raise Unsupported(node)
+
+        # Literals are written inline, paths are atomized into a list of values
+        operands: List[str] = []
+        paths: List[Tuple[str, str]] = []
+        for side, operand in (("left", node.lhs), ("right", node.rhs)):
+            if isinstance(operand, Literal):
+                operands.append(repr(operand.value))
+                continue
+            values = self.name("v")
+            writer.line(f"{values} = []")
+            self.steps(
+                writer, path_steps(operand), "n0", lambda var: writer.line(f"{values}.extend({var}.typed_value())")
+            )
+            operands.append(f"{values}[0]")
+            paths.append((side, values))
+
+        if paths:
+            writer.line(f"if not {' or not '.join(values for _, values in paths)}:")
+            writer.line("    return False")
+        for side, values in paths:
+            writer.line(f"if len({values}) != 1:")
+            writer.line(f'    raise TypeError("The {side}-hand side of the comparison was not atomic")')
+        left, right = operands
+
+        if len(paths) == 1 and node.op in INLINE_OPERATORS:
+            # The atomized value usually has the type of the literal, and then needs no conversion
+            literal, value = (node.lhs, right) if isinstance(node.lhs, Literal) else (node.rhs, left)
+            assert isinstance(literal, Literal)
+            writer.line(f"if type({value}) is {type(literal.value).__name__}:")
+            writer.line(f"    return {left} {INLINE_OPERATORS[node.op]} {right}")
+        writer.line(f"return compare_atomics({left}, {right}, OPERATORS[{node.op!r}])")
+
+
+def generate_source(node: ASTNode) -> Optional[str]:
+    """
+    Returns the python source for the query, or None if it uses anything that can not be generated.
+    """
+    try:
+        return QueryGenerator().generate(node)
+    except Unsupported:
+        return None
+
+
+_generated: "WeakKeyDictionary[ASTNode, Optional[GeneratedQuery]]" = WeakKeyDictionary()
+
+
+def compile_query(node: ASTNode) -> Optional[GeneratedQuery]:
+    """
+    Returns the generated function for the query, or None if it can not be generated.
+    Functions are cached for as long as the AST is alive.
+    """
+    try:
+        return _generated[node]
+    except KeyError:
+        pass
+    source = generate_source(node)
+    function: Optional[GeneratedQuery] = None
+    if source is not None:
+        namespace = dict(NAMESPACE)
+        exec(compile(source, f"<pyopath {node!r}>", "exec"), namespace)
+        function = namespace["query"]
+    _generated[node] = function
+    return function
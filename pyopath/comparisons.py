@@ -0,0 +1,208 @@
+"""
+General comparisons, https://www.w3.org/TR/xpath-31/#id-general-comparisons
+
+a = b is true if any value of a equals any value of b, so comparing sequences of n and m values takes n * m pairs.
+Most comparisons of two sequences are decided without going through the pairs:
+ = hashes one sequence into a ValueSet and looks up each value of the other,
+ != is only false if all the values are the same one,
+ < and the other orderings compare the least value of one sequence with the greatest of the other.
+When one of the sequences is the same for many comparisons, like $names in country[@name = $names], its values are
+ hashed once for all of them, see general_operand.
+
+Nodes atomize to strings, which stand in for xs:untypedAtomic; compared with a number, a string is cast to one,
+ and a string that is not a number is NaN, equal to nothing.
+"""
+
+from itertools import chain
+from math import isnan, nan
+from operator import eq, ge, gt, le, lt, ne
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+GENERAL_OPERATORS: Dict[str, Callable[[Any, Any], bool]] = {
+    "=": eq,
+    "==": eq,
+    "!=": ne,
+    "<": lt,
+    "<=": le,
+    ">": gt,
+    ">=": ge,
+}
+
+# Operators that a ValueSet can answer
+HASHED_OPERATORS = frozenset(("=", "=="))
+
+
+def is_number(value: Any) -> bool:
+    kind = type(value)
+    return kind is int or kind is float
+
+
+def to_number(value: str) -> float:
+    try:
+        return float(value)
+    except ValueError:
+        return nan
+
+
+def compare_pair(left: Any, right: Any, operator: Callable[[Any, Any], Any]) -> bool:
+    """
+    One pair of atomized values, https://www.w3.org/TR/xpath-31/#id-general-comparisons
+    """
+    if is_number(left):
+        if is_number(right):
+            return operator(left, right)
+        if type(right) is str:
+            return operator(left, to_number(right))
+    elif type(left) is str and is_number(right):
+        return operator(to_number(left), right)
+    if type(left) is not type(right):
+        raise TypeError(f"Can not compare {type(left).__name__} with {type(right).__name__} [err:XPTY0004]")
+    return operator(left, right)
+
+
+class ValueSet:
+    """
+    The atomized values of an operand, hashed by kind so that whether a value equals any of them is a lookup.
+    Values of kinds that can not be compared with the one looked up never equal it.
+    """
+
+    __slots__ = ("strings", "numbers", "others", "_cast_strings")
+
+    strings: Set[str]
+    numbers: Set[Union[int, float]]
+    others: Set[Any]
+    # The strings cast to numbers, made when first looked up with a number
+    _cast_strings: Optional[Set[float]]
+
+    def __init__(self, values: Iterable[Any]):
+        self.strings = set()
+        self.numbers = set()
+        self.others = set()
+        self._cast_strings = None
+        for value in values:
+            if type(value) is str:
+                self.strings.add(value)
+            elif is_number(value):
+                # NaN equals nothing, not even itself
+                if value == value:
+                    self.numbers.add(value)
+            else:
+                self.others.add(value)
+
+    def __contains__(self, value: Any) -> bool:
+        if type(value) is str:
+            return value in self.strings or (bool(self.numbers) and to_number(value) in self.numbers)
+        if is_number(value):
+            if value in self.numbers:
+                return True
+            if self._cast_strings is None:
+                self._cast_strings = {number for number in map(to_number, self.strings) if number == number}
+            return value in self._cast_strings
+        return value in self.others
+
+    def __len__(self) -> int:
+        return len(self.strings) + len(self.numbers) + len(self.others)
+
+
+# The atomized values of an operand
+Operand = Union[List[Any], ValueSet]
+
+
+def general_operand(values: Iterable[Any], op: str) -> Operand:
+    """
+    The values of an operand that is compared many times, hashed if the operator can look them up.
+    """
+    if op in HASHED_OPERATORS:
+        return ValueSet(values)
+    return list(values)
+
+
+def comparable(left: List[Any], right: List[Any]) -> Optional[Tuple[List[Any], List[Any]]]:
+    """
+    The values of both operands as one kind, strings or numbers, for the orderings; None if they are of other or mixed
+     kinds, and have to be compared pair by pair.
+    Strings compared with numbers are cast to numbers, and NaN, which no ordering is true for, is left out.
+    """
+    left_strings = all(type(value) is str for value in left)
+    right_strings = all(type(value) is str for value in right)
+    if left_strings and right_strings:
+        return left, right
+    left_numbers = left_strings or all(is_number(value) for value in left)
+    right_numbers = right_strings or all(is_number(value) for value in right)
+    if not (left_numbers and right_numbers):
+        return None
+    left = [
+        number for number in (to_number(value) if type(value) is str else value for value in left) if not isnan(number)
+    ]
+    right = [
+        number for number in (to_number(value) if type(value) is str else value for value in right) if not isnan(number)
+    ]
+    return left, right
+
+
+def any_equal(left: List[Any], right: List[Any]) -> Optional[bool]:
+    smaller, larger = (left, right) if len(left) <= len(right) else (right, left)
+    values = ValueSet(smaller)
+    return any(value in values for value in larger)
+
+
+def any_unequal(left: List[Any], right: List[Any]) -> Optional[bool]:
+    # Every pair is equal only if all the values are the same one as the first, when they are of one kind
+    first = left[0]
+    strings = type(first) is str
+    if not strings and not is_number(first):
+        return None
+    for value in chain(left, right):
+        if (type(value) is str) if strings else is_number(value):
+            # NaN is not equal to itself
+            if value != first:
+                return True
+        else:
+            return None
+    return False
+
+
+def any_ordered(op: str) -> Callable[[List[Any], List[Any]], Optional[bool]]:
+    operator = GENERAL_OPERATORS[op]
+    less = op in ("<", "<=")
+
+    def compare(left: List[Any], right: List[Any]) -> Optional[bool]:
+        operands = comparable(left, right)
+        if operands is None:
+            return None
+        left, right = operands
+        if not left or not right:
+            return False
+        # Some value of left is less than some value of right if the least of left is less than the greatest of right
+        if less:
+            return operator(min(left), max(right))
+        return operator(max(left), min(right))
+
+    return compare
+
+
+# Comparisons of two sequences decided without going through the pairs, None when they can not be
+FAST_COMPARISONS: Dict[str, Callable[[List[Any], List[Any]], Optional[bool]]] = {
+    "=": any_equal,
+    "==": any_equal,
+    "!=": any_unequal,
+    **{op: any_ordered(op) for op in ("<", "<=", ">", ">=")},
+}
+
+
+def compare_general(left: Operand, right: Operand, op: str) -> bool:
+    """
+    Whether any pair of values compares true, each operand a list of atomized values, or a ValueSet for =.
+    """
+    if isinstance(right, ValueSet):
+        return any(value in right for value in left)
+    if isinstance(left, ValueSet):
+        return any(value in left for value in right)
+    if not left or not right:
+        return False
+    if len(left) > 1 or len(right) > 1:
+        result = FAST_COMPARISONS[op](left, right)
+        if result is not None:
+            return result
+    operator = GENERAL_OPERATORS[op]
+    return any(compare_pair(lhs, rhs, operator) for lhs in left for rhs in right)
@@ -0,0 +1,271 @@
+"""
+Compiled queries; parse once, evaluate many times.
+"""
+
+from typing import Any, Dict, Iterable, Iterator, Optional, Sequence
+
+from pyopath.closures import Evaluator, compile_node, is_node
+from pyopath.codegen import compile_query, generate_source
+from pyopath.diskcache import AstDiskCache
+from pyopath.doer import DynamicContext, StaticContext, create_context
+from pyopath.explain import analyze as analyze_plan
+from pyopath.explain import explain_plan
+from pyopath.lru import CacheInfo, LRUCache
+from pyopath.nodewrappers.base import unwrap
+from pyopath.offload import compile_lxml_query, is_offloaded, translate
+from pyopath.optimizer import optimize
+from pyopath.xpath.AST import serialize
+from pyopath.xpath.AST.ast import ASTNode
+from pyopath.xpath.AST.parser import parse
+
+DEFAULT_CACHE_SIZE = 512
+
+EVALUATORS = ("closures", "codegen")
+_default_evaluator = "codegen"
+
+
+def set_default_evaluator(evaluator: str) -> None:
+    """
+    Selects how compiled queries are evaluated; "closures" or "codegen".
+    With "codegen", queries that python source can not be generated for are still evaluated with closures.
+    """
+    global _default_evaluator
+    assert evaluator in EVALUATORS, f"Unknown evaluator {evaluator}, expected one of {EVALUATORS}"
+    _default_evaluator = evaluator
+
+
+def get_default_evaluator() -> str:
+    return _default_evaluator
+
+
+class CompiledQuery:
+    """
+    A query expression that has been parsed into an AST and can be evaluated against any data.
+    Instances hold no per-evaluation state and can be shared freely.
+    When created from the serialized form of the AST, it is only loaded once needed.
+    The AST is optimized (see optimizer.py) and compiled on first evaluation, into python source if possible
+     (see codegen.py), otherwise into closures (see closures.py).
+    Against lxml elements, queries that can be are evaluated by lxml itself instead (see offload.py).
+    """
+
+    expression: str
+
+    def __init__(self, expression: str, ast: Optional[ASTNode] = None, serialized: Any = None):
+        assert ast is not None or serialized is not None, "Need either an AST or a serialized AST"
+        self.expression = expression
+        self._ast = ast
+        self._serialized = serialized
+        self._plan: Optional[ASTNode] = None
+        self._evaluator: Optional[Evaluator] = None
+
+    @property
+    def ast(self) -> ASTNode:
+        if self._ast is None:
+            self._ast = serialize.load(self._serialized)
+            self._serialized = None
+        return self._ast  # type: ignore
+
+    @property
+    def plan(self) -> ASTNode:
+        """
+        The AST that is evaluated, ie. the optimized AST.
+        """
+        if self._plan is None:
+            self._plan = optimize(self.ast)
+        return self._plan
+
+    @property
+    def evaluator(self) -> Evaluator:
+        if self._evaluator is None:
+            self._evaluator = compile_node(self.plan)
+        return self._evaluator
+
+    @property
+    def source(self) -> Optional[str]:
+        """
+        The python source generated for the query, or None if it is evaluated with closures.
+        """
+        return generate_source(self.plan)
+
+    @property
+    def xpath(self) -> Optional[str]:
+        """
+        The XPath 1.0 expression lxml evaluates the query with, or None if it is not offloaded to lxml.
+        """
+        return translate(self.plan)
+
+    def _items(self, context: DynamicContext) -> Iterator[Any]:
+        if _default_evaluator == "codegen":
+            generated = compile_query(self.plan)
+            if generated is not None:
+                return generated(context)
+        return (item.item for item in self.evaluator(context))
+
+    def evaluate(
+        self,
+        data: Any,
+        variables: Optional[Dict[str, Any]] = None,
+        unwrap_nodes: bool = True,
+        static_context: Optional[StaticContext] = None,
+    ) -> Sequence[Any]:
+        return list(self.iter(data, variables=variables, unwrap_nodes=unwrap_nodes, static_context=static_context))
+
+    def iter(
+        self,
+        data: Any,
+        variables: Optional[Dict[str, Any]] = None,
+        unwrap_nodes: bool = True,
+        static_context: Optional[StaticContext] = None,
+    ) -> Iterator[Any]:
+        """
+        Like evaluate, but yields the results as they are found.
+        Paths are evaluated lazily, so the first results arrive before the rest of the data has been looked at,
+         and abandoning the iterator stops the evaluation.
+        """
+        if unwrap_nodes and static_context is None and is_offloaded(data):
+            offloaded = compile_lxml_query(self.plan)
+            if offloaded is not None:
+                return iter(offloaded(data))
+
+        context = create_context(data, static_context, variables)
+
+        result = self._items(context)
+
+        if unwrap_nodes:
+            result = (unwrap(node) if is_node(node) else node for node in result)
+
+        return result
+
+    def explain(
+        self,
+        data: Any = None,
+        analyze: bool = False,
+        variables: Optional[Dict[str, Any]] = None,
+        static_context: Optional[StaticContext] = None,
+    ) -> None:
+        """
+        Prints the plan of the query, the tree of the optimized AST.
+        With analyze, the query is evaluated against data with the interpreter, and each node of the plan shows the
+         items it was evaluated for and produced, the nodes its axis produced and the time it took, see explain.py.
+        """
+        print(self.explain_text(data, analyze=analyze, variables=variables, static_context=static_context))
+
+    def explain_text(
+        self,
+        data: Any = None,
+        analyze: bool = False,
+        variables: Optional[Dict[str, Any]] = None,
+        static_context: Optional[StaticContext] = None,
+    ) -> str:
+        """
+        What explain prints.
+        """
+        if not analyze:
+            return explain_plan(self.plan)
+        assert data is not None, "Need data to analyze the query with"
+        _, profile = analyze_plan(self.plan, create_context(data, static_context, variables))
+        return explain_plan(self.plan, profile)
+
+    def __repr__(self) -> str:
+        return f"CompiledQuery({self.expression!r})"
+
+
+_compile_cache: LRUCache[str, CompiledQuery] = LRUCache(DEFAULT_CACHE_SIZE)
+_disk_cache: Optional[AstDiskCache] = None
+
+
+def compile(expression: str) -> CompiledQuery:
+    """
+    Returns the compiled form of the expression.
+    Recently used expressions are kept in a bounded LRU cache, see set_cache_size and cache_info.
+    Expressions not in the LRU cache are looked up in the disk cache, if one is set.
+    """
+    compiled = _compile_cache.get(expression)
+    if compiled is None:
+        ast = _disk_cache.get(expression) if _disk_cache is not None else None
+        if ast is None:
+            ast = parse(expression)
+            if _disk_cache is not None:
+                _disk_cache.put(expression, ast)
+        compiled = CompiledQuery(expression, ast)
+        _compile_cache.put(expression, compiled)
+    return compiled
+
+
+def set_disk_cache(cache: Optional[AstDiskCache]) -> None:
+    """
+    Sets the persistent cache consulted by compile(). Newly parsed expressions are
+     added to it, and written out by cache.save() or preload().
+    """
+    global _disk_cache
+    _disk_cache = cache
+
+
+def preload(expressions: Optional[Iterable[str]] = None, cache: Optional[AstDiskCache] = None) -> int:
+    """
+    Compiles a catalogue of expressions into the compile cache, typically at worker startup.
+    The disk cache, by default the one given to set_disk_cache, supplies the ASTs it has,
+     which are only deserialized once used; the rest are parsed and saved to it.
+    Without expressions, everything in the disk cache is compiled.
+    Returns the number of expressions found in the disk cache.
+    """
+    if cache is None:
+        cache = _disk_cache
+    if expressions is None:
+        assert cache is not None, "Need either expressions or a disk cache to preload"
+        expressions = list(cache.entries())
+
+    entries = cache.entries() if cache is not None else {}
+    found = 0
+    for expression in expressions:
+        serialized = entries.get(expression, None)
+        if serialized is None:
+            compiled = CompiledQuery(expression, parse(expression))
+            if cache is not None:
+                cache.put(expression, compiled.ast)
+        else:
+            compiled = CompiledQuery(expression, serialized=serialized)
+            found += 1
+        _compile_cache.put(expression, compiled)
+
+    if cache is not None:
+        cache.save()
+    return found
+
+
+def set_cache_size(size: int) -> None:
+    """
+    Sets the maximum number of compiled expressions to keep. 0 disables caching.
+    """
+    _compile_cache.resize(size)
+
+
+def cache_info() -> CacheInfo:
+    return _compile_cache.info()
+
+
+def clear_cache() -> None:
+    _compile_cache.clear()
+
+
+def query(
+    data: Any,
+    query: str,
+    unwrap_nodes: bool = True,
+    static_context: Optional[StaticContext] = None,
+    variables: Optional[Dict[str, Any]] = None,
+) -> Sequence[Any]:
+    return compile(query).evaluate(data, variables=variables, unwrap_nodes=unwrap_nodes, static_context=static_context)
+
+
+def iterquery(
+    data: Any,
+    query: str,
+    unwrap_nodes: bool = True,
+    static_context: Optional[StaticContext] = None,
+    variables: Optional[Dict[str, Any]] = None,
+) -> Iterator[Any]:
+    """
+    Like query, but yields the results as they are found, see CompiledQuery.iter.
+    """
+    return compile(query).iter(data, variables=variables, unwrap_nodes=unwrap_nodes, static_context=static_context)
@@ -0,0 +1,187 @@
+"""
+Persistent cache of parsed expressions, so that short-lived workers can skip parsing at startup.
+
+The cache is a single marshal file per library version, grammar and python version, holding
+ {expression: serialized AST}. Changing any of those changes the file name, which leaves the
+ old entries behind. Files of the same library and python version but another grammar are removed
+ the next time the cache is saved; files of other versions are left alone, since workers of those
+ versions may share the directory.
+Writes go to a temporary file that is renamed into place, so concurrent processes never see a
+ partial file. Each save merges with what is on disk first; when two processes save at once the
+ last one wins, which at worst loses some entries that will simply be parsed again.
+"""
+
+import hashlib
+import marshal
+import os
+import sys
+import tempfile
+from threading import Lock
+from typing import Any, Dict, Optional
+
+from pyopath.xpath.AST import ast, descent, lexer, parser, serialize
+from pyopath.xpath.AST.ast import ASTNode
+
+FORMAT_VERSION = 1
+FILE_PREFIX = "pyopath-ast-"
+DEFAULT_MAX_ENTRIES = 10000
+
+_grammar_fingerprint: Optional[str] = None
+
+
+def library_version() -> str:
+    try:
+        from importlib.metadata import PackageNotFoundError, version
+    except ImportError:  # Python 3.7
+        return "unknown"
+    try:
+        return version("PyOPath")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def grammar_fingerprint() -> str:
+    """
+    Hash of the sources that decide what AST an expression parses into.
+    """
+    global _grammar_fingerprint
+    if _grammar_fingerprint is None:
+        digest = hashlib.sha1()
+        for module in (ast, lexer, parser, descent, serialize):
+            with open(module.__file__, "rb") as f:  # type: ignore
+                digest.update(f.read())
+        _grammar_fingerprint = digest.hexdigest()[:16]
+    return _grammar_fingerprint
+
+
+class AstDiskCache:
+    """
+    Maps expressions to ASTs, backed by a file in `directory`.
+    Holds at most max_entries expressions; the oldest are dropped first when saving.
+    Entries can be put from several threads while another saves.
+    """
+
+    directory: str
+    max_entries: int
+    path: str
+
+    def __init__(self, directory: str, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.directory = directory
+        self.max_entries = max_entries
+        self._library = f"{FILE_PREFIX}{library_version()}-"
+        self._python = f"-py{sys.version_info[0]}{sys.version_info[1]}.marshal"
+        self.path = os.path.join(directory, f"{self._library}{grammar_fingerprint()}{self._python}")
+        self._entries: Optional[Dict[str, Any]] = None
+        self._dirty: Dict[str, Any] = {}
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self.entries())
+
+    def __contains__(self, expression: str) -> bool:
+        return expression in self.entries()
+
+    def entries(self) -> Dict[str, Any]:
+        if self._entries is None:
+            self._entries = self._read()
+        return self._entries
+
+    def load(self) -> None:
+        """
+        (Re)reads the cache file.
+        """
+        entries = self._read()
+        with self._lock:
+            entries.update(self._dirty)
+            self._entries = entries
+
+    def get(self, expression: str) -> Optional[ASTNode]:
+        data = self.entries().get(expression, None)
+        if data is None:
+            return None
+        return serialize.load(data)
+
+    def put(self, expression: str, node: ASTNode) -> None:
+        data = serialize.dump(node)
+        entries = self.entries()
+        with self._lock:
+            entries[expression] = data
+            self._dirty[expression] = data
+
+    def save(self) -> None:
+        """
+        Merges the entries added since the last save into the cache file.
+        """
+        with self._lock:
+            dirty = self._dirty
+            self._dirty = {}
+        if not dirty:
+            return
+        try:
+            self._write(dirty)
+        except BaseException:
+            with self._lock:
+                self._dirty = {**dirty, **self._dirty}
+            raise
+        self._remove_stale()
+
+    def _write(self, dirty: Dict[str, Any]) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        entries = self._read()
+        for expression, data in dirty.items():
+            entries.pop(expression, None)
+            entries[expression] = data
+        if len(entries) > self.max_entries:
+            excess = len(entries) - self.max_entries
+            for expression in list(entries)[:excess]:
+                del entries[expression]
+
+        handle, temp_path = tempfile.mkstemp(dir=self.directory, prefix=".tmp-" + FILE_PREFIX)
+        try:
+            with os.fdopen(handle, "wb") as f:
+                f.write(marshal.dumps((FORMAT_VERSION, entries)))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, self.path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+        with self._lock:
+            # Entries put while writing are saved next time
+            entries.update(self._dirty)
+            self._entries = entries
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries = {}
+            self._dirty = {}
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+
+    def _read(self) -> Dict[str, Any]:
+        try:
+            with open(self.path, "rb") as f:
+                # marshal.load reads file objects in small chunks, loads is much faster
+                format_version, entries = marshal.loads(f.read())
+        except (OSError, EOFError, ValueError, TypeError):
+            return {}
+        if format_version != FORMAT_VERSION or not isinstance(entries, dict):
+            return {}
+        return entries
+
+    def _remove_stale(self) -> None:
+        """
+        Removes the files of other grammars of this library and python version.
+        """
+        current = os.path.basename(self.path)
+        for name in os.listdir(self.directory):
+            if not (name.startswith(self._library) and name.endswith(self._python)) or name == current:
+                continue
+            fingerprint = name[len(self._library) : -len(self._python)]
+            # Otherwise a longer library version, like 1.0-dev for 1.0
+            if "-" not in fingerprint:
+                try:
+                    os.unlink(os.path.join(self.directory, name))
+                except OSError:
+                    pass
@@ -3,38 +3,67 @@ Interpreter? Executor? Executionist? Doer? Doer!
 """
 
 from inspect import signature
+from itertools import chain
 from math import isnan
-from typing import Any, Callable, Dict, Generator, List, Mapping, Optional, Sequence, Tuple, cast
+from operator import itemgetter
+from time import perf_counter
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    cast,
+)
+from weakref import WeakKeyDictionary
 
 from typing_extensions import Self
 
+from pyopath.comparisons import GENERAL_OPERATORS, Operand, compare_general, general_operand
+from pyopath.nameindex import equality_value, indexed_equality, indexed_nodes, named_descendants
 from pyopath.nodewrappers.base import (
     NodeBase,
-    TextBase,
     attributes,
     children,
+    descendants,
+    is_text,
+    node_identity,
     node_name,
+    order_key,
+    root,
     string_value,
     typed_value,
-    unwrap,
 )
 from pyopath.nodewrappers.registry import wrap
+from pyopath.properties import needs_sorting
 from pyopath.xpath.AST.ast import (
     AnyKindTest,
     ASTNode,
     AxisStep,
     Context,
+    Expressions,
+    GeneralCompare,
+    IntersectExpr,
     Literal,
     NameTest,
     NodeTest,
     PathOperator,
     Predicate,
+    Root,
     StaticFunctionCall,
     TextTest,
+    UnionExpr,
     ValueCompare,
     VarRef,
+    walk,
 )
-from pyopath.xpath.AST.parser import parse
 
 
 class StaticContext:
@@ -46,40 +75,135 @@ class StaticContext:
 
     varibles: Dict[str, Any]
     functions: Dict[str, Callable[..., Any]]
+    # The keys key() looks up in, by name, see keys.Index
+    indexes: Dict[str, Any]
+    # Figures per AST node, collected by the interpreter when set, see NodeProfile
+    profile: Optional[Dict[ASTNode, "NodeProfile"]]
 
-    def __init__(self, variables: Optional[Dict[str, Any]] = None):
+    def __init__(self, variables: Optional[Dict[str, Any]] = None, indexes: Optional[Dict[str, Any]] = None):
         self.varibles = (variables or dict()).copy()
         self.functions = dict()
+        self.indexes = (indexes or dict()).copy()
+        self.profile = None
 
     def copy_static_context(self, other: "StaticContext") -> Self:
         self.varibles = other.varibles.copy()
         self.functions = other.functions.copy()
+        self.indexes = other.indexes.copy()
+        return self
+
+    @property
+    def static(self) -> "StaticContext":
+        # So that a dynamic context can be made from either kind of context
         return self
 
 
-class DynamicContext(StaticContext):
+class NodeProfile:
+    """
+    What evaluating an AST node took, summed over the whole evaluation;
+     the number of items it was evaluated for, or tested for predicates, the number of items it produced,
+     the nodes its axis produced before the node test and predicates, and the time spent producing its items,
+     including the time of the nodes below it.
+    The nodes an axis produces are not the wrappers allocated for them; wrappers that keep theirs, like the etree
+     ones, allocate none for nodes walked past before.
+    """
+
+    __slots__ = ("items_in", "items_out", "axis_nodes", "time")
+
+    items_in: int
+    items_out: int
+    axis_nodes: int
+    time: float
+
+    def __init__(self):
+        self.items_in = 0
+        self.items_out = 0
+        self.axis_nodes = 0
+        self.time = 0.0
+
+
+def node_profile(profile: Dict[ASTNode, NodeProfile], node: ASTNode) -> NodeProfile:
+    stats = profile.get(node, None)
+    if stats is None:
+        stats = profile[node] = NodeProfile()
+    return stats
+
+
+class LazySize:
+    """
+    The size of a sequence that is produced lazily; it is counted the first time it is asked for,
+     which only last() does. Shared by all the items of the sequence.
+    """
+
+    __slots__ = ("count", "value")
+
+    count: Callable[[], int]
+    value: Optional[int]
+
+    def __init__(self, count: Callable[[], int]):
+        self.count = count
+        self.value = None
+
+    def __call__(self) -> int:
+        if self.value is None:
+            self.value = self.count()
+        return self.value
+
+
+class DynamicContext:
     """
     https://www.w3.org/TR/xpath-31/#eval_context
     [Definition: The dynamic context of an expression is defined as information
      that is needed for the dynamic evaluation of an expression.]
     If evaluation of an expression relies on some part of the dynamic
      context that is absent, a dynamic error is raised [err:XPDY0002].
+
+    One is made for every item an expression produces, so it is kept small; the focus
+     (item, position, size, name) and a reference to the static context.
+    The static context is shared by all the dynamic contexts of an evaluation, and is not modified during it.
     """
 
+    __slots__ = ("static", "item", "position", "size", "name")
+
+    static: StaticContext
     item: Any
     position: int
-    size: Optional[int]
+    size: Union[int, LazySize, None]
     name: Optional[str]
 
     def __init__(
-        self, static: StaticContext, item: Any, position: int, size: Optional[int] = None, name: Optional[str] = None
+        self,
+        context: Union[StaticContext, "DynamicContext"],
+        item: Any,
+        position: int,
+        size: Union[int, LazySize, None] = None,
+        name: Optional[str] = None,
     ):
-        self.copy_static_context(static)
+        self.static = context.static
         self.item = item
         self.position = position
         self.size = size
         self.name = name
 
+    @property
+    def varibles(self) -> Dict[str, Any]:
+        return self.static.varibles
+
+    @property
+    def functions(self) -> Dict[str, Callable[..., Any]]:
+        return self.static.functions
+
+    def context_size(self) -> int:
+        """
+        https://www.w3.org/TR/xpath-31/#dt-context-size
+        """
+        size = self.size
+        if size is None:
+            raise ValueError("The context size is not known [err:XPDY0002]")
+        if isinstance(size, LazySize):
+            return size()
+        return size
+
 
 ATOMIC_TYPES = [int, str, float, bytes]
 
@@ -252,13 +376,32 @@ def enumerate_attributes(data: DynamicContext, stream: bool = False) -> ItemGene
     return
 
 
+def enumerate_descendants(
+    data: DynamicContext, or_self: bool = False, stream: bool = False, name: Optional[str] = None
+) -> ItemGenerator:
+    """
+    Only the descendants with the name, if given, which may come from the index in nameindex.
+    """
+    # ensure it is an object
+    assert_is_node(data.item)
+    item = cast(NodeBase, data.item)
+    kids = descendants(item) if name is None else named_descendants(item, name)
+    cnt = 1
+    if or_self:
+        yield DynamicContext(data, data.item, cnt, None, name=node_name(data.item))
+        cnt += 1
+    for child in kids:
+        yield DynamicContext(data, child, cnt, None, name=node_name(child))
+        cnt += 1
+
+
 def nodetest(data: DynamicContext, test: NodeTest) -> bool:
     if isinstance(test, NameTest):
         return data.name == test.name
     elif isinstance(test, AnyKindTest):
         return True
     elif isinstance(test, TextTest):
-        return isinstance(data.item, TextBase)
+        return is_text(data.item)
     else:
         assert False, f"Support for nodetest {type(test)} not implemented yet"
 
@@ -283,15 +426,15 @@ def effective_boolean(items: ItemGenerator) -> bool:
     https://www.w3.org/TR/xpath-31/#id-ebv
     """
 
-    atomic: Optional[DynamicContext]
-    items, atomic = peek_atomic(items)
-
-    if not atomic:
+    first = next(items, None)
+    if first is None:
         return False
 
-    val0: Any = atomic.item
+    val0: Any = first.item
     if is_node(val0):
         return True
+    if next(items, None) is not None:
+        raise TypeError("Could not reduce to effective boolean value!")
     if isinstance(val0, bool):
         return val0
     if isinstance(val0, str):
@@ -306,17 +449,53 @@ def predicate_filter_impl(items: ItemGenerator, predicate: Predicate) -> ItemGen
     """
     https://www.w3.org/TR/xpath-31/#id-filter-expression
     """
+    if is_positional(predicate):
+        # The positions only increase, so nothing after the selected position is needed
+        position = cast(Literal, predicate.predicate).value
+        for item in items:
+            if item.position == position:
+                yield item
+            if item.position >= position:
+                return
+        return
+
+    # Parts of the predicate that are the same for every item are evaluated once, with the first item
+    expression = predicate.predicate
+    invariant = is_context_independent(expression)
+    side = None if invariant else hoisted_operand(expression)
+    hoisted: Any = None
+
     while True:
         item = next(items, None)
         if item is None:
             return
-        predicate_results = evaluate_ast_node(predicate.predicate, item)
-        predicate_results, atomic = peek_atomic(predicate_results)
-        if atomic and isinstance(atomic.item, (int, float)):
-            if atomic.item == item.position:
+        if invariant:
+            if hoisted is None:
+                hoisted = list(evaluate_ast_node(expression, item))
+            predicate_results: Iterator[DynamicContext] = iter(hoisted)
+        elif side is not None:
+            if hoisted is None:
+                hoisted = hoist_operand(expression, side, item)
+            predicate_results = hoisted_compare(expression, side, hoisted, item)
+        else:
+            predicate_results = evaluate_ast_node(expression, item, stream=True)
+        first = next(predicate_results, None)
+        if first is None:
+            continue
+        value = first.item
+        # Numeric predicates select by position, booleans are numbers to python but not to xpath
+        numeric = isinstance(value, (int, float)) and not isinstance(value, bool)
+        # A node makes the effective boolean value true, regardless of the rest of the sequence
+        if not numeric and is_node(value):
+            yield item
+            continue
+        if next(predicate_results, None) is not None:
+            raise TypeError("Could not reduce to effective boolean value!")
+        if numeric:
+            if value == item.position:
                 yield item
             continue
-        if effective_boolean(predicate_results):
+        if effective_boolean(atomic_sequence(first)):
             yield item
             continue
 
@@ -330,37 +509,208 @@ def predicate_filter(items: ItemGenerator, predicate: Predicate, stream: bool =
 def evaluate_axis(node: AxisStep, data: DynamicContext, stream: bool = False) -> ItemGenerator:
     assert_is_node(data.item)
 
-    if node.axis == "child":
-        items: ItemGenerator = enumerate_children(data, stream=stream)
+    predicates = node.predicates or ()
+    indexed = indexed_axis(node, data)
+    # The positions before the node test are not observed, so the axis is always streamed
+    if indexed is not None:
+        # The first predicate is answered by an attribute-value index
+        items: ItemGenerator = indexed
+        predicates = predicates[1:]
+    elif node.axis == "child":
+        items = enumerate_children(data, stream=True)
     elif node.axis == "attribute":
-        items = enumerate_attributes(data, stream=stream)
+        items = enumerate_attributes(data, stream=True)
+    elif node.axis in ("descendant", "descendant-or-self"):
+        descendant = node.axis == "descendant"
+        name = node.nodetest.name if descendant and isinstance(node.nodetest, NameTest) else None
+        items = enumerate_descendants(data, or_self=not descendant, stream=True, name=name)
     else:
         assert False, f"Axis not implemented for {node.axis}"
 
-    items = nodetest_filter(items, node.nodetest, stream=stream)
-    if node.predicates:
-        for predicate in node.predicates:
-            items = predicate_filter(items, predicate, stream=stream)
+    profile = data.static.profile
+    if profile is not None:
+        items = counted(items, node_profile(profile, node), "axis_nodes")
+
+    # The items of a stage are only collected up front when the next predicate needs their count for last(),
+    #  otherwise predicates that stop early, like a[1], stop the axis too.
+    streamed = [not uses_last(predicate.predicate) for predicate in predicates] + [stream]
+    items = nodetest_filter(items, node.nodetest, stream=streamed[0])
+    for predicate, predicate_streamed in zip(predicates, streamed[1:]):
+        if profile is not None:
+            stats = node_profile(profile, predicate)
+            items = counted(items, stats, "items_in")
+            items = counted(predicate_filter(items, predicate, stream=predicate_streamed), stats, "items_out")
+        else:
+            items = predicate_filter(items, predicate, stream=predicate_streamed)
     yield from items
 
 
+def indexed_axis(node: AxisStep, data: DynamicContext) -> Optional[ItemGenerator]:
+    """
+    The nodes of the step passing its first predicate, if an attribute-value index can tell, see nameindex.
+    """
+    equality = indexed_equality(node)
+    if equality is None:
+        return None
+    attribute, operand = equality
+    value = equality_value(operand, data.static.varibles)
+    if value is None:
+        return None
+    name = cast(NameTest, node.nodetest).name
+    nodes = indexed_nodes(cast(NodeBase, data.item), node.axis, name, attribute, value)
+    if nodes is None:
+        return None
+    return (DynamicContext(data, item, position, None, name) for position, item in enumerate(nodes, 1))
+
+
+def counted(items: ItemGenerator, stats: NodeProfile, field: str) -> ItemGenerator:
+    for item in items:
+        setattr(stats, field, getattr(stats, field) + 1)
+        yield item
+
+
 def path_operator(node: PathOperator, data: DynamicContext, stream: bool = False) -> ItemGenerator:
     def work() -> ItemGenerator:
         lhs = evaluate_ast_node(node.a, data, stream=stream)
         # The path operator is defined to explicitly collect everything left-hand-side
         #  before applying right-hand-side
-        # But then, how does that work with streaming? Who knows? Not me right now.
-        lhs = rescope_sequence(lhs, stream=False)
+        # That is only done if the right-hand side may need the size, with last()
+        lhs = rescope_sequence(lhs, stream=not uses_last(node.b))
         for item in lhs:
             yield from evaluate_ast_node(node.b, item, stream=stream)
 
-    yield from rescope_sequence(work(), stream=False)
+    # Nothing observes the size of the sequence a path produces, so unless it has to be sorted it is pipelined,
+    #  see properties.py
+    if needs_sorting(node):
+        results = sorted_path(work())
+        size = len(results)
+        for position, item in enumerate(results, 1):
+            yield DynamicContext(item, item.item, position, size, item.name)
+    else:
+        yield from rescope_sequence(work(), stream=True)
+
+
+def function_arguments(node: StaticFunctionCall) -> Tuple[ASTNode, ...]:
+    """
+    The argument expressions of a call, ie. f() -> (), f(a) -> (a,)
+    """
+    if len(node.arguments) != 4:
+        return ()
+    return tuple(argument[0] for argument in node.arguments[2])
+
+
+# https://www.w3.org/TR/xpath-functions-31/#context
+FOCUS_FUNCTIONS: Dict[str, Callable[[DynamicContext], Any]] = {
+    "position": lambda data: data.position,
+    "last": lambda data: data.context_size(),
+}
+
+
+def is_positional(predicate: Predicate) -> bool:
+    """
+    Numeric literal predicates, ie. a[2], select by position.
+    """
+    expression = predicate.predicate
+    return isinstance(expression, Literal) and type(expression.value) in (int, float)
+
+
+def is_last(predicate: Predicate) -> bool:
+    """
+    a[last()] selects the last item.
+    """
+    expression = predicate.predicate
+    return (
+        isinstance(expression, StaticFunctionCall) and expression.name == "last" and not function_arguments(expression)
+    )
+
+
+_uses_last: "WeakKeyDictionary[ASTNode, bool]" = WeakKeyDictionary()
+
+
+def uses_last(node: ASTNode) -> bool:
+    """
+    Whether evaluating the node may ask for the size of its context.
+    """
+    used = _uses_last.get(node, None)
+    if used is None:
+        used = _uses_last[node] = any(
+            isinstance(child, StaticFunctionCall) and child.name == "last" for child in walk(node)
+        )
+    return used
+
+
+_independent: "WeakKeyDictionary[ASTNode, bool]" = WeakKeyDictionary()
+
+
+def is_context_independent(node: ASTNode) -> bool:
+    """
+    Whether the value of the node is the same for any focus, ie. it does not use the context item, position or size.
+    Such parts of a predicate only need evaluating once for all the items it tests.
+    """
+    independent = _independent.get(node, None)
+    if independent is None:
+        if isinstance(node, (Literal, VarRef)):
+            independent = True
+        elif isinstance(node, PathOperator):
+            # The right-hand side is evaluated for the items of the left-hand side
+            independent = is_context_independent(node.a)
+        elif isinstance(node, (ValueCompare, GeneralCompare)):
+            independent = is_context_independent(node.lhs) and is_context_independent(node.rhs)
+        else:
+            # Axis steps and the context item use the focus, and functions may too
+            independent = False
+        _independent[node] = independent
+    return independent
+
+
+def hoisted_operand(node: ASTNode) -> Optional[str]:
+    """
+    The side of a comparison, "lhs" or "rhs", that is worth evaluating once for all the items a predicate tests.
+    None if neither is, or if the whole comparison is.
+    """
+    if isinstance(node, (ValueCompare, GeneralCompare)) and not is_context_independent(node):
+        for side in ("lhs", "rhs"):
+            operand = getattr(node, side)
+            if not isinstance(operand, Literal) and is_context_independent(operand):
+                return side
+    return None
+
+
+def hoist_operand(expression: ASTNode, side: str, data: DynamicContext) -> Any:
+    """
+    Evaluates the side of a comparison that is the same for all the items a predicate tests, see hoisted_operand.
+    For general comparisons its atomized values are kept, hashed for =, which makes the predicate a hash join.
+    """
+    items = evaluate_ast_node(getattr(expression, side), data)
+    if isinstance(expression, GeneralCompare):
+        return general_operand((item.item for item in atomize_sequence(items)), expression.op)
+    return list(items)
+
+
+def hoisted_compare(expression: ASTNode, side: str, hoisted: Any, data: DynamicContext) -> ItemGenerator:
+    lhs, rhs = (hoisted, None) if side == "lhs" else (None, hoisted)
+    if isinstance(expression, GeneralCompare):
+        return general_compare(expression, data, True, lhs, rhs)
+    return value_compare(cast(ValueCompare, expression), data, True, lhs, rhs)
 
 
 def static_function_call(node: StaticFunctionCall, data: DynamicContext, stream: bool = False) -> ItemGenerator:
     function_name = node.name
 
-    function = data.functions.get(function_name, None)
+    focus_function = FOCUS_FUNCTIONS.get(function_name, None)
+    if focus_function and not function_arguments(node):
+        yield DynamicContext(data, focus_function(data), 1, 1, None)
+        return
+
+    if function_name == "key":
+        yield from key(node, data)
+        return
+
+    if function_name == "string":
+        yield DynamicContext(data, string(node, data), 1, 1, None)
+        return
+
+    function = data.static.functions.get(function_name, None)
     if not function:
         # Should be detected during AST evaluation start
         raise ValueError(f"There is no function called {function_name}.")
@@ -383,6 +733,52 @@ def static_function_call(node: StaticFunctionCall, data: DynamicContext, stream:
         )
 
 
+def key(node: StaticFunctionCall, data: DynamicContext) -> ItemGenerator:
+    """
+    https://www.w3.org/TR/xslt-30/#func-key
+    key(name, values) -> the nodes that the index declared as name has for any of the values, in document order.
+    The index must be over the document of the context item, see keys.Index.
+    """
+    arguments = function_arguments(node)
+    if len(arguments) != 2:
+        raise TypeError(f"key() takes the name of an index and the values to look up, got {len(arguments)} arguments")
+    names = [item.item for item in atomize_sequence(evaluate_ast_node(arguments[0], data))]
+    if len(names) != 1 or type(names[0]) is not str:
+        raise TypeError(f"The name of an index must be a single string, got {names}")
+    index = data.static.indexes.get(names[0], None)
+    if index is None:
+        raise ValueError(f"There is no index called {names[0]} [err:XTDE1260]")
+    assert_is_node(data.item)
+    values = [item.item for item in atomize_sequence(evaluate_ast_node(arguments[1], data))]
+    nodes = index.lookup(root(data.item), values)
+    size = len(nodes)
+    for position, found in enumerate(nodes, 1):
+        yield DynamicContext(data, found, position, size, node_name(found))
+
+
+def string(node: StaticFunctionCall, data: DynamicContext) -> str:
+    """
+    https://www.w3.org/TR/xpath-functions-31/#func-string
+    string() -> the string value of the context item, string(item) -> that of the item, "" for the empty sequence.
+    """
+    arguments = function_arguments(node)
+    if len(arguments) > 1:
+        raise TypeError(f"string() takes at most one argument, got {len(arguments)}")
+    items = [data] if not arguments else list(evaluate_ast_node(arguments[0], data))
+    if not items:
+        return ""
+    if len(items) > 1:
+        raise TypeError(f"string() takes a single item, got {len(items)} [err:XPTY0004]")
+    item = items[0].item
+    if is_node(item):
+        return string_value(item)
+    if isinstance(item, bool):
+        return "true" if item else "false"
+    if isinstance(item, float) and item.is_integer():
+        return str(int(item))
+    return str(item)
+
+
 def dynamic_function_call():
     """
     If FC is a dynamic function call: FC's base expression is evaluated with respect to SC and DC.
@@ -392,12 +788,19 @@ def dynamic_function_call():
     ...
 
 
-def value_compare(node: ValueCompare, data: DynamicContext, stream: bool = False) -> ItemGenerator:
+def value_compare(
+    node: ValueCompare,
+    data: DynamicContext,
+    stream: bool = False,
+    lhs_items: Optional[List[DynamicContext]] = None,
+    rhs_items: Optional[List[DynamicContext]] = None,
+) -> ItemGenerator:
     """
     https://www.w3.org/TR/xpath-31/#id-value-comparisons
+    An operand that has already been evaluated can be given, see hoisted_operand.
     """
-    lhs = evaluate_ast_node(node.lhs, data, stream=stream)
-    rhs = evaluate_ast_node(node.rhs, data, stream=stream)
+    lhs = evaluate_ast_node(node.lhs, data, stream=stream) if lhs_items is None else (item for item in lhs_items)
+    rhs = evaluate_ast_node(node.rhs, data, stream=stream) if rhs_items is None else (item for item in rhs_items)
 
     # Step 1: Atomize operands
     lhs = atomize_sequence(lhs)
@@ -442,6 +845,110 @@ def value_compare(node: ValueCompare, data: DynamicContext, stream: bool = False
     yield DynamicContext(data, result, 1, 1, None)
 
 
+def general_compare(
+    node: GeneralCompare,
+    data: DynamicContext,
+    stream: bool = False,
+    lhs_values: Optional[Operand] = None,
+    rhs_values: Optional[Operand] = None,
+) -> ItemGenerator:
+    """
+    https://www.w3.org/TR/xpath-31/#id-general-comparisons
+    An operand that has already been evaluated can be given as its atomized values, see hoist_operand.
+    """
+    if node.op not in GENERAL_OPERATORS:
+        raise ValueError(f"Unknown comparison operator {node.op}")
+    if lhs_values is None:
+        lhs_values = [item.item for item in atomize_sequence(evaluate_ast_node(node.lhs, data, stream=stream))]
+    if rhs_values is None:
+        rhs_values = [item.item for item in atomize_sequence(evaluate_ast_node(node.rhs, data, stream=stream))]
+    yield DynamicContext(data, compare_general(lhs_values, rhs_values, node.op), 1, 1, None)
+
+
+# Items with the order keys of their nodes
+KeyedItems = List[Tuple[Tuple[Any, ...], DynamicContext]]
+
+
+def keyed_nodes(items: Iterable[DynamicContext]) -> KeyedItems:
+    keyed: KeyedItems = []
+    for item in items:
+        if is_atomic(item.item):
+            raise TypeError(f"Only nodes have a document order, got {item.item!r} [err:XPTY0004]")
+        keyed.append((order_key(item.item), item))
+    return keyed
+
+
+def in_document_order(keyed: KeyedItems) -> List[DynamicContext]:
+    """
+    The items in document order, each node once.
+    The sort merges runs that are already in order, so a sequence in document order, or two of them one after the
+     other like the operands of a union, is sorted in linear time.
+    Nodes are told apart by their identity, as the same node can have different order keys when reached from the top
+     of different trees, see node_identity; nodes of trees that are not known to be one are in some order.
+    """
+    keyed.sort(key=itemgetter(0))
+    ordered: List[DynamicContext] = []
+    last = None
+    if len({order[0] for order, _ in keyed}) > 1:
+        seen = set()
+        for order, item in keyed:
+            if order != last:
+                last = order
+                identity = node_identity(item.item, order)
+                if identity not in seen:
+                    seen.add(identity)
+                    ordered.append(item)
+        return ordered
+    # All of one tree, where the same node has the same key
+    for order, item in keyed:
+        if order != last:
+            ordered.append(item)
+            last = order
+    return ordered
+
+
+def sorted_path(items: Iterable[DynamicContext]) -> List[DynamicContext]:
+    """
+    The results of a path in document order, each node once; unless they are atomic values, which keep their order.
+    https://www.w3.org/TR/xpath-31/#id-path-operator
+    """
+    results = list(items)
+    atomic = sum(1 for item in results if is_atomic(item.item))
+    if atomic == len(results):
+        return results
+    if atomic:
+        raise TypeError("The results of a path are either nodes or atomic values, not both [err:XPTY0018]")
+    return in_document_order(keyed_nodes(results))
+
+
+def combine_nodes(op: str, lhs: Iterable[DynamicContext], rhs: Iterable[DynamicContext]) -> List[DynamicContext]:
+    """
+    https://www.w3.org/TR/xpath-31/#combining_seq
+    The nodes of lhs and rhs for union, those of lhs that are also in rhs for intersect, and not for except.
+    """
+    keyed = keyed_nodes(lhs)
+    if op == "union":
+        keyed += keyed_nodes(rhs)
+    else:
+        others = keyed_nodes(rhs)
+        keep = op == "intersect"
+        if len({order[0] for order, _ in keyed + others}) > 1:
+            identities = {node_identity(item.item, order) for order, item in others}
+            keyed = [(order, item) for order, item in keyed if (node_identity(item.item, order) in identities) is keep]
+        else:
+            orders = {order for order, _ in others}
+            keyed = [(order, item) for order, item in keyed if (order in orders) is keep]
+    return in_document_order(keyed)
+
+
+def set_operator(node: Union[UnionExpr, IntersectExpr], data: DynamicContext, stream: bool = False) -> ItemGenerator:
+    op = node.op if isinstance(node, IntersectExpr) else "union"
+    nodes = combine_nodes(op, evaluate_ast_node(node.a, data), evaluate_ast_node(node.b, data))
+    size = len(nodes)
+    for position, item in enumerate(nodes, 1):
+        yield DynamicContext(item, item.item, position, size, item.name)
+
+
 import operator
 
 OPERATORS: Dict[str, Callable[[Any, Any], Any]] = {
@@ -480,11 +987,17 @@ def value_operator(a: Any, b: Any, op: str) -> Any:
 
 def variable_reference(node: VarRef, data: DynamicContext, stream: bool = False) -> ItemGenerator:
     name = node.name
-    value = data.varibles.get(name, None)
+    value = data.static.varibles.get(name, None)
     if value is None:
         # Should be detected during AST evaluation start
         raise ValueError(f"Variable {name} does not exist")
 
+    if type(value) is tuple:
+        # A sequence of items
+        size = len(value)
+        for position, item in enumerate(value, 1):
+            yield DynamicContext(data, item, position, size, name)
+        return
     yield DynamicContext(data, value, 1, 1, name)
 
 
@@ -492,6 +1005,27 @@ def evaluate_ast_node(node: ASTNode, data: DynamicContext, stream: bool = False)
     assert isinstance(node, ASTNode), f"{node} is not an ASTNode"
     assert isinstance(data, DynamicContext), f"{data} is not a DynamicContext"
 
+    profile = data.static.profile
+    if profile is not None:
+        yield from profiled_ast_node(node, data, node_profile(profile, node), stream=stream)
+    else:
+        yield from dispatch_ast_node(node, data, stream=stream)
+
+
+def profiled_ast_node(node: ASTNode, data: DynamicContext, stats: NodeProfile, stream: bool = False) -> ItemGenerator:
+    stats.items_in += 1
+    items = dispatch_ast_node(node, data, stream=stream)
+    while True:
+        start = perf_counter()
+        item = next(items, None)
+        stats.time += perf_counter() - start
+        if item is None:
+            return
+        stats.items_out += 1
+        yield item
+
+
+def dispatch_ast_node(node: ASTNode, data: DynamicContext, stream: bool = False) -> ItemGenerator:
     if isinstance(node, AxisStep):
         yield from evaluate_axis(node, data, stream=stream)
     elif isinstance(node, Literal):
@@ -499,6 +1033,10 @@ def evaluate_ast_node(node: ASTNode, data: DynamicContext, stream: bool = False)
     elif isinstance(node, Context):
         yield data
         return
+    elif isinstance(node, Root):
+        assert_is_node(data.item)
+        top = root(data.item)
+        yield DynamicContext(data, top, 1, 1, node_name(top))
 
     elif isinstance(node, PathOperator):
         yield from path_operator(node, data, stream=stream)
@@ -506,12 +1044,22 @@ def evaluate_ast_node(node: ASTNode, data: DynamicContext, stream: bool = False)
     elif isinstance(node, StaticFunctionCall):
         yield from static_function_call(node, data, stream=stream)
 
+    elif isinstance(node, Expressions):
+        items = (item for expression in node.expressions for item in evaluate_ast_node(expression, data, stream=stream))
+        yield from rescope_sequence(items, stream=stream)
+
     elif isinstance(node, ValueCompare):
         yield from value_compare(node, data, stream=stream)
 
+    elif isinstance(node, GeneralCompare):
+        yield from general_compare(node, data, stream=stream)
+
     elif isinstance(node, VarRef):
         yield from variable_reference(node, data, stream=stream)
 
+    elif isinstance(node, (UnionExpr, IntersectExpr)):
+        yield from set_operator(node, data, stream=stream)
+
     else:
         assert False, f"evalute not implemented for nodetype {type(node)}"
 
@@ -520,16 +1068,15 @@ def evaluate(node: ASTNode, data: DynamicContext) -> Sequence[Any]:
     return list(data.item for data in evaluate_ast_node(node, data))
 
 
-def query(
+def create_context(
     data: Any,
-    query: str,
-    unwrap_nodes: bool = True,
     static_context: Optional[StaticContext] = None,
     variables: Optional[Dict[str, Any]] = None,
-) -> Sequence[Any]:
-    ast: ASTNode = parse(query)
-
-    wrapped = wrap(data)
+) -> DynamicContext:
+    """
+    Wraps the data, unless already wrapped, and the variables, and produces the initial dynamic context for a query.
+    """
+    wrapped = wrap(data) or (data if is_node(data) else None)
     assert wrapped, f"Could not wrap type {type(data)}"
 
     variables = variables or dict()
@@ -538,7 +1085,9 @@ def query(
         if isinstance(var, Sequence) and not isinstance(var, (str, bytes)):
             if len(var) == 1:
                 return wrap_var(var[0])
-            assert False, "Need to implement proper array/sequence handling"
+            # Other sequences are kept as tuples of their items, sequences in them flattened
+            items = (wrap_var(item) for item in var)
+            return tuple(chain.from_iterable(item if type(item) is tuple else (item,) for item in items))
         return wrap(var) or var
 
     variables = {key: wrap_var(value) for key, value in variables.items()}
@@ -546,12 +1095,9 @@ def query(
     if not static_context:
         static_context = StaticContext(variables=variables)
         static_context.functions["string"] = string_value
+    elif variables:
+        # The variables of this evaluation, on top of those of the shared static context
+        static_context = StaticContext().copy_static_context(static_context)
+        static_context.varibles.update(variables)
 
-    context: DynamicContext = DynamicContext(static_context, wrapped, 1, 1)
-
-    result = evaluate(ast, context)
-
-    if unwrap_nodes:
-        result = [unwrap(node) if isinstance(node, NodeBase) else node for node in result]
-
-    return result
+    return DynamicContext(static_context, wrapped, 1, 1)
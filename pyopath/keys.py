@@ -0,0 +1,161 @@
+"""
+Keys declared by the user, like xsl:key; an Index holds the nodes of a document that match a pattern, by the values
+ of an expression evaluated for each of them, and key(name, values) in a query looks them up.
+
+    countries = pyopath.Index(document, match="country", use="@name")
+    static_context = StaticContext(indexes={"countries": countries})
+    pyopath.query(document, "key('countries','Panama')/rank", static_context=static_context)
+
+Unlike the automatic indexes of nameindex.py, an Index exists because it was declared, and is never evicted.
+It is built the first time it is looked up in, and is then shared by every query evaluated with a static context
+ holding it, from any thread; handing the same Index to several static contexts shares it between them too.
+An Index is over the one document it was declared for; key() raises if the context item is in another one.
+Changing the document leaves the index with the old keys until it is told; update re-evaluates use for changed
+ nodes in place, and rebuild drops everything to be built again on the next lookup.
+"""
+
+from threading import Lock
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from pyopath.compiled import CompiledQuery, compile
+from pyopath.nodewrappers.base import NodeBase, is_text, string_value, unwrap
+from pyopath.xpath.AST.ast import AnyKindTest, AxisStep, Context, PathOperator
+
+# The position of a node in document order, the node and its values of use
+Entry = Tuple[int, NodeBase, Tuple[Any, ...]]
+
+
+def key_value(item: Any) -> Any:
+    return string_value(item) if isinstance(item, NodeBase) else item
+
+
+class Index:
+    """
+    The nodes of a document that match `match` by the values of `use`.
+    A node matches if `match` selects it from any node of the document, like the patterns of xsl:key; "country"
+     matches every country element below the top of the document.
+    `use` is evaluated with each matching node as the context item, and the node is kept under the string value of
+     every node, or the atomic value, it produces.
+    """
+
+    document: Any
+    match: str
+    use: str
+
+    def __init__(self, document: Any, match: str, use: str):
+        self.document = unwrap(document) if isinstance(document, NodeBase) else document
+        self.match = match
+        self.use = use
+        pattern = PathOperator(
+            PathOperator(Context(), AxisStep("descendant-or-self", AnyKindTest())), compile(match).ast
+        )
+        self._matches = CompiledQuery(f".//({match})", ast=pattern)
+        self._use = compile(use)
+        self._lock = Lock()
+        # None until built
+        self._groups: Optional[Dict[Any, List[NodeBase]]] = None
+        # By the id of the object each node unwraps to
+        self._entries: Dict[int, Entry] = {}
+
+    def _values(self, node: NodeBase) -> Tuple[Any, ...]:
+        return tuple(dict.fromkeys(key_value(item) for item in self._use.iter(node, unwrap_nodes=False)))
+
+    def _insert(self, ordinal: int, node: NodeBase, values: Tuple[Any, ...]) -> None:
+        assert self._groups is not None
+        self._entries[id(unwrap(node))] = (ordinal, node, values)
+        for value in values:
+            group = self._groups.setdefault(value, [])
+            at = len(group)
+            while at and self._ordinal(group[at - 1]) > ordinal:
+                at -= 1
+            group.insert(at, node)
+
+    def _ordinal(self, node: NodeBase) -> int:
+        return self._entries[id(unwrap(node))][0]
+
+    def _remove(self, node: Any) -> None:
+        assert self._groups is not None
+        _, wrapper, values = self._entries.pop(id(node))
+        for value in values:
+            group = self._groups[value]
+            group.remove(wrapper)
+            if not group:
+                del self._groups[value]
+
+    def _build(self) -> Dict[Any, List[NodeBase]]:
+        with self._lock:
+            if self._groups is None:
+                self._groups = {}
+                self._entries = {}
+                # Paths produce their nodes in document order, which is the order the ordinals keep
+                for ordinal, node in enumerate(self._matches.iter(self.document, unwrap_nodes=False)):
+                    if isinstance(node, NodeBase) and not is_text(node):
+                        self._insert(ordinal, node, self._values(node))
+            return self._groups
+
+    def lookup(self, top: NodeBase, values: Iterable[Any]) -> Sequence[NodeBase]:
+        """
+        The nodes with any of the values, in document order, for key() evaluated in the document with the top node.
+        """
+        if unwrap(top) is not self.document:
+            raise ValueError(f"{self!r} is over another document than the context item is in [err:XTDE1270]")
+        groups = self._groups
+        if groups is None:
+            groups = self._build()
+        found = [groups.get(value, ()) for value in values]
+        if len(found) == 1:
+            return found[0]
+        nodes = {id(unwrap(node)): node for group in found for node in group}
+        return sorted(nodes.values(), key=self._ordinal)
+
+    def update(self, *nodes: Any) -> None:
+        """
+        Re-evaluates use for nodes of the document that changed, ie. whose attributes or text were set, and moves
+         them to their new values, keeping their place in document order. Nodes are given as the objects of the
+         document, or as their wrappers.
+        Nodes the index does not have, like added ones, can only be placed by walking the document, so the index is
+         instead rebuilt on the next lookup.
+        """
+        with self._lock:
+            if self._groups is None:
+                return
+            for node in nodes:
+                document_node = unwrap(node) if isinstance(node, NodeBase) else node
+                entry = self._entries.get(id(document_node), None)
+                if entry is None:
+                    self._groups = None
+                    return
+                ordinal, wrapper, _ = entry
+                self._remove(document_node)
+                self._insert(ordinal, wrapper, self._values(wrapper))
+
+    def remove(self, *nodes: Any) -> None:
+        """
+        Drops nodes that were removed from the document, given like for update.
+        """
+        with self._lock:
+            if self._groups is None:
+                return
+            for node in nodes:
+                document_node = unwrap(node) if isinstance(node, NodeBase) else node
+                if id(document_node) in self._entries:
+                    self._remove(document_node)
+
+    def rebuild(self) -> None:
+        """
+        Drops the keys, to be built from the document as it then is on the next lookup.
+        """
+        with self._lock:
+            self._groups = None
+            self._entries = {}
+
+    def __len__(self) -> int:
+        """
+        The number of nodes in the index, building it if needed.
+        """
+        if self._groups is None:
+            self._build()
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return f"Index(match={self.match!r}, use={self.use!r})"
@@ -0,0 +1,99 @@
+"""
+A small, thread-safe LRU mapping with hit/miss bookkeeping.
+functools.lru_cache would do, except that it can't be resized at runtime.
+The bound is on the number of entries, or on their total weight if the cache is given a function weighing them.
+Entries are weighed when put, an entry that has grown is put again to account for it.
+"""
+
+from collections import OrderedDict
+from threading import Lock
+from typing import Callable, Dict, Generic, List, NamedTuple, Optional, TypeVar
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class LRUCache(Generic[K, V]):
+    maxsize: int
+    hits: int
+    misses: int
+
+    def __init__(self, maxsize: int, weigh: Optional[Callable[[V], int]] = None):
+        assert maxsize >= 0, f"Cache size must be non-negative, got {maxsize}"
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[K, V]" = OrderedDict()
+        self._lock = Lock()
+        self._weigh = weigh
+        self._weights: Dict[K, int] = {}
+        self._weight = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: K) -> Optional[V]:
+        with self._lock:
+            value = self._entries.get(key, None)
+            if value is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: K, value: V) -> None:
+        with self._lock:
+            if self.maxsize == 0:
+                return
+            weight = self._weigh(value) if self._weigh is not None else 1
+            self._remove(key)
+            if weight > self.maxsize:
+                # Would evict everything else, and then itself
+                return
+            self._entries[key] = value
+            self._weights[key] = weight
+            self._weight += weight
+            self._evict()
+
+    def discard(self, key: K) -> None:
+        with self._lock:
+            self._remove(key)
+
+    def resize(self, maxsize: int) -> None:
+        assert maxsize >= 0, f"Cache size must be non-negative, got {maxsize}"
+        with self._lock:
+            self.maxsize = maxsize
+            self._evict()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._weights.clear()
+            self._weight = 0
+            self.hits = 0
+            self.misses = 0
+
+    def values(self) -> List[V]:
+        with self._lock:
+            return list(self._entries.values())
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, self._weight)
+
+    def _remove(self, key: K) -> None:
+        if self._entries.pop(key, None) is not None:
+            self._weight -= self._weights.pop(key)
+
+    def _evict(self) -> None:
+        while self._weight > self.maxsize:
+            key, _ = self._entries.popitem(last=False)
+            self._weight -= self._weights.pop(key)
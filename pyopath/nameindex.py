@@ -0,0 +1,221 @@
+"""
+Indexes of documents by element name and by attribute value, built the first time a query could use them.
+
+The element-name index makes descendant::name, and //name which the optimizer turns into it, a lookup from the
+ top of a document rather than a walk over the whole tree.
+The attribute-value indexes are per axis, node, element name and attribute name, and make steps like
+ country[@name eq 'X'] or descendant::country[@name eq $name] a lookup rather than a test of every candidate,
+ see indexed_equality.
+
+Indexing is off until given a size with set_index_size. The indexes only use NodeBase, so they work for any
+ wrapper, and are kept per document in an LRU bounded by the total number of nodes indexed; parts larger than
+ that are never indexed, but remembered as such.
+Documents are told apart by the object their top node unwraps to, which the index holds on to. Changing a document
+ after it has been indexed leaves its queries seeing the old nodes, until it is dropped with clear_index.
+"""
+
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Sequence, Tuple
+from weakref import WeakKeyDictionary
+
+from pyopath.lru import CacheInfo, LRUCache
+from pyopath.nodewrappers.base import (
+    NodeBase,
+    attributes,
+    children,
+    descendants,
+    is_text,
+    node_name,
+    parent,
+    root,
+    string_value,
+    unwrap,
+)
+from pyopath.xpath.AST.ast import ASTNode, AxisStep, GeneralCompare, Literal, NameTest, ValueCompare, VarRef
+
+# Nodes by a key of each, ie. their name or the value of one of their attributes
+Grouping = Dict[str, List[NodeBase]]
+
+# Operators that an attribute-value index can answer
+EQUALITY_OPERATORS = frozenset(("eq", "=", "=="))
+
+
+class DocumentIndex:
+    """
+    The indexes of one document, each built on first use.
+    """
+
+    __slots__ = ("document", "parts", "weight")
+
+    document: Any
+    # None for the parts that were too large to index
+    parts: Dict[Hashable, Optional[Grouping]]
+    weight: int
+
+    def __init__(self, document: Any):
+        # Kept alive, so that its id is not reused while indexed
+        self.document = document
+        self.parts = {}
+        self.weight = 0
+
+    def part(
+        self, key: Hashable, nodes: Callable[[], Iterable[NodeBase]], by: Callable[[NodeBase], Optional[str]]
+    ) -> Optional[Grouping]:
+        """
+        The nodes grouped by a key of each, or None if there were more than the indexes may hold.
+        Nodes whose key is None are left out.
+        """
+        try:
+            return self.parts[key]
+        except KeyError:
+            pass
+        limit = _indexes.maxsize - self.weight
+        grouping: Optional[Grouping] = {}
+        count = 0
+        for node in nodes():
+            value = by(node)
+            if value is None:
+                continue
+            count += 1
+            if count > limit:
+                grouping = None
+                break
+            grouping.setdefault(value, []).append(node)  # type: ignore
+        self.parts[key] = grouping
+        self.weight += count if grouping is not None and count else 1
+        _indexes.put(id(self.document), self)
+        return grouping
+
+
+def weigh_index(index: DocumentIndex) -> int:
+    """
+    The nodes the index holds, and one for each part that is empty or too large to index.
+    Capped at the size of the indexes, so that the parts remembered as too large, which hold no nodes, never make
+     the whole index too large to keep.
+    """
+    return min(index.weight, _indexes.maxsize)
+
+
+_indexes: LRUCache[int, DocumentIndex] = LRUCache(0, weigh=weigh_index)
+
+
+def set_index_size(size: int) -> None:
+    """
+    Sets the number of nodes the indexes may hold in total, 0 turns indexing off.
+    """
+    _indexes.resize(size)
+
+
+def index_info() -> CacheInfo:
+    """
+    Hits and misses of the index lookups, currsize is the number of nodes indexed.
+    """
+    return _indexes.info()
+
+
+def clear_index(document: Optional[Any] = None) -> None:
+    """
+    Drops the indexes of the document, as passed to query, or of all documents.
+    """
+    if document is None:
+        _indexes.clear()
+    else:
+        _indexes.discard(id(document))
+
+
+def document_index(top: NodeBase) -> DocumentIndex:
+    document = unwrap(top)
+    index = _indexes.get(id(document))
+    if index is None:
+        index = DocumentIndex(document)
+    return index
+
+
+def element_name(node: NodeBase) -> Optional[str]:
+    return None if is_text(node) else node_name(node)
+
+
+def named_descendants(node: NodeBase, name: str) -> Iterable[NodeBase]:
+    """
+    The descendants of the node with the name, in document order, from the index if the node is the top of a document.
+    """
+    if _indexes.maxsize and parent(node) is None:
+        elements = document_index(node).part("names", lambda: descendants(node), element_name)
+        if elements is not None:
+            return elements.get(name, ())
+    return (descendant for descendant in descendants(node) if node_name(descendant) == name)
+
+
+def attribute_value(name: str) -> Callable[[NodeBase], Optional[str]]:
+    def value(node: NodeBase) -> Optional[str]:
+        for attribute in attributes(node):
+            if node_name(attribute) == name:
+                return string_value(attribute)
+        return None
+
+    return value
+
+
+# The nodes with a name on each axis the attribute-value indexes are for
+AXIS_NODES: Dict[str, Callable[[NodeBase, str], Iterable[NodeBase]]] = {
+    "child": lambda node, name: (child for child in children(node) if node_name(child) == name),
+    "descendant": named_descendants,
+}
+
+# The attribute name and the operand with the value, for steps whose first predicate an index can answer
+Equality = Tuple[str, ASTNode]
+_equalities: "WeakKeyDictionary[AxisStep, Optional[Equality]]" = WeakKeyDictionary()
+
+
+def indexed_equality(step: AxisStep) -> Optional[Equality]:
+    """
+    Whether the first predicate of the step compares an attribute with a literal or a variable for equality,
+     ie. country[@name eq 'X'], country[@name = 'X'] and descendant::country[@name eq $name].
+    The predicate then keeps the nodes of the step that the attribute-value index has for the value.
+    """
+    try:
+        return _equalities[step]
+    except KeyError:
+        pass
+    equality: Optional[Equality] = None
+    predicates = step.predicates or ()
+    compare = predicates[0].predicate if predicates else None
+    if (
+        step.axis in AXIS_NODES
+        and isinstance(step.nodetest, NameTest)
+        and isinstance(compare, (ValueCompare, GeneralCompare))
+        and compare.op in EQUALITY_OPERATORS
+    ):
+        for attribute, operand in ((compare.lhs, compare.rhs), (compare.rhs, compare.lhs)):
+            if (
+                isinstance(attribute, AxisStep)
+                and attribute.axis == "attribute"
+                and isinstance(attribute.nodetest, NameTest)
+                and not attribute.predicates
+                and (isinstance(operand, VarRef) or (isinstance(operand, Literal) and type(operand.value) is str))
+            ):
+                equality = (attribute.nodetest.name, operand)
+                break
+    _equalities[step] = equality
+    return equality
+
+
+def equality_value(operand: ASTNode, variables: Dict[str, Any]) -> Optional[str]:
+    """
+    The string the attribute is compared with, or None if it is not a string; the comparison is then evaluated.
+    """
+    value = operand.value if isinstance(operand, Literal) else variables.get(operand.name, None)  # type: ignore
+    return value if type(value) is str else None
+
+
+def indexed_nodes(node: NodeBase, axis: str, name: str, attribute: str, value: str) -> Optional[Sequence[NodeBase]]:
+    """
+    The nodes named name on the axis of the node, whose attribute has the value, in document order.
+    None if indexing is off, or there were too many nodes to index.
+    """
+    if not _indexes.maxsize:
+        return None
+    key = (id(unwrap(node)), axis, name, attribute)
+    grouping = document_index(root(node)).part(key, lambda: AXIS_NODES[axis](node, name), attribute_value(attribute))
+    if grouping is None:
+        return None
+    return grouping.get(value, ())
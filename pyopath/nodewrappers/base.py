@@ -1,10 +1,13 @@
-from typing import Any, Generator, Optional
+from typing import Any, Dict, Generator, Iterable, Iterator, List, Optional, Tuple
 
 from typing_extensions import Protocol, runtime_checkable
 
 
 @runtime_checkable
 class NodeBase(Protocol):
+    # So that wrappers can do without a __dict__ per node, see etree.EtreeElement
+    __slots__ = ()
+
     def node_name(self) -> str: ...
     def string_value(self) -> str: ...
 
@@ -30,6 +33,8 @@ class NodeBase(Protocol):
 
 
 class ElementBase(NodeBase):
+    __slots__ = ()
+
     def node_kind(self) -> str:
         return "element"
 
@@ -38,6 +43,8 @@ class ElementBase(NodeBase):
 
 
 class AttributeBase(NodeBase):
+    __slots__ = ()
+
     def attributes(self) -> Generator["AttributeBase", None, None]: ...
     def children(self) -> Generator[NodeBase, None, None]: ...
 
@@ -48,19 +55,25 @@ class AttributeBase(NodeBase):
         yield self.string_value()
 
 
-class DocumentBase(NodeBase): ...
+class DocumentBase(NodeBase):
+    __slots__ = ()
 
 
-class CommentBase(NodeBase): ...
+class CommentBase(NodeBase):
+    __slots__ = ()
 
 
-class NamespaceBase(NodeBase): ...
+class NamespaceBase(NodeBase):
+    __slots__ = ()
 
 
-class ProcessingInstructionBase(NodeBase): ...
+class ProcessingInstructionBase(NodeBase):
+    __slots__ = ()
 
 
 class TextBase(NodeBase):
+    __slots__ = ()
+
     def node_kind(self) -> str:
         return "text"
 
@@ -85,13 +98,121 @@ def parent(node: NodeBase) -> Optional[NodeBase]:
     return node.parent()
 
 
+def reversed_children(node: NodeBase) -> Optional[Iterator[NodeBase]]:
+    """
+    The children in reverse document order, or None if the wrapper can not produce them without enumerating them all.
+    Wrappers opt in by having a reversed_children method. It is not part of NodeBase, so that they need not.
+    """
+    method = getattr(node, "reversed_children", None)
+    return method() if method is not None else None
+
+
+# The wrappers are protocols, which are slow to isinstance-check, so the answer is remembered per type,
+# like closures.is_node
+_text_types: Dict[int, Tuple[type, bool]] = {}
+
+
+def is_text(item: Any) -> bool:
+    typ = type(item)
+    known = _text_types.get(id(typ), None)
+    if known is None:
+        known = _text_types[id(typ)] = (typ, isinstance(item, TextBase))
+    return known[1]
+
+
+def descendants(node: NodeBase) -> Generator[NodeBase, None, None]:
+    """
+    The descendants of the node in document order.
+    Walks the tree with a stack of the children still to visit on each level, rather than a generator per level,
+     so deep trees neither hit the recursion limit nor pass every node up through a chain of generators.
+    """
+    stack = [iter(children(node))]
+    while stack:
+        for child in stack[-1]:
+            yield child
+            # Text nodes have no children
+            if not is_text(child):
+                stack.append(iter(children(child)))
+                break
+        else:
+            stack.pop()
+
+
+def root(node: NodeBase) -> NodeBase:
+    """
+    The node at the top of the tree the node is in, which / selects.
+    There is no document node above it, so /a selects the children named a of that node.
+    """
+    while True:
+        above = parent(node)
+        if above is None:
+            return node
+        node = above
+
+
+def order_key(node: NodeBase) -> Tuple[Any, ...]:
+    """
+    A key that sorts nodes in document order, equal for the same node however often it is wrapped.
+    Nodes of different documents are in some order that is the same for as long as the documents exist.
+    Wrappers provide it with an order_key method, which like reversed_children is not part of NodeBase;
+     for those that do not, it is made from the positions of the node and its ancestors among their siblings.
+    """
+    method = getattr(node, "order_key", None)
+    if method is not None:
+        return method()
+    return ancestry_key(node)
+
+
+def node_identity(node: NodeBase, key: Optional[Tuple[Any, ...]] = None) -> Any:
+    """
+    Equal for the same node however it was reached, also where order keys are not; an element given in a variable is
+     the top of a tree of its own, so its nodes may have other order keys than they have in the tree it is inside.
+    Wrappers provide it with an identity method, like order_key; for those that do not, it is the order key, which
+     can be given if already known.
+    """
+    method = getattr(node, "identity", None)
+    if method is not None:
+        return method()
+    return key if key is not None else order_key(node)
+
+
+def ancestry_key(node: NodeBase) -> Tuple[Any, ...]:
+    """
+    The positions of the node and its ancestors among their siblings, from the top, attributes before children.
+    Takes a walk over the siblings on every level, so wrappers are better off knowing their order themselves.
+    """
+    positions: List[Tuple[int, int]] = []
+    above = parent(node)
+    while above is not None:
+        if node_kind(node) == "attribute":
+            positions.append((0, sibling_position(attributes(above), node)))
+        else:
+            positions.append((1, sibling_position(children(above), node)))
+        node = above
+        above = parent(node)
+    return (id(unwrap(node)),) + tuple(position for level in reversed(positions) for position in level)
+
+
+def sibling_position(siblings: Iterable[NodeBase], node: NodeBase) -> int:
+    kind = node_kind(node)
+    name = node_name(node)
+    value = unwrap(node)
+    for position, sibling in enumerate(siblings):
+        if node_kind(sibling) == kind and node_name(sibling) == name and unwrap(sibling) == value:
+            return position
+    raise ValueError(f"{node} is not below its parent")
+
+
 def base_uri(node: NodeBase) -> str: ...
 def document_uri(node: NodeBase) -> str: ...
 def is_id(node: NodeBase) -> bool: ...
 def is_idrefs(node: NodeBase) -> bool: ...
 def namespace_nodes(node: NodeBase) -> Generator[NodeBase, None, None]: ...
 def nilled(node: NodeBase) -> bool: ...
-def node_kind(node: NodeBase) -> str: ...
+def node_kind(node: NodeBase) -> str:
+    return node.node_kind()
+
+
 def type_name(node: NodeBase) -> str: ...
 def typed_value(node: NodeBase) -> Generator[Any, None, None]:
     yield from node.typed_value()
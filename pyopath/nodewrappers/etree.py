@@ -1,14 +1,17 @@
-from typing import Any, Dict, Generator, Optional, Union
+from typing import Any, Dict, Generator, List, Optional, Tuple, Union
 from xml.etree.ElementTree import Element as XMLElement
 
 from typing_extensions import TypeAlias
 
+from pyopath.lru import LRUCache
 from pyopath.nodewrappers.base import AttributeBase, ElementBase, NodeBase, TextBase
 from pyopath.nodewrappers.registry import register_nodetype
 
 try:
     from lxml.etree import _Element as LXMLElement  # type: ignore
+    from lxml.etree import tostring as lxml_tostring  # type: ignore
 except ImportError:
+    lxml_tostring = None
 
     class LXMLElement:
         tag: str
@@ -21,29 +24,294 @@ except ImportError:
 Element: TypeAlias = Union[XMLElement, LXMLElement]
 
 
+class DocumentOrder:
+    """
+    The elements below a top element numbered in document order, which the order keys of the nodes are made of.
+    etree walks the tree in document order itself, so numbering is a single pass over iter().
+    The elements are held on to, so that their ids are not reused while numbered, and so that lxml keeps handing
+     out the same element objects for them.
+    """
+
+    __slots__ = ("top", "elements", "numbers")
+
+    top: Element
+    elements: List[Element]
+    # By the id of each element, empty once dropped, see drop_order
+    numbers: Dict[int, int]
+
+    def __init__(self, top: Element):
+        self.top = top
+        self.elements = list(top.iter())
+        self.numbers = {id(element): number for number, element in enumerate(self.elements)}
+
+
+class EtreeDocument:
+    """
+    The tree below a top element as wrapped; the wrappers of its nodes, and its numbering once sorted by.
+    Each node is wrapped once, and the wrappers are kept with the document for as long as it is among the documents
+     queried lately, so that walking past a node again, in the same query or another, finds the same wrapper.
+    The wrappers are kept by the element they wrap, and hold on to it. lxml elements can not be referred to weakly,
+     so a weak map would have to be of the wrappers, which are too short-lived for that to find many again.
+    A wrapper is only reused below the parent it was made for, and for attributes with the value it was made with,
+     so a changed document gets new wrappers for what changed; the numbering has to be cleared though, see
+     clear_document_order.
+    lxml elements know the tree they are in, so an lxml element below the top of another wrapped tree, like one
+     given in a variable, shares the numbering of the whole tree, and its nodes get the same order keys either way.
+    """
+
+    __slots__ = ("top", "order", "version", "elements", "texts", "attribute_nodes", "limit")
+
+    top: Element
+    order: Optional[DocumentOrder]
+    # Counts the changes the document was told about, see document_changed
+    version: int
+    # By the element, which etree hashes by identity
+    elements: Dict[Element, "EtreeElement"]
+    # By the element the text is of
+    texts: Dict[Element, "EtreeText"]
+    # By the element and the name
+    attribute_nodes: Dict[Tuple[Element, str], "EtreeAttribute"]
+    # The number of element or attribute wrappers it is weighed again at
+    limit: int
+
+    def __init__(self, top: Element):
+        self.top = top
+        self.order = None
+        self.version = 0
+        self.elements = {}
+        self.texts = {}
+        self.attribute_nodes = {}
+        self.limit = DOCUMENT_GROWTH
+
+    def element(self, parent_element: Optional["EtreeElement"], element: Element) -> "EtreeElement":
+        wrapper = self.elements.get(element, None)
+        if wrapper is None or wrapper.parent_element is not parent_element:
+            wrapper = self.elements[element] = EtreeElement(parent_element, element, self)
+        return wrapper
+
+    def text(self, parent_element: "EtreeElement") -> "EtreeText":
+        wrapper = self.texts.get(parent_element.element, None)
+        if wrapper is None or wrapper.parent_element is not parent_element:
+            wrapper = self.texts[parent_element.element] = EtreeText(parent_element)
+        return wrapper
+
+    def attribute(self, element: "EtreeElement", name: str, value: str) -> "EtreeAttribute":
+        key = (element.element, name)
+        wrapper = self.attribute_nodes.get(key, None)
+        if wrapper is None or wrapper.element is not element or wrapper.value != value:
+            wrapper = self.attribute_nodes[key] = EtreeAttribute(element, name, value)
+        return wrapper
+
+    def grown(self) -> None:
+        """
+        Weighs the document again, as it holds twice the elements or attributes it was last weighed with.
+        """
+        self.limit = 2 * max(len(self.elements), len(self.attribute_nodes))
+        _documents.put(id(self.top), self)
+
+
+# Element or attribute wrappers a document may hold before it is first weighed again
+DOCUMENT_GROWTH = 4
+
+
+def weigh_document(document: EtreeDocument) -> int:
+    """
+    The wrappers and numbered elements the document holds, at least 1 so that documents not walked yet count too.
+    """
+    wrappers = len(document.elements) + len(document.texts) + len(document.attribute_nodes)
+    order = document.order
+    # A numbering shared with the tree the top is in is weighed with that
+    return max(1, wrappers) + (len(order.elements) if order is not None and order.top is document.top else 0)
+
+
+# The wrappers and numbered elements held for the documents queried lately, in total
+WRAPPER_CACHE_SIZE = 1 << 20
+
+# The documents queried lately by the id of their top element
+_documents: LRUCache[int, EtreeDocument] = LRUCache(WRAPPER_CACHE_SIZE, weigh=weigh_document)
+
+
+def wrapped_document(top: Element) -> EtreeDocument:
+    document = _documents.get(id(top))
+    if document is None or document.top is not top:
+        document = EtreeDocument(top)
+        _documents.put(id(top), document)
+    return document
+
+
+def set_wrapper_cache_size(size: int) -> None:
+    """
+    Bounds the wrappers and numbered elements held for the documents queried lately, in total; 0 keeps none, so that
+     every query wraps the nodes it walks past anew.
+    """
+    _documents.resize(size)
+
+
+def clear_wrappers(element: Optional[Element] = None) -> None:
+    """
+    Drops the wrappers and the numbering of the document with the top element, or of all documents.
+    """
+    if element is None:
+        _documents.clear()
+    else:
+        _documents.discard(id(element))
+
+
+def numbering_top(top: Element) -> Element:
+    """
+    The element the tree below top is numbered from; the root of the whole tree for lxml, which knows it.
+    """
+    if lxml_tostring is not None and isinstance(top, LXMLElement):
+        return top.getroottree().getroot()
+    return top
+
+
+def document_order(document: EtreeDocument) -> DocumentOrder:
+    """
+    The numbering of the elements of a wrapped tree, kept with its wrappers.
+    """
+    order = document.order
+    if order is None or not order.numbers:
+        top = numbering_top(document.top)
+        if top is document.top:
+            order = document.order = DocumentOrder(top)
+            # Weighed again with the elements
+            _documents.put(id(top), document)
+        else:
+            order = document.order = document_order(wrapped_document(top))
+    return order
+
+
+def drop_order(document: EtreeDocument) -> None:
+    """
+    Drops the numbering of the document, emptied rather than only let go of, so that the documents of elements below
+     its top that share it are numbered again too.
+    """
+    order = document.order
+    if order is not None:
+        order.elements = []
+        order.numbers = {}
+        document.order = None
+
+
+def clear_document_order(element: Optional[Element] = None) -> None:
+    """
+    Drops the numbering of the document with the top element, and of the documents of elements below it, like ones
+     given in variables, or of all documents, to be numbered again when next queried. Like the indexes, the numbering is not updated when a document changes; after adding, removing or
+     moving elements, call this before querying it again.
+    An element that was not numbered makes the document be numbered again when it turns up, but the nodes of the
+     query that came before it may then be out of order.
+    """
+    for document in wrapped_documents(element):
+        drop_order(document)
+
+
+def document_changed(element: Optional[Element] = None) -> None:
+    """
+    Tells the wrappers that the document with the top element, or any document, changed; its numbering is dropped and
+     the string values cached for its elements are made again, see set_string_cache. So are those of the documents
+     of elements below it, like ones given in variables, which are wrapped as the tops of documents of their own.
+    """
+    for document in wrapped_documents(element):
+        drop_order(document)
+        document.version += 1
+
+
+def wrapped_documents(element: Optional[Element] = None) -> List[EtreeDocument]:
+    """
+    The documents whose top is the element or below it, or all documents.
+    """
+    documents = _documents.values()
+    if element is None:
+        return documents
+    # The tops are alive, so no other element can have the id of one
+    below = {id(descendant) for descendant in element.iter()}
+    return [document for document in documents if id(document.top) in below]
+
+
+# Whether elements keep their string values, see set_string_cache
+_cache_strings = False
+
+
+def set_string_cache(enabled: bool) -> None:
+    """
+    Makes each element wrapper keep its string value once made, until told that the document changed with
+     document_changed. Off by default, as the string values of a document that changes without telling would be stale.
+    Worth it for predicates like country[. = $name] over the same elements many times; each string value is one call
+     into etree either way, but a long one for large subtrees.
+    """
+    global _cache_strings
+    _cache_strings = enabled
+
+
+def subtree_text(element: Element) -> str:
+    """
+    The text of the element and of the elements below it in document order, without the tail of the element itself;
+     the string value, https://www.w3.org/TR/xpath-datamodel-31/#ElementNode, as a single call into etree.
+    lxml makes a python object per element for itertext, so its elements are serialized as text instead, which is what
+     its xpath string() gives too.
+    """
+    if lxml_tostring is not None and isinstance(element, LXMLElement):
+        return lxml_tostring(element, method="text", encoding=str, with_tail=False)
+    return "".join(element.itertext())
+
+
 class EtreeElement(ElementBase):
+    __slots__ = ("parent_element", "element", "document", "string")
+
     parent_element: Optional["EtreeElement"]
     element: Element
+    document: EtreeDocument
+    # The string value and the version of the document it is of, when cached
+    string: Optional[Tuple[int, str]]
 
-    def __init__(self, parent_element: Optional["EtreeElement"], element: Element):
+    def __init__(self, parent_element: Optional["EtreeElement"], element: Element, document: EtreeDocument):
         self.parent_element = parent_element
         self.element = element
+        self.document = document
+        self.string = None
 
     def node_name(self) -> str:
         return self.element.tag
 
     def string_value(self) -> str:
-        # Should be able to use etree to quickly grab the string value of the element?
-        raise NotImplementedError()
+        element = self.element
+        if not len(element):
+            return element.text or ""
+        if not _cache_strings:
+            return subtree_text(element)
+        string = self.string
+        version = self.document.version
+        if string is None or string[0] != version:
+            string = self.string = (version, subtree_text(element))
+        return string[1]
 
     def attributes(self) -> Generator[AttributeBase, None, None]:
+        document = self.document
         for name, value in self.element.attrib.items():
-            yield EtreeAttribute(self, name, value)
+            yield document.attribute(self, name, value)
+        if len(document.attribute_nodes) > document.limit:
+            document.grown()
 
     def children(self) -> Generator[NodeBase, None, None]:
+        document = self.document
+        # document.element inlined, as this is where most wrappers are looked up
+        elements = document.elements
         for child in self.element:
-            yield EtreeElement(self, child)
-        yield EtreeText(self)
+            wrapper = elements.get(child, None)
+            if wrapper is None or wrapper.parent_element is not self:
+                wrapper = elements[child] = EtreeElement(self, child, document)
+            yield wrapper
+        if len(elements) > document.limit:
+            document.grown()
+        text = document.texts.get(self.element, None)
+        yield text if text is not None and text.parent_element is self else document.text(self)
+
+    def reversed_children(self) -> Generator[NodeBase, None, None]:
+        document = self.document
+        yield document.text(self)
+        for child in reversed(self.element):
+            yield document.element(self, child)
 
     def parent(self) -> Optional[NodeBase]:
         return self.parent_element
@@ -51,13 +319,39 @@ class EtreeElement(ElementBase):
     def unwrap(self) -> Any:
         return self.element
 
+    def order_key(self) -> Tuple[Any, ...]:
+        """
+        (top, number) for the element, see base.order_key.
+        """
+        return element_order(self.document, self.element)
+
+    def identity(self) -> Any:
+        return self.element
+
+
+def element_order(document: EtreeDocument, element: Element) -> Tuple[int, int]:
+    """
+    The top the element is numbered below, by id, and its number.
+    """
+    order = document.order or document_order(document)
+    number = order.numbers.get(id(element), None)
+    if number is None:
+        # Added since the document was numbered, or the numbering was dropped
+        drop_order(document)
+        order = document_order(document)
+        number = order.numbers[id(element)]
+    return (id(order.top), number)
+
 
 class EtreeAttribute(AttributeBase):
+    __slots__ = ("element", "name", "value")
+
     element: EtreeElement
     name: str
     value: str
 
     def __init__(self, element: EtreeElement, name: str, value: str):
+        self.element = element
         self.name = name
         self.value = value
 
@@ -75,8 +369,19 @@ class EtreeAttribute(AttributeBase):
     def unwrap(self) -> Any:
         return self.value
 
+    def order_key(self) -> Tuple[Any, ...]:
+        """
+        Right after its element, in the order of the attributes of the element, (top, number, 0, position).
+        """
+        return self.element.order_key() + (0, self.element.element.keys().index(self.name))
+
+    def identity(self) -> Any:
+        return (self.element.element, self.name)
+
 
 class EtreeText(TextBase):
+    __slots__ = ("parent_element",)
+
     parent_element: Optional[EtreeElement]
 
     def __init__(self, parent_element: Optional[EtreeElement] = None):
@@ -93,18 +398,43 @@ class EtreeText(TextBase):
     def typed_value(self) -> Generator[Any, None, None]:
         yield self.string_value()
 
-    def attributes(self) -> Generator["AttributeBase", None, None]: ...
-    def children(self) -> Generator["NodeBase", None, None]: ...
+    def attributes(self) -> Generator["AttributeBase", None, None]:
+        yield from ()
+
+    def children(self) -> Generator["NodeBase", None, None]:
+        yield from ()
+
     def parent(self) -> Optional["NodeBase"]:
         return self.parent_element
 
     def unwrap(self) -> Any:
         return self.string_value()
 
+    def order_key(self) -> Tuple[Any, ...]:
+        """
+        The text comes after the children of its element, see EtreeElement.children, so after the last element below
+         it, (top, number of that element, 1, -number of its element); the text of an element further down, which is
+         numbered later, comes first.
+        """
+        if self.parent_element is None:
+            return (id(self),)
+        document = self.parent_element.document
+        element = self.parent_element.element
+        last = element
+        while len(last):
+            last = last[-1]
+        _, number = element_order(document, element)
+        return element_order(document, last) + (1, -number)
+
+    def identity(self) -> Any:
+        if self.parent_element is None:
+            return self
+        return (self.parent_element.element,)
+
 
 def wrap_xml_element(obj: Any) -> EtreeElement:
     assert isinstance(obj, (XMLElement, LXMLElement))
-    return EtreeElement(None, obj)
+    return wrapped_document(obj).element(None, obj)
 
 
 register_nodetype(XMLElement, wrap_xml_element)
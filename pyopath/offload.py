@@ -0,0 +1,313 @@
+"""
+Offloads queries over lxml documents to libxml2's own XPath 1.0 engine, a tier above codegen.py for the queries it can
+ take.
+
+A query is translated from its plan into an XPath 1.0 expression, if everything it uses means the same there, ie.
+ `country[@name eq 'Panama']/rank` becomes
+
+    $top/child::country[attribute::name = 'Panama']/child::rank
+
+which lxml compiles once into an etree.XPath, cached like the generated source for as long as the plan is alive.
+Queries using anything else are evaluated as before; translate returns None for them.
+
+What XPath 1.0 does differently, and so is left to the python evaluators:
+ - / is the top of the tree the query started on here, the element given to it; lxml's / is the document node, so
+   the top element is handed to lxml as the variable $top instead.
+ - Each element has a single text node here, after its children, and there are no tails, so text() and node() steps
+   selecting nodes are not translated; node() steps whose nodes are only walked through, like //x, are.
+ - XPath 1.0 casts strings to numbers by its own rules, and compares strings with < as numbers, so comparisons of
+   nodes or strings are only translated for = and !=, and numbers are only compared with numbers, like position().
+ - eq raises an error here for more than one item, where = does not; it is only translated for operands that are
+   at most one item, attributes and the context item.
+ - XPath 1.0 has no sequences, variables are not translated, and neither are functions other than position() and
+   last().
+"""
+
+from typing import Any, Callable, List, Optional
+from weakref import WeakKeyDictionary
+
+from pyopath.doer import function_arguments
+from pyopath.xpath.AST.ast import (
+    AnyKindTest,
+    ASTNode,
+    AxisStep,
+    Context,
+    Expressions,
+    GeneralCompare,
+    Literal,
+    NameTest,
+    PathOperator,
+    Predicate,
+    Root,
+    StaticFunctionCall,
+    UnionExpr,
+    ValueCompare,
+)
+
+try:
+    from lxml.etree import XPath  # type: ignore
+    from lxml.etree import _Element as LXMLElement  # type: ignore
+except ImportError:
+    XPath = None
+    LXMLElement = None
+
+# The name of the variable the top of the tree is given to lxml as
+TOP = "top"
+
+# The axes the python evaluators implement too
+AXES = ("child", "attribute", "descendant", "descendant-or-self")
+
+# The operators for comparisons of strings, and of nodes with nodes or strings
+STRING_OPERATORS = {"=": "=", "==": "=", "!=": "!=", "eq": "=", "ne": "!="}
+# The operators for comparisons of numbers with numbers
+NUMBER_OPERATORS = {
+    **STRING_OPERATORS,
+    "<": "<",
+    "<=": "<=",
+    ">": ">",
+    ">=": ">=",
+    "lt": "<",
+    "le": "<=",
+    "gt": ">",
+    "ge": ">=",
+}
+
+# Functions of the focus, which are numbers
+NUMBER_FUNCTIONS = ("position", "last")
+
+
+class Unsupported(Exception):
+    """
+    Raised while translating, for AST nodes without an XPath 1.0 form that gives the same results.
+    """
+
+
+def unwrapped(node: ASTNode) -> ASTNode:
+    """
+    The expression inside parentheses around a single one.
+    """
+    while isinstance(node, Expressions) and len(node.expressions) == 1:
+        node = node.expressions[0]
+    return node
+
+
+def path_steps(node: ASTNode) -> List[ASTNode]:
+    """
+    Flattens a path into its steps, a/b/c -> [a, b, c]; like codegen.path_steps, but anything selecting nodes may
+     start the path.
+    """
+    node = unwrapped(node)
+    if isinstance(node, PathOperator):
+        return path_steps(node.a) + path_steps(node.b)
+    return [node]
+
+
+def is_number(node: ASTNode) -> bool:
+    node = unwrapped(node)
+    if isinstance(node, Literal):
+        return type(node.value) in (int, float)
+    return isinstance(node, StaticFunctionCall) and node.name in NUMBER_FUNCTIONS
+
+
+def is_string(node: ASTNode) -> bool:
+    node = unwrapped(node)
+    return isinstance(node, Literal) and type(node.value) is str
+
+
+def is_single_node(node: ASTNode) -> bool:
+    """
+    Whether the operand is at most one node; eq gives an error for more.
+    """
+    node = unwrapped(node)
+    if isinstance(node, Context):
+        return True
+    return (
+        isinstance(node, AxisStep)
+        and node.axis == "attribute"
+        and isinstance(node.nodetest, NameTest)
+        and not node.predicates
+    )
+
+
+class Translator:
+    """
+    Writes the XPath 1.0 expression for one query.
+    """
+
+    def translate(self, node: ASTNode) -> str:
+        """
+        The whole query, which has to produce nodes, or a single boolean.
+        """
+        node = unwrapped(node)
+        if isinstance(node, ValueCompare) and not all(
+            isinstance(unwrapped(side), (Context, Literal)) for side in (node.lhs, node.rhs)
+        ):
+            # Empty when either side is, where XPath 1.0 gives false
+            raise Unsupported(node)
+        if isinstance(node, (GeneralCompare, ValueCompare)):
+            return self.comparison(node)
+        return self.nodes(node)
+
+    def nodes(self, node: ASTNode) -> str:
+        node = unwrapped(node)
+        if isinstance(node, UnionExpr):
+            return f"{self.nodes(node.a)} | {self.nodes(node.b)}"
+        steps = path_steps(node)
+        for step in steps[:-1]:
+            step = unwrapped(step)
+            if isinstance(step, AxisStep) and step.axis == "attribute":
+                # Attributes have no children, which XPath 1.0 gives as no nodes but is an error here
+                raise Unsupported(step)
+        parts = [self.first_step(steps[0])] + [self.step(step) for step in steps[1:]]
+        # The step selecting the nodes, which . passes on
+        selecting = next((step for step in reversed(steps) if not isinstance(unwrapped(step), Context)), None)
+        if isinstance(selecting, AxisStep) and not isinstance(selecting.nodetest, NameTest):
+            # node() and text() select text nodes, which are not the same
+            raise Unsupported(selecting)
+        return "/".join(parts)
+
+    def first_step(self, node: ASTNode) -> str:
+        if isinstance(node, Root):
+            return f"${TOP}"
+        if isinstance(node, UnionExpr):
+            return f"({self.nodes(node)})"
+        return self.step(node)
+
+    def step(self, node: ASTNode) -> str:
+        if isinstance(node, Context):
+            return "."
+        if not isinstance(node, AxisStep) or node.axis not in AXES:
+            raise Unsupported(node)
+        if node.axis == "attribute" and node.predicates:
+            # Predicates of attributes are an error here, and tested in XPath 1.0
+            raise Unsupported(node)
+        if isinstance(node.nodetest, NameTest):
+            if not is_name(node.nodetest.name):
+                raise Unsupported(node.nodetest)
+            test = node.nodetest.name
+        elif isinstance(node.nodetest, AnyKindTest) and not node.predicates:
+            # Only walked through, see nodes
+            test = "node()"
+        else:
+            raise Unsupported(node.nodetest)
+        return f"{node.axis}::{test}" + "".join(self.predicate(predicate) for predicate in node.predicates or ())
+
+    def predicate(self, predicate: Predicate) -> str:
+        node = unwrapped(predicate.predicate)
+        if isinstance(node, Literal):
+            return f"[{self.literal(node)}]"
+        if isinstance(node, StaticFunctionCall):
+            return f"[{self.number(node)}]"
+        if isinstance(node, (GeneralCompare, ValueCompare)):
+            return f"[{self.comparison(node)}]"
+        return f"[{self.nodes(node)}]"
+
+    def comparison(self, node: ASTNode) -> str:
+        assert isinstance(node, (GeneralCompare, ValueCompare))
+        lhs = unwrapped(node.lhs)
+        rhs = unwrapped(node.rhs)
+        if is_number(lhs) and is_number(rhs):
+            operator = NUMBER_OPERATORS.get(node.op, None)
+            if operator is None:
+                raise Unsupported(node)
+            return f"{self.number(lhs)} {operator} {self.number(rhs)}"
+        operator = STRING_OPERATORS.get(node.op, None)
+        if operator is None or is_number(lhs) or is_number(rhs):
+            raise Unsupported(node)
+        if isinstance(node, ValueCompare) and not all(is_single_node(side) or is_string(side) for side in (lhs, rhs)):
+            raise Unsupported(node)
+        return f"{self.operand(lhs)} {operator} {self.operand(rhs)}"
+
+    def operand(self, node: ASTNode) -> str:
+        if is_string(node):
+            assert isinstance(node, Literal)
+            return self.literal(node)
+        return self.nodes(node)
+
+    def number(self, node: ASTNode) -> str:
+        if isinstance(node, StaticFunctionCall):
+            if node.name not in NUMBER_FUNCTIONS or function_arguments(node):
+                raise Unsupported(node)
+            return f"{node.name}()"
+        assert isinstance(node, Literal)
+        return self.literal(node)
+
+    def literal(self, node: Literal) -> str:
+        value = node.value
+        if type(value) is bool:
+            return "true()" if value else "false()"
+        if type(value) is int:
+            return str(value)
+        if type(value) is float:
+            text = repr(value)
+            # XPath 1.0 numbers have no exponent, nor infinity
+            if not text.replace(".", "", 1).isdigit():
+                raise Unsupported(node)
+            return text
+        if type(value) is str:
+            # XPath 1.0 strings can not escape their quotes
+            if "'" not in value:
+                return f"'{value}'"
+            if '"' not in value:
+                return f'"{value}"'
+        raise Unsupported(node)
+
+
+def is_name(name: str) -> bool:
+    """
+    Whether the name is the same in XPath 1.0; names with a prefix would need the namespaces.
+    """
+    return bool(name) and ":" not in name and "{" not in name
+
+
+def translate(node: ASTNode) -> Optional[str]:
+    """
+    Returns the XPath 1.0 expression for the query, or None if it uses anything that means something else there.
+    """
+    try:
+        return Translator().translate(node)
+    except Unsupported:
+        return None
+
+
+LxmlQuery = Callable[[Any], List[Any]]
+
+_offloaded: "WeakKeyDictionary[ASTNode, Optional[LxmlQuery]]" = WeakKeyDictionary()
+
+# Whether queries over lxml documents are offloaded, see set_offload
+_enabled = XPath is not None
+
+
+def set_offload(enabled: bool) -> None:
+    """
+    Offloads the queries that can be to lxml when given lxml elements, the default when lxml is installed.
+    """
+    global _enabled
+    _enabled = enabled and XPath is not None
+
+
+def is_offloaded(data: Any) -> bool:
+    return _enabled and isinstance(data, LXMLElement)
+
+
+def compile_lxml_query(node: ASTNode) -> Optional[LxmlQuery]:
+    """
+    Returns a function evaluating the query against an lxml element with lxml, or None if it can not be translated.
+    Functions are cached for as long as the AST is alive.
+    """
+    try:
+        return _offloaded[node]
+    except KeyError:
+        pass
+    expression = translate(node)
+    function: Optional[LxmlQuery] = None
+    if expression is not None:
+        # Attribute values as plain strings, rather than ones referring back to their element
+        xpath = XPath(expression, smart_strings=False)
+
+        def function(element: Any) -> List[Any]:
+            result = xpath(element, **{TOP: element})
+            return result if type(result) is list else [result]
+
+    _offloaded[node] = function
+    return function
@@ -0,0 +1,205 @@
+"""
+Rewrites the AST of a query into an equivalent one that is cheaper to evaluate, between parsing and compiling.
+
+The rewrites are rules registered per AST node type, applied bottom-up, so a rule sees the already rewritten
+ children of its node. Every rule can be switched off with set_rule, ie. to compare plans or to rule one out
+ while tracking down a wrong result.
+"""
+
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+from weakref import WeakKeyDictionary
+
+from pyopath.closures import compare_atomics
+from pyopath.doer import FOCUS_FUNCTIONS, OPERATORS, is_positional
+from pyopath.xpath.AST.ast import (
+    AnyKindTest,
+    ASTNode,
+    AxisStep,
+    Context,
+    GeneralCompare,
+    IntersectExpr,
+    Literal,
+    PathOperator,
+    Predicate,
+    Root,
+    StaticFunctionCall,
+    UnionExpr,
+    ValueCompare,
+    make,
+    walk,
+)
+
+RULES = ("fold_constants", "fuse_descendant", "drop_true_predicates")
+_enabled: Set[str] = set(RULES)
+
+Rule = Callable[[Any], ASTNode]
+_rules: Dict[type, List[Tuple[str, Rule]]] = {}
+
+
+def set_rule(rule: str, enabled: bool) -> None:
+    """
+    Switches a rule on or off. Queries already compiled keep their plan, see pyopath.clear_cache.
+    """
+    assert rule in RULES, f"Unknown rule {rule}, expected one of {RULES}"
+    if enabled:
+        _enabled.add(rule)
+    else:
+        _enabled.discard(rule)
+
+
+def enabled_rules() -> FrozenSet[str]:
+    return frozenset(_enabled)
+
+
+def rewrites(node_type: type, rule: str):
+    """
+    Registers a function rewriting AST nodes of node_type, as part of the named rule.
+    It returns the node itself when there is nothing to rewrite.
+    """
+    assert rule in RULES, f"Unknown rule {rule}, expected one of {RULES}"
+
+    def register(function: Rule) -> Rule:
+        _rules.setdefault(node_type, []).append((rule, function))
+        return function
+
+    return register
+
+
+_optimized: "WeakKeyDictionary[ASTNode, Tuple[FrozenSet[str], ASTNode]]" = WeakKeyDictionary()
+
+
+def optimize(node: ASTNode, rules: Optional[Iterable[str]] = None) -> ASTNode:
+    """
+    Returns the rewritten AST, using the enabled rules unless told which to use.
+    Nodes are interned, so an AST with nothing to rewrite is returned as is.
+    """
+    active = frozenset(_enabled if rules is None else rules)
+    known = _optimized.get(node, None)
+    if known is not None and known[0] == active:
+        return known[1]
+    optimized = rewrite(node, active)
+    _optimized[node] = (active, optimized)
+    return optimized
+
+
+def rewrite(node: Any, rules: FrozenSet[str]) -> Any:
+    if isinstance(node, tuple):
+        return tuple(rewrite(value, rules) for value in node)
+    if not isinstance(node, ASTNode):
+        return node
+
+    values = tuple(getattr(node, name) for name in node.__dataclass_fields__)  # type: ignore
+    rewritten = rewrite(values, rules)
+    if any(new is not old for new, old in zip(rewritten, values)):
+        node = make(type(node), rewritten)
+
+    for rule, function in _rules.get(type(node), ()):
+        if rule in rules:
+            node = function(node)
+    return node
+
+
+def uses_focus(node: ASTNode) -> bool:
+    """
+    Whether the node calls position() or last() anywhere.
+    """
+    return any(isinstance(child, StaticFunctionCall) and child.name in FOCUS_FUNCTIONS for child in walk(node))
+
+
+def selects_nodes(node: ASTNode) -> bool:
+    """
+    Whether the value of the expression is always a sequence of nodes, which can not be mistaken for a position.
+    """
+    if isinstance(node, PathOperator):
+        return selects_nodes(node.b)
+    return isinstance(node, (AxisStep, Context, Root, UnionExpr, IntersectExpr))
+
+
+def first_step(node: ASTNode) -> ASTNode:
+    while isinstance(node, PathOperator):
+        node = node.a
+    return node
+
+
+def with_first_step(node: ASTNode, step: ASTNode) -> ASTNode:
+    """
+    The path with its first step replaced, a/b/c -> step/b/c.
+    """
+    if isinstance(node, PathOperator):
+        return PathOperator(with_first_step(node.a, step), node.b)
+    return step
+
+
+@rewrites(ValueCompare, "fold_constants")
+def fold_value_compare(node: ValueCompare) -> ASTNode:
+    """
+    2 eq 2 -> true
+    """
+    operator = OPERATORS.get(node.op, None)
+    if operator is None or not isinstance(node.lhs, Literal) or not isinstance(node.rhs, Literal):
+        return node
+    try:
+        return Literal(compare_atomics(node.lhs.value, node.rhs.value, operator))
+    except TypeError:
+        # Comparing a string with a number is an error, but only if it is evaluated
+        return node
+
+
+def is_true(predicate: Predicate) -> bool:
+    """
+    Whether the predicate keeps every item of the step.
+    """
+    expression = predicate.predicate
+    if isinstance(expression, Context):
+        # The items of an axis step are nodes
+        return True
+    if isinstance(expression, Literal) and not is_positional(predicate):
+        return bool(expression.value)
+    return False
+
+
+@rewrites(AxisStep, "drop_true_predicates")
+def drop_true_predicates(node: AxisStep) -> ASTNode:
+    """
+    a[.] -> a, a['x'] -> a
+    """
+    predicates = node.predicates or ()
+    kept = tuple(predicate for predicate in predicates if not is_true(predicate))
+    if len(kept) == len(predicates):
+        return node
+    return AxisStep(node.axis, node.nodetest, *kept)
+
+
+@rewrites(PathOperator, "fuse_descendant")
+def fuse_descendant(node: PathOperator) -> ASTNode:
+    """
+    x//y, ie. x/descendant-or-self::node()/child::y -> x/descendant::y
+
+    Predicates on y see the children of a single node, and would see all the descendants after fusing,
+     so it is only done for predicates that do not depend on positions.
+    """
+    lhs, step = node.a, node.b
+    if isinstance(step, PathOperator):
+        # x//(y/z), as the parser makes of //y/z, is (x//y)/z
+        first = first_step(step)
+        fused = fuse_descendant(PathOperator(lhs, first))
+        if fused is PathOperator(lhs, first):
+            return node
+        return with_first_step(step, fused)
+    if not isinstance(lhs, PathOperator) or not isinstance(step, AxisStep) or step.axis != "child":
+        return node
+    descendants = lhs.b
+    if not (
+        isinstance(descendants, AxisStep)
+        and descendants.axis == "descendant-or-self"
+        and isinstance(descendants.nodetest, AnyKindTest)
+        and not descendants.predicates
+    ):
+        return node
+    predicates = step.predicates or ()
+    for predicate in predicates:
+        if uses_focus(predicate.predicate) or not (
+            isinstance(predicate.predicate, (ValueCompare, GeneralCompare)) or selects_nodes(predicate.predicate)
+        ):
+            return node
+    return PathOperator(lhs.a, AxisStep("descendant", step.nodetest, *predicates))
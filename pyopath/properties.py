@@ -0,0 +1,157 @@
+"""
+Static properties of the sequences expressions produce, like Saxon's; whether the nodes are in document order,
+ without duplicates, and whether one can be an ancestor of another.
+
+The result of a path a/b is in document order, each node once, https://www.w3.org/TR/xpath-31/#id-path-operator.
+Evaluating b for each node of a and concatenating the results only gets that when
+ - a is a single node, and b gives its nodes in order, or
+ - a gives its nodes in order, none below another, and b only nodes at or below its context node, in order,
+so that the results of b for different nodes of a do not overlap and follow each other, ie. child::x/child::y.
+Other paths, like descendant::x/descendant::y or x/(/y), are sorted after evaluating, see doer.sorted_path.
+So is //x when the optimizer can not make it descendant::x, ie. //x[1]; descendant-or-self::node()/child::x gives
+ all the children of a node before any of theirs.
+
+Properties are of the sequence an expression produces for a single context item.
+"""
+
+from enum import IntFlag
+from typing import Dict
+from weakref import WeakKeyDictionary
+
+from pyopath.xpath.AST.ast import (
+    ASTNode,
+    AxisStep,
+    Context,
+    Expressions,
+    GeneralCompare,
+    IntersectExpr,
+    Literal,
+    PathOperator,
+    Root,
+    StaticFunctionCall,
+    UnionExpr,
+    ValueCompare,
+)
+
+
+class Properties(IntFlag):
+    NONE = 0
+    # The nodes are in document order
+    ORDERED = 1
+    # No node is there twice
+    NO_DUPLICATES = 2
+    # No node is an ancestor of another, Saxon's peer nodes
+    PEER = 4
+    # Only the context node and nodes below it, including attributes
+    SUBTREE = 8
+    # Only the context node itself and its attributes
+    LOCAL = 16
+    # At most one item
+    SINGLETON = 32
+    # Only atomic values, which a path does not sort
+    ATOMIC = 64
+    # A path whose results are sorted after evaluating, as they might not be in document order otherwise
+    SORTS = 128
+
+
+ORDERED = Properties.ORDERED
+NO_DUPLICATES = Properties.NO_DUPLICATES
+PEER = Properties.PEER
+SUBTREE = Properties.SUBTREE
+LOCAL = Properties.LOCAL
+SINGLETON = Properties.SINGLETON
+ATOMIC = Properties.ATOMIC
+SORTS = Properties.SORTS
+
+# In document order without duplicates
+SORTED = ORDERED | NO_DUPLICATES
+# A single item is trivially sorted, and no ancestor of another
+SINGLE = SINGLETON | SORTED | PEER
+
+AXIS_PROPERTIES: Dict[str, Properties] = {
+    "child": SORTED | PEER | SUBTREE,
+    # Attributes have no children
+    "attribute": SORTED | PEER | SUBTREE | LOCAL,
+    "self": SINGLE | SUBTREE | LOCAL,
+    "descendant": SORTED | SUBTREE,
+    "descendant-or-self": SORTED | SUBTREE,
+}
+
+# Functions of the focus, position() and last()
+FOCUS_FUNCTION_NAMES = ("position", "last")
+
+_properties: "WeakKeyDictionary[ASTNode, Properties]" = WeakKeyDictionary()
+
+
+def properties(node: ASTNode) -> Properties:
+    """
+    The properties of the sequence the expression produces for a single context item; NONE when nothing is known.
+    """
+    known = _properties.get(node, None)
+    if known is None:
+        known = _properties[node] = derive(node)
+    return known
+
+
+def derive(node: ASTNode) -> Properties:
+    if isinstance(node, AxisStep):
+        # Predicates only leave some of the nodes out
+        return AXIS_PROPERTIES.get(node.axis, Properties.NONE)
+    if isinstance(node, Context):
+        return SINGLE | SUBTREE | LOCAL
+    if isinstance(node, Root):
+        return SINGLE
+    if isinstance(node, (Literal, ValueCompare, GeneralCompare)):
+        return SINGLE | ATOMIC
+    if isinstance(node, StaticFunctionCall):
+        if node.name in FOCUS_FUNCTION_NAMES or node.name == "string":
+            return SINGLE | ATOMIC
+        if node.name == "key":
+            return SORTED
+        return Properties.NONE
+    if isinstance(node, UnionExpr):
+        return SORTED | (properties(node.a) & properties(node.b) & SUBTREE)
+    if isinstance(node, IntersectExpr):
+        # Only nodes of a
+        return SORTED | (properties(node.a) & SUBTREE)
+    if isinstance(node, Expressions):
+        if all(properties(expression) & ATOMIC for expression in node.expressions):
+            return ATOMIC
+        return Properties.NONE
+    if isinstance(node, PathOperator):
+        return path_properties(node)
+    return Properties.NONE
+
+
+def unsorted_path_properties(node: PathOperator) -> Properties:
+    """
+    The properties of the results of node.b for each item of node.a, concatenated.
+    """
+    lhs = properties(node.a)
+    rhs = properties(node.b)
+    if rhs & ATOMIC:
+        return ATOMIC | (lhs & rhs & SINGLETON)
+    common = lhs & rhs & (SUBTREE | LOCAL | SINGLETON)
+    if lhs & SINGLETON:
+        return common | (rhs & (SORTED | PEER))
+    if lhs & SORTED == SORTED and rhs & (SORTED | SUBTREE) == SORTED | SUBTREE and (lhs & PEER or rhs & LOCAL):
+        return common | SORTED | (lhs & rhs & PEER)
+    return common
+
+
+def path_properties(node: PathOperator) -> Properties:
+    """
+    The properties of the results of the path, which are sorted if they are not already.
+    """
+    unsorted = unsorted_path_properties(node)
+    if unsorted & ATOMIC or unsorted & SORTED == SORTED:
+        return unsorted
+    return unsorted | SORTED | SORTS
+
+
+def needs_sorting(node: PathOperator) -> bool:
+    """
+    Whether the results of the path have to be sorted into document order, and duplicates dropped.
+    Results that may be atomic values are checked for that when sorting.
+    """
+    return bool(properties(node) & SORTS)
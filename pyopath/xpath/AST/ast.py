@@ -1,12 +1,109 @@
 import sys
-from abc import ABC
+from abc import ABCMeta
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple, TypeVar, Union
+from typing import Any, Dict, Iterator, List, Optional, Tuple, TypeVar, Union
+from weakref import ref
 
 from typing_extensions import TypeAlias, dataclass_transform, get_args, get_origin
 
+# Hash-consing table, every AST node is unique for its type and field values.
+# Identical subtrees are therefore the same object, and equality is identity.
+# Holds weak references so that nodes die with the last AST using them.
+_interned: Dict[Tuple[Any, ...], "_InternRef"] = {}
 
-class ASTNode(ABC): ...
+
+class _InternRef(ref):  # type: ignore
+    """
+    Weak reference to an interned node, that knows its key in the table.
+    """
+
+    __slots__ = ("key",)
+
+
+def _forget(dead: _InternRef) -> None:
+    if _interned.get(dead.key, None) is dead:
+        _interned.pop(dead.key, None)
+
+
+def freeze(value: Any) -> Any:
+    """
+    Lists become tuples, all the way down, so that field values are hashable.
+    """
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(val) for val in value)
+    return value
+
+
+def make(cls: type, values: Tuple[Any, ...]) -> Any:
+    """
+    Hash-consing factory, returns the node of type cls with the given field values.
+    Bypasses __init__, which is what makes it suitable for deserialization.
+    """
+    for value in values:
+        if type(value) is list or type(value) is tuple:
+            values = freeze(values)
+            break
+    key = (cls,) + values
+    # Literal(1), Literal(1.0) and Literal(True) are equal and hash the same, but are different nodes
+    if cls.__numeric__:  # type: ignore
+        key += tuple(map(type, values))
+    existing = _interned.get(key, None)
+    if existing is not None:
+        node = existing()
+        if node is not None:
+            return node
+
+    node = object.__new__(cls)
+    for name, value in zip(cls.__dataclass_fields__, values):  # type: ignore
+        object.__setattr__(node, name, value)
+    reference = _InternRef(node, _forget)
+    reference.key = key
+    # setdefault is atomic, so concurrent parses still agree on a single node
+    existing = _interned.setdefault(key, reference)
+    if existing is not reference:
+        other = existing()
+        if other is not None:
+            return other
+        _interned[key] = reference
+    return node
+
+
+def walk(node: Any) -> Iterator[Any]:
+    """
+    Yields the node and every node below it, parents before children.
+    """
+    if isinstance(node, tuple):
+        for value in node:
+            yield from walk(value)
+    elif isinstance(node, (ASTNode, NodeTest)):
+        yield node
+        for name in getattr(node, "__dataclass_fields__", ()):
+            yield from walk(getattr(node, name))
+
+
+class Interned(ABCMeta):
+    """
+    Metaclass routing construction of dataclass nodes through the hash-consing factory.
+    """
+
+    def __call__(cls, *args: Any, **kwargs: Any) -> Any:
+        arguments = cls.__dict__.get("__arguments__", None)
+        if arguments is None:
+            return super().__call__(*args, **kwargs)
+        if kwargs:
+            node = super().__call__(*args, **kwargs)
+            return make(cls, tuple(getattr(node, name) for name in cls.__dataclass_fields__))  # type: ignore
+        if arguments is positional_arguments:
+            return make(cls, args)
+        return make(cls, arguments(*args))
+
+
+def positional_arguments(*args: Any) -> Tuple[Any, ...]:
+    return args
+
+
+class ASTNode(metaclass=Interned):
+    __slots__ = ("__weakref__",)
 
 
 if sys.version_info >= (3, 10):
@@ -17,7 +114,7 @@ if sys.version_info >= (3, 10):
 else:
 
     def get_annotations(typ: type) -> Dict[str, type]:
-        return getattr(typ, "__annotations__", {})  # type: ignore
+        return typ.__dict__.get("__annotations__", {})  # type: ignore
 
 
 def is_optional(typ: type) -> bool:
@@ -26,6 +123,12 @@ def is_optional(typ: type) -> bool:
     return origin is Union and type(None) in args
 
 
+def may_be_numeric(typ: Any) -> bool:
+    if typ in (int, float, bool, Any):
+        return True
+    return any(may_be_numeric(arg) for arg in get_args(typ))
+
+
 def stringify(a: Any):
     if isinstance(a, str):
         return f"'{a}'"
@@ -35,12 +138,10 @@ def stringify(a: Any):
 T = TypeVar("T", bound=type)
 
 
-@dataclass_transform()
+@dataclass_transform(frozen_default=True)
 def Pretty(cls: T) -> T:
     # Do actual dataclass init etc, with some extra lines to make the type checker behave, since dataclass ISNT marked with @dataclass_transform
     klass = type(cls)
-    cls = dataclass(cls)  # type: ignore
-    assert isinstance(cls, klass)
 
     annotations: Dict[str, type] = {}
     members: Tuple[str, ...] = tuple()
@@ -48,6 +149,22 @@ def Pretty(cls: T) -> T:
     if annotations:
         members = tuple(annotations.keys())
 
+    # Recreate the class with slots for the fields, like dataclass(slots=True) in 3.10+
+    namespace = dict(cls.__dict__)
+    namespace.pop("__dict__", None)
+    namespace.pop("__weakref__", None)
+    namespace["__slots__"] = members
+    # Maps constructor arguments to field values; classes with their own __init__ need to provide their own.
+    if "__arguments__" not in namespace:
+        assert "__init__" not in namespace, f"{cls.__name__} has a custom __init__ but no __arguments__"
+        namespace["__arguments__"] = positional_arguments
+    namespace["__numeric__"] = any(may_be_numeric(annotation) for annotation in annotations.values())
+    cls = klass(cls.__name__, cls.__bases__, namespace)  # type: ignore
+
+    # Nodes are immutable and interned, so equality and hashing stay identity based
+    cls = dataclass(frozen=True, eq=False)(cls)  # type: ignore
+    assert isinstance(cls, klass)
+
     def repr(selfy: object):
         myname: str = type(selfy).__name__
         values: List[str] = []
@@ -77,23 +194,17 @@ class Expressions(ASTNode):
     Represents a sequence of expressions, ie. the results are concatenated into a single sequence.
     """
 
-    expressions: List[ASTNode]
+    expressions: Tuple[ASTNode, ...]
 
 
 @Pretty
 class OrExpr(ASTNode):
-    expressions: List[ASTNode]
-
-    def __init__(self, expressions: List[ASTNode]):
-        self.expressions = expressions
+    expressions: Tuple[ASTNode, ...]
 
 
 @Pretty
 class AndExpr(ASTNode):
-    expressions: List[ASTNode]
-
-    def __init__(self, expressions: List[ASTNode]):
-        self.expressions = expressions
+    expressions: Tuple[ASTNode, ...]
 
 
 @Pretty
@@ -102,11 +213,6 @@ class ComparisonExpr(ASTNode):
     b: ASTNode
     op: str
 
-    def __init__(self, a: ASTNode, b: ASTNode, op: str):
-        self.a = a
-        self.b = b
-        self.op = op
-
 
 @Pretty
 class AdditiveExpr(ASTNode):
@@ -114,11 +220,6 @@ class AdditiveExpr(ASTNode):
     b: ASTNode
     op: str
 
-    def __init__(self, a: ASTNode, b: ASTNode, op: str):
-        self.a = a
-        self.b = b
-        self.op = op
-
 
 @Pretty
 class MultiplicativeExpr(ASTNode):
@@ -126,30 +227,26 @@ class MultiplicativeExpr(ASTNode):
     b: ASTNode
     op: str
 
-    def __init__(self, a: ASTNode, b: ASTNode, op: str):
-        self.a = a
-        self.b = b
-        self.op = op
-
 
 @Pretty
 class UnionExpr(ASTNode):
+    """
+    a | b, a union b; the nodes of both, in document order and without duplicates.
+    """
+
     a: ASTNode
     b: ASTNode
 
-    def __init__(self, a: ASTNode, b: ASTNode):
-        self.a = a
-        self.b = b
-
 
 @Pretty
 class IntersectExpr(ASTNode):
+    """
+    a intersect b, a except b; the nodes of a that are, or are not, in b, in document order and without duplicates.
+    """
+
     a: ASTNode
     b: ASTNode
-
-    def __init__(self, a: ASTNode, b: ASTNode):
-        self.a = a
-        self.b = b
+    op: str
 
 
 @Pretty
@@ -157,10 +254,6 @@ class UnaryExpr(ASTNode):
     expression: ASTNode
     sign: str
 
-    def __init__(self, expression: ASTNode, sign: str):
-        self.expression = expression
-        self.sign = sign
-
 
 @Pretty
 class PathOperator(ASTNode):
@@ -186,7 +279,7 @@ class StepExpr(ASTNode):
      working from left to right. A step may be either an axis step or a postfix expression.]
     """
 
-    ...
+    __slots__ = ()
 
 
 class ArgumentList: ...
@@ -206,9 +299,13 @@ class PostfixExpr(StepExpr):
     primary: ASTNode
     postfixes: Optional[Tuple[PostfixTypes, ...]]  # Can be either function calls, predicates, or lookups
 
+    @staticmethod
+    def __arguments__(primary: ASTNode, *postfixes: PostfixTypes) -> Tuple[Any, ...]:
+        return (primary, postfixes if len(postfixes) else None)
+
     def __init__(self, primary: ASTNode, *postfixes: PostfixTypes):
-        self.primary = primary
-        self.postfixes = postfixes if len(postfixes) else None
+        object.__setattr__(self, "primary", primary)
+        object.__setattr__(self, "postfixes", postfixes if len(postfixes) else None)
 
 
 @Pretty
@@ -229,16 +326,22 @@ class AxisStep(StepExpr):
     nodetest: "NodeTest"
     predicates: Optional[Tuple[Predicate, ...]]
 
+    @staticmethod
+    def __arguments__(axis: str, nodetest: "NodeTest", *predicates: Predicate) -> Tuple[Any, ...]:
+        return (axis, nodetest, predicates if len(predicates) else None)
+
     def __init__(self, axis: str, nodetest: "NodeTest", *predicates: Predicate):
-        self.axis = axis
-        self.nodetest = nodetest
-        self.predicates = predicates if len(predicates) else None
+        object.__setattr__(self, "axis", axis)
+        object.__setattr__(self, "nodetest", nodetest)
+        object.__setattr__(self, "predicates", predicates if len(predicates) else None)
 
 
-class NodeTest: ...
+class NodeTest(metaclass=Interned):
+    __slots__ = ("__weakref__",)
 
 
-class KindTest(NodeTest): ...
+class KindTest(NodeTest):
+    __slots__ = ()
 
 
 @Pretty
@@ -258,6 +361,13 @@ class TextTest(KindTest): ...
 class Context(ASTNode): ...
 
 
+@Pretty
+class Root(ASTNode):
+    """
+    The leading / of a path; the node at the top of the tree the context item is in.
+    """
+
+
 @Pretty
 class Literal(ASTNode):
     value: Union[str, int, float]
@@ -271,7 +381,7 @@ class VarRef(ASTNode):
 @Pretty
 class StaticFunctionCall(ASTNode):
     name: str
-    arguments: List[Expressions]
+    arguments: Tuple[Any, ...]
 
 
 @Pretty
@@ -0,0 +1,14 @@
+"""
+Regenerates the LALR tables shipped in parsetab.py.
+
+    python -m pyopath.xpath.AST.build_tables [--debug]
+
+--debug also writes the grammar report parser.out next to the tables.
+"""
+
+import sys
+
+from pyopath.xpath.AST.parser import build_tables
+
+if __name__ == "__main__":
+    build_tables(debug="--debug" in sys.argv)
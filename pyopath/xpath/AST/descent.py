@@ -0,0 +1,331 @@
+"""
+Hand-written recursive descent parser for the grammar in PathParser.
+
+Produces the exact same AST as the ply backend, quirks included; the two are kept in sync
+by tests/test_xpath_parser_backends.py. Every grammar rule of PathParser maps to a
+parse_<rule> method here, and the "Not implemented" assertions are raised in the same places.
+"""
+
+from typing import Any, List, Optional, Tuple, Union
+
+from pyopath.xpath.AST.ast import (
+    AnyKindTest,
+    ASTNode,
+    AxisStep,
+    Context,
+    Expressions,
+    GeneralCompare,
+    IntersectExpr,
+    Literal,
+    NameTest,
+    NodeCompare,
+    NodeTest,
+    PathOperator,
+    PostfixExpr,
+    Predicate,
+    Root,
+    StaticFunctionCall,
+    TextTest,
+    UnionExpr,
+    ValueCompare,
+    VarRef,
+)
+from pyopath.xpath.AST.lexer import lex
+
+FORWARD_AXES = frozenset(
+    (
+        "CHILD",
+        "DESCENDANT",
+        "ATTRIBUTE",
+        "SELF",
+        "DESCENDANT_OR_SELF",
+        "FOLLOWING_SIBLING",
+        "FOLLOWING",
+        "NAMESPACE",
+    )
+)
+REVERSE_AXES = frozenset(("PARENT", "ANCESTOR", "PRECEDING_SIBLING", "PRECEDING", "ANCESTOR_OR_SELF"))
+KIND_TESTS = frozenset(("ELEMENT", "ATTRIBUTE", "TEXT", "NODE"))
+
+VALUE_COMPARISONS = frozenset(("EQstr", "NEstr", "LTstr", "LEstr", "GTstr", "GEstr"))
+GENERAL_COMPARISONS = frozenset(("EQsym", "NEsym", "LTsym", "LEsym", "GTsym", "GEsym"))
+NODE_COMPARISONS = frozenset(("IS",))
+
+# Tokens that can start a RelativePathExpr, used to tell `/` from `/a`
+STEP_START = (
+    FORWARD_AXES
+    | REVERSE_AXES
+    | KIND_TESTS
+    | frozenset(("DOUBLEDOT", "@", "EQNAME", "*", "STRING", "NUMBER", "CONTEXT", "$", "("))
+)
+
+
+class DescentParser:
+    tokens: List[Any]
+    pos: int
+
+    def __init__(self, tokens: List[Any]):
+        self.tokens = tokens
+        self.pos = 0
+
+    def peek(self, offset: int = 0) -> Optional[str]:
+        index = self.pos + offset
+        if index < len(self.tokens):
+            return self.tokens[index].type
+        return None
+
+    def next(self) -> Any:
+        token = self.tokens[self.pos]
+        self.pos += 1
+        return token
+
+    def expect(self, typ: str) -> Any:
+        if self.peek() != typ:
+            self.error()
+        return self.next()
+
+    def error(self):
+        token = self.tokens[self.pos] if self.pos < len(self.tokens) else None
+        raise RuntimeError(f"ERROR!! {token}")
+
+    def parse_Path(self) -> ASTNode:
+        result = self.parse_Expr()
+        if self.peek() is not None:
+            self.error()
+        return result
+
+    def parse_Expr(self) -> ASTNode:
+        expressions = [self.parse_ExprSingle()]
+        while self.peek() == ",":
+            self.next()
+            expressions.append(self.parse_ExprSingle())
+        if len(expressions) > 1:
+            return Expressions(expressions)
+        return expressions[0]
+
+    def parse_ExprSingle(self) -> ASTNode:
+        return self.parse_OrExpr()
+
+    def parse_OrExpr(self) -> ASTNode:
+        lhs = self.parse_AndExpr()
+        if self.peek() == "OR":
+            self.next()
+            self.parse_AndExpr()
+            assert False, "Not implemented"
+        return lhs
+
+    def parse_AndExpr(self) -> ASTNode:
+        lhs = self.parse_ComparisonExpr()
+        if self.peek() == "AND":
+            self.next()
+            self.parse_ComparisonExpr()
+            assert False, "Not implemented"
+        return lhs
+
+    def parse_ComparisonExpr(self) -> ASTNode:
+        lhs = self.parse_StringConcatExpr()
+        typ = self.peek()
+        if typ in VALUE_COMPARISONS:
+            op = self.next().value
+            return ValueCompare(lhs, self.parse_StringConcatExpr(), op.strip())
+        if typ in GENERAL_COMPARISONS:
+            op = self.next().value
+            return GeneralCompare(lhs, self.parse_StringConcatExpr(), op.strip())
+        if typ in NODE_COMPARISONS:
+            op = self.next().value
+            return NodeCompare(lhs, self.parse_StringConcatExpr(), op.strip())
+        return lhs
+
+    def parse_StringConcatExpr(self) -> ASTNode:
+        lhs = self.parse_RangeExpr()
+        if self.peek() == "CONCAT":
+            while self.peek() == "CONCAT":
+                self.next()
+                self.parse_RangeExpr()
+            assert False, "Not implemented"
+        return lhs
+
+    def parse_RangeExpr(self) -> ASTNode:
+        lhs = self.parse_AdditiveExpr()
+        if self.peek() == "TO":
+            self.next()
+            self.parse_AdditiveExpr()
+            assert False, "Not implemented"
+        return lhs
+
+    def parse_AdditiveExpr(self) -> ASTNode:
+        lhs = self.parse_MultiplicativeExpr()
+        if self.peek() in ("+", "-"):
+            self.next()
+            self.parse_MultiplicativeExpr()
+            assert False, "Not implemented"
+        return lhs
+
+    def parse_MultiplicativeExpr(self) -> ASTNode:
+        lhs = self.parse_UnionExpr()
+        if self.peek() in ("*", "DIV", "IDIV", "MOD"):
+            self.next()
+            self.parse_UnionExpr()
+            assert False, "Not implemented"
+        return lhs
+
+    def parse_UnionExpr(self) -> ASTNode:
+        lhs = self.parse_IntersectExceptExpr()
+        while self.peek() in ("UNION", "|"):
+            self.next()
+            lhs = UnionExpr(lhs, self.parse_IntersectExceptExpr())
+        return lhs
+
+    def parse_IntersectExceptExpr(self) -> ASTNode:
+        lhs = self.parse_UnaryExpr()
+        while self.peek() in ("INTERSECT", "EXCEPT"):
+            op = self.next().value
+            lhs = IntersectExpr(lhs, self.parse_UnaryExpr(), op.strip())
+        return lhs
+
+    def parse_UnaryExpr(self) -> ASTNode:
+        if self.peek() in ("+", "-"):
+            self.next()
+            self.parse_ValueExpr()
+            assert False, "Not implemented"
+        return self.parse_ValueExpr()
+
+    def parse_ValueExpr(self) -> ASTNode:
+        typ = self.peek()
+        if typ == "SLASH":
+            self.next()
+            if self.peek() in STEP_START:
+                return PathOperator(Root(), self.parse_RelativePathExpr())
+            return Root()
+        if typ == "DOUBLESLASH":
+            self.next()
+            return PathOperator(
+                PathOperator(Root(), AxisStep("descendant-or-self", AnyKindTest())), self.parse_RelativePathExpr()
+            )
+        return self.parse_RelativePathExpr()
+
+    def parse_RelativePathExpr(self) -> ASTNode:
+        lhs = self.parse_StepExpr()
+        while True:
+            typ = self.peek()
+            if typ == "SLASH":
+                self.next()
+                lhs = PathOperator(lhs, self.parse_StepExpr())
+            elif typ == "DOUBLESLASH":
+                self.next()
+                lhs = PathOperator(
+                    PathOperator(lhs, AxisStep("descendant-or-self", AnyKindTest())), self.parse_StepExpr()
+                )
+            else:
+                return lhs
+
+    def parse_StepExpr(self) -> ASTNode:
+        typ = self.peek()
+        if typ in FORWARD_AXES or typ in REVERSE_AXES:
+            axis = self.next().value
+            self.expect("AXIS")
+            return self.parse_AxisStep(axis, self.parse_NodeTest())
+        if typ == "DOUBLEDOT":
+            self.next()
+            assert False, "Not implemented"
+        if typ == "@":
+            self.next()
+            return self.parse_AxisStep("attribute", self.parse_NodeTest())
+        if typ == "EQNAME" and self.peek(1) == "(":
+            return self.parse_PostfixExpr()
+        if typ in KIND_TESTS or typ in ("EQNAME", "*"):
+            return self.parse_AxisStep("child", self.parse_NodeTest())
+        return self.parse_PostfixExpr()
+
+    def parse_AxisStep(self, axis: str, nodetest: NodeTest) -> AxisStep:
+        return AxisStep(axis, nodetest, *self.parse_PredicateList())
+
+    def parse_PredicateList(self) -> List[Predicate]:
+        predicates: List[Predicate] = []
+        while self.peek() == "[":
+            self.next()
+            predicates.append(Predicate(self.parse_Expr()))
+            self.expect("]")
+        return predicates
+
+    def parse_NodeTest(self) -> NodeTest:
+        typ = self.peek()
+        if typ in ("ELEMENT", "ATTRIBUTE"):
+            self.next()
+            self.expect("(")
+            if self.peek() != ")":
+                if self.peek() not in ("EQNAME", "*"):
+                    self.error()
+                self.next()
+            self.expect(")")
+            if typ == "ELEMENT":
+                assert False, "Not implemented yet"
+            assert False, "Not implemented"
+        if typ == "TEXT":
+            self.next()
+            self.expect("(")
+            self.expect(")")
+            return TextTest()
+        if typ == "NODE":
+            self.next()
+            self.expect("(")
+            self.expect(")")
+            assert False, "Not implemented"
+        if typ in ("EQNAME", "*"):
+            return NameTest(self.next().value)
+        self.error()
+        assert False, "unreachable"
+
+    def parse_PostfixExpr(self) -> ASTNode:
+        primary = self.parse_PrimaryExpr()
+        predicates = self.parse_PredicateList()
+        if predicates:
+            return PostfixExpr(primary, *predicates)
+        return primary
+
+    def parse_PrimaryExpr(self) -> Union[ASTNode, str]:
+        typ = self.peek()
+        if typ == "STRING":
+            return Literal(self.next().value)
+        if typ == "NUMBER":
+            value = self.next().value
+            try:
+                return Literal(int(value))
+            except ValueError:
+                return Literal(float(value))
+        if typ == "CONTEXT":
+            self.next()
+            return Context()
+        if typ == "$":
+            self.next()
+            return VarRef(self.expect("EQNAME").value)
+        if typ == "(":
+            self.next()
+            if self.peek() == ")":
+                # Same as the ply backend, an empty parenthesized expression yields the closing paren.
+                return self.next().value
+            expression = self.parse_Expr()
+            self.expect(")")
+            return expression
+        if typ == "EQNAME" and self.peek(1) == "(":
+            name = self.next().value
+            return StaticFunctionCall(name, self.parse_ArgumentList())
+        self.error()
+        assert False, "unreachable"
+
+    def parse_ArgumentList(self) -> Tuple[Any, ...]:
+        self.expect("(")
+        if self.peek() == ")":
+            self.next()
+            return ("ARGLIST", "(", ")")
+        arguments = [[self.parse_ExprSingle()]]
+        while self.peek() == ",":
+            self.next()
+            arguments.append([self.parse_ExprSingle()])
+        self.expect(")")
+        return ("ARGLIST", "(", arguments, ")")
+
+
+def parse(input: str) -> ASTNode:
+    parser = DescentParser(list(lex(input)))
+    return parser.parse_Path()
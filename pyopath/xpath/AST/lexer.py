@@ -1,4 +1,5 @@
-from typing import Generator
+import re
+from typing import Generator, Iterator, Optional
 
 import ply.lex
 
@@ -59,9 +60,9 @@ class PathLexer:
     t_IDIV = r"\bidiv\b"
     t_MOD = r"\bmod\b"
 
-    t_UNION = r"\bunion\b"
-    t_INTERSECT = r"\bintersect\b"
-    t_EXCEPT = r"\bexcept\b"
+    t_UNION = r"\s+union\s+"
+    t_INTERSECT = r"\s+intersect\s+"
+    t_EXCEPT = r"\s+except\s+"
 
     t_CHILD = r"\bchild\b"
     t_DESCENDANT = r"\bdescendant\b"
@@ -112,7 +113,7 @@ class PathLexer:
 
     t_NUMBER = r"[+-]?\d+(\.\d*)?"
 
-    literals = "{}[]()@$"
+    literals = "{}[]()@$,|"
 
     def t_EQNAME(self, t):
         r"[a-zA-Z]\w*"
@@ -132,8 +133,133 @@ class PathLexer:
         raise ValueError(msg)
 
 
-def lex(input: str) -> Generator[ply.lex.LexToken, None, None]:
-    lexer: ply.lex.Lexer = ply.lex.lex(object=PathLexer())  # type: ignore
+class Token:
+    """
+    Same shape as ply.lex.LexToken, so the ply parser can consume it.
+    """
+
+    __slots__ = ("type", "value", "lineno", "lexpos", "lexer")
+
+    def __init__(self, type: str, value: str, lexpos: int):
+        self.type = type
+        self.value = value
+        self.lineno = 1
+        self.lexpos = lexpos
+
+    def __repr__(self) -> str:
+        return f"LexToken({self.type},{self.value!r},{self.lineno},{self.lexpos})"
+
+    __str__ = __repr__
+
+
+# The rules of PathLexer folded into a single regex, in the order ply would try them.
+# Keywords are never matched by their own rules since EQNAME comes first, and the
+#  whitespace-delimited operators share one alternative so the regex engine only
+#  backtracks out of the leading whitespace once.
+MASTER_PATTERN = re.compile(
+    r"""
+    (?P<STRING>"(?:[^\\\n"]|\\.)*"|'(?:[^\\\n']|\\.)*')
+    |(?P<EQNAME>[a-zA-Z]\w*)
+    |(?P<NUMBER>[+-]?\d+(?:\.\d*)?)
+    |(?P<WORD>\s+(?:to|eq|ne|lt|le|gt|ge|union|intersect|except)\s+)
+    |(?P<CONCAT>\|\|)
+    |(?P<DOUBLESLASH>//)
+    |(?P<SLASH>/)
+    |(?P<AXIS>::)
+    |(?P<DOUBLEDOT>\.\.)
+    |(?P<CONTEXT>\.)
+    |(?P<EQsym>==?)
+    |(?P<NEsym>!=)
+    |(?P<LEsym><=)
+    |(?P<LTsym><)
+    |(?P<GEsym>>=)
+    |(?P<GTsym>>)
+    |(?P<LITERAL>[{}\[\](),@$|])
+    """,
+    re.VERBOSE,
+)
+
+WORD_TYPES = {
+    "to": "TO",
+    "eq": "EQstr",
+    "ne": "NEstr",
+    "lt": "LTstr",
+    "le": "LEstr",
+    "gt": "GTstr",
+    "ge": "GEstr",
+    "union": "UNION",
+    "intersect": "INTERSECT",
+    "except": "EXCEPT",
+}
+AXIS_TYPES = {name: name.replace("-", "_").upper() for name in PathLexer.AxisNames}
+TEST_TYPES = {name: name.replace("-", "_").upper() for name in PathLexer.TestNames}
+
+
+class Tokenizer:
+    """
+    Single pass lexer producing the same tokens as PathLexer.
+    Axis and kind-test names are told apart from plain names by peeking at the next character,
+     rather than by cloning the lexer and lexing the next token.
+    Implements the input()/token() pair that ply's parser expects from a lexer.
+    """
+
+    data: str
+    pos: int
+
+    def __init__(self, data: str = ""):
+        self.input(data)
+
+    def input(self, data: str) -> None:
+        self.data = data
+        self.pos = 0
+
+    def token(self) -> Optional[Token]:
+        data = self.data
+        pos = self.pos
+        if pos >= len(data):
+            return None
+        match = MASTER_PATTERN.match(data, pos)
+        if match is None:
+            raise ValueError(f"Illegal character '{data[pos]}'")
+        end = match.end()
+        self.pos = end
+        kind = match.lastgroup
+        value = match.group()
+        if kind == "EQNAME":
+            if value in AXIS_TYPES and data.startswith("::", end):
+                kind = AXIS_TYPES[value]
+            elif value in TEST_TYPES and data.startswith("(", end):
+                kind = TEST_TYPES[value]
+        elif kind == "STRING":
+            return Token(kind, value[1:-1], pos)
+        elif kind == "WORD":
+            kind = WORD_TYPES[value.strip()]
+        elif kind == "LITERAL":
+            kind = value
+        return Token(kind, value, pos)  # type: ignore
+
+    def __iter__(self) -> Iterator[Token]:
+        token = self.token()
+        while token is not None:
+            yield token
+            token = self.token()
+
+
+def lex(input: str) -> Iterator[Token]:
+    return iter(Tokenizer(input))
+
+
+_ply_lexer: Optional[ply.lex.Lexer] = None
+
+
+def ply_lex(input: str) -> Generator[ply.lex.LexToken, None, None]:
+    """
+    The reference ply lexer built from PathLexer; kept for differential testing and benchmarks.
+    """
+    global _ply_lexer
+    if _ply_lexer is None:
+        _ply_lexer = ply.lex.lex(object=PathLexer())  # type: ignore
+    lexer = _ply_lexer.clone()  # type: ignore
     lexer.input(input)  # type: ignore
     for token in lexer:  # type: ignore
         yield token
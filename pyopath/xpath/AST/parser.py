@@ -1,5 +1,10 @@
+import sys
+from threading import Lock
+from typing import Optional
+
 import ply.yacc
 
+from pyopath.xpath.AST import descent
 from pyopath.xpath.AST.ast import (
     AnyKindTest,
     ASTNode,
@@ -7,18 +12,21 @@ from pyopath.xpath.AST.ast import (
     Context,
     Expressions,
     GeneralCompare,
+    IntersectExpr,
     Literal,
     NameTest,
     NodeCompare,
     PathOperator,
     PostfixExpr,
     Predicate,
+    Root,
     StaticFunctionCall,
     TextTest,
+    UnionExpr,
     ValueCompare,
     VarRef,
 )
-from pyopath.xpath.AST.lexer import PathLexer
+from pyopath.xpath.AST.lexer import PathLexer, Tokenizer
 
 # https://www.w3.org/TR/xpath-31/#id-expressions
 
@@ -87,11 +95,11 @@ class PathParser:
         """
         if len(p) > 2:
             if p[2][0] == "VALUE":
-                p[0] = ValueCompare(p[3], p[1], p[2][1].strip())
+                p[0] = ValueCompare(p[1], p[3], p[2][1].strip())
             elif p[2][0] == "GENERAL":
-                p[0] = GeneralCompare(p[3], p[1], p[2][1].strip())
+                p[0] = GeneralCompare(p[1], p[3], p[2][1].strip())
             elif p[2][0] == "NODE":
-                p[0] = NodeCompare(p[3], p[1], p[2][1].strip())
+                p[0] = NodeCompare(p[1], p[3], p[2][1].strip())
             else:
                 assert False, f"What is this? {p[2]}"
         else:
@@ -188,25 +196,23 @@ class PathParser:
 
     def p_UnionExpr(self, p):
         """
-        UnionExpr : IntersectExceptExpr UNION IntersectExceptExpr
-                  | IntersectExceptExpr '|' IntersectExceptExpr
+        UnionExpr : UnionExpr UNION IntersectExceptExpr
+                  | UnionExpr '|' IntersectExceptExpr
                   | IntersectExceptExpr
         """
         if len(p) > 2:
-            assert False, "Not implemented"
-            p[0] = ("UNION", p[1], p[2], p[3])
+            p[0] = UnionExpr(p[1], p[3])
         else:
             p[0] = p[1]
 
     def p_IntersectExceptExpr(self, p):
         """
-        IntersectExceptExpr : UnaryExpr INTERSECT UnaryExpr
-                            | UnaryExpr EXCEPT UnaryExpr
+        IntersectExceptExpr : IntersectExceptExpr INTERSECT UnaryExpr
+                            | IntersectExceptExpr EXCEPT UnaryExpr
                             | UnaryExpr
         """
         if len(p) > 2:
-            assert False, "Not implemented"
-            p[0] = ("INTERSECT", p[1], p[2], p[3])
+            p[0] = IntersectExpr(p[1], p[3], p[2].strip())
         else:
             p[0] = p[1]
 
@@ -222,9 +228,7 @@ class PathParser:
         else:
             p[0] = p[1]
 
-    def p_ValueExpr(
-        self, p
-    ):  # Not represented in AST; Parser should insert <root>/, <root>, <root//> in place of the leading relatives.
+    def p_ValueExpr(self, p):  # The leading / and // become paths from Root
         """
         ValueExpr : SLASH RelativePathExpr
                   | SLASH
@@ -233,15 +237,12 @@ class PathParser:
         """
         if len(p) > 2:
             if p[1] == "/":
-                assert False, "Not implemented"
-                p[0] = ("ROOT", p[2])
+                p[0] = PathOperator(Root(), p[2])
             elif p[1] == "//":
-                assert False, "Not implemented"
-                p[0] = ("DESCENCANTS", p[2])
+                p[0] = PathOperator(PathOperator(Root(), AxisStep("descendant-or-self", AnyKindTest())), p[2])
         else:
             if p[1] == "/":
-                assert False, "Not implemented"
-                p[0] = "ROOT"
+                p[0] = Root()
             else:
                 p[0] = p[1]
 
@@ -553,7 +554,7 @@ class PathParser:
 
     def p_Argument(self, p):
         """
-        Argument : Expr
+        Argument : ExprSingle
         """
         p[0] = p[1:]
 
@@ -603,11 +604,95 @@ class PathParser:
         raise RuntimeError(msg)
 
 
-def parse(input: str, debug_yacc: bool = True, debug_parse: bool = False, debug: bool = False) -> ASTNode:
-    lexa = PathLexer()
-    lexer: ply.lex.Lexer = ply.lex.lex(object=lexa)  # type: ignore
+TABLE_MODULE = "pyopath.xpath.AST.parsetab"
+
+_parser_lock = Lock()
+_parser: Optional[ply.yacc.LRParser] = None
+
+
+def build_parser(write_tables: bool = False, debug: bool = False, outputdir: Optional[str] = None) -> ply.yacc.LRParser:
+    """
+    Builds a parser from the prebuilt tables in parsetab.py.
+    Should the tables be out of date with the grammar, ply regenerates them in memory,
+     and only writes them back out if write_tables is set.
+    """
     path_parser = PathParser()
-    path_parser.tokens = lexa.tokens  # type: ignore
-    parser: ply.yacc.LRParser = ply.yacc.yacc(module=path_parser, write_tables=True, debug=debug or debug_yacc)
+    path_parser.tokens = PathLexer.tokens  # type: ignore
+    return ply.yacc.yacc(
+        module=path_parser,
+        tabmodule=TABLE_MODULE,
+        outputdir=outputdir,
+        write_tables=write_tables,
+        debug=debug,
+        errorlog=ply.yacc.PlyLogger(sys.stderr) if (write_tables or debug) else ply.yacc.NullLogger(),
+    )
+
 
-    return parser.parse(input, lexer=lexer, debug=debug or debug_parse)
+def build_tables(outputdir: Optional[str] = None, debug: bool = False) -> None:
+    """
+    Regenerates parsetab.py (and parser.out when debug is set).
+    Run `python -m pyopath.xpath.AST.build_tables` after changing the grammar.
+    """
+    try:
+        import pyopath.xpath.AST.parsetab as parsetab
+
+        # Invalidate the current tables so that ply doesn't just load them and return
+        parsetab._lr_signature = None
+    except ImportError:
+        pass
+    build_parser(write_tables=True, debug=debug, outputdir=outputdir)
+
+
+def get_parser() -> ply.yacc.LRParser:
+    """
+    Returns the process-wide parser, building it on first use.
+    """
+    global _parser
+    if _parser is None:
+        with _parser_lock:
+            if _parser is None:
+                _parser = build_parser()
+    return _parser
+
+
+BACKENDS = ("ply", "descent")
+_default_backend = "descent"
+
+
+def set_default_backend(backend: str) -> None:
+    """
+    Selects the parser used by parse() when no backend is given; "ply" or "descent".
+    """
+    global _default_backend
+    assert backend in BACKENDS, f"Unknown parser backend {backend}, expected one of {BACKENDS}"
+    _default_backend = backend
+
+
+def get_default_backend() -> str:
+    return _default_backend
+
+
+def parse(
+    input: str,
+    debug_yacc: bool = False,
+    debug_parse: bool = False,
+    debug: bool = False,
+    backend: Optional[str] = None,
+) -> ASTNode:
+    """
+    Parses the expression into an AST.
+    The debug flags only apply to, and imply, the ply backend.
+    """
+    backend = backend or _default_backend
+    if debug or debug_yacc or debug_parse:
+        backend = "ply"
+
+    if backend == "descent":
+        return descent.parse(input)
+    assert backend == "ply", f"Unknown parser backend {backend}, expected one of {BACKENDS}"
+
+    parser = get_parser()
+    if debug or debug_yacc:
+        parser = build_parser(debug=True)
+
+    return parser.parse(input, lexer=Tokenizer(), debug=debug or debug_parse)
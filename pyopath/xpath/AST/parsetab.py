@@ -0,0 +1,155 @@
+
+# parsetab.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = "left,leftORleftANDnonassocEQstrEQsymNEstrNEsymLTstrLTsymLEstrLEsymGTstrGTsymGEstrGEsymISleftCONCATnonassocTOleft+-left*DIVIDIVMODleft|UNIONleftINTERSECTEXCEPTrightUNARYSUMleftSLASHDOUBLESLASHleft[]ANCESTOR ANCESTOR_OR_SELF AND ATTRIBUTE AXIS CHILD CONCAT CONTEXT DESCENDANT DESCENDANT_OR_SELF DIV DOUBLEDOT DOUBLESLASH ELEMENT EQNAME EQstr EQsym EXCEPT FOLLOWING FOLLOWING_SIBLING GEstr GEsym GTstr GTsym IDIV INTERSECT IS LEstr LEsym LTstr LTsym MOD NAMESPACE NEstr NEsym NODE NUMBER OR PARENT PRECEDING PRECEDING_SIBLING SELF SLASH STRING TEXT TO UNION\n        path : Expr\n        \n        Expr : ExprList\n        \n        ExprList : ExprSingle\n                 | ExprList ',' ExprSingle\n        \n        ExprSingle : OrExpr\n        \n        OrExpr : AndExpr OR AndExpr\n               | AndExpr\n        \n        AndExpr : ComparisonExpr AND ComparisonExpr\n                | ComparisonExpr\n        \n        ComparisonExpr : StringConcatExpr ValueComp StringConcatExpr\n                       | StringConcatExpr GeneralComp StringConcatExpr\n                       | StringConcatExpr NodeComp StringConcatExpr\n                       | StringConcatExpr\n        \n        StringConcatExpr : StringConcatList\n        \n        StringConcatList : StringConcatList CONCAT RangeExpr\n                         | RangeExpr\n        \n        RangeExpr : AdditiveExpr TO AdditiveExpr\n                  | AdditiveExpr\n        \n        ValueComp : EQstr\n                  | NEstr\n                  | LTstr\n                  | LEstr\n                  | GTstr\n                  | GEstr\n        \n        GeneralComp : EQsym\n                    | NEsym\n                    | LTsym\n                    | LEsym\n                    | GTsym\n                    | GEsym\n        \n        NodeComp : IS\n        \n        AdditiveExpr : MultiplicativeExpr '+' MultiplicativeExpr\n                     | MultiplicativeExpr '-' MultiplicativeExpr\n                     | MultiplicativeExpr\n        \n        MultiplicativeExpr : UnionExpr '*' UnionExpr\n                           | UnionExpr DIV UnionExpr\n                           | UnionExpr IDIV UnionExpr\n                           | UnionExpr MOD UnionExpr\n                           | UnionExpr\n        \n        UnionExpr : UnionExpr UNION IntersectExceptExpr\n                  | UnionExpr '|' IntersectExceptExpr\n                  | IntersectExceptExpr\n        \n        IntersectExceptExpr : IntersectExceptExpr INTERSECT UnaryExpr\n                            | IntersectExceptExpr EXCEPT UnaryExpr\n                            | UnaryExpr\n        \n        UnaryExpr : '+' ValueExpr %prec UNARYSUM\n                  | '-' ValueExpr %prec UNARYSUM\n                  | ValueExpr\n        \n        ValueExpr : SLASH RelativePathExpr\n                  | SLASH\n                  | DOUBLESLASH RelativePathExpr\n                  | RelativePathExpr\n        \n        RelativePathExpr : RelativePathList\n\n        \n        RelativePathList : StepExpr\n                         | RelativePathList SLASH StepExpr\n                         | RelativePathList DOUBLESLASH StepExpr\n        \n        StepExpr : PostfixExpr\n                 | AxisStep\n        \n        PostfixExpr : PrimaryExpr PostfixListChain\n                    | PrimaryExpr\n        \n        PostfixListChain : Predicate\n                         | PostfixListChain Predicate\n        \n        AxisStep : ReverseStep PredicateList\n                 | ForwardStep PredicateList\n        \n        PredicateList : Predicate\n                      | PredicateList Predicate\n                      |\n        \n        Predicate : '[' Expr ']'\n        \n        ReverseStep : ReverseAxis NodeTest\n                    | AbbrevReverseStep\n        \n        ReverseAxis : PARENT AXIS\n                    | ANCESTOR AXIS\n                    | PRECEDING_SIBLING AXIS\n                    | PRECEDING AXIS\n                    | ANCESTOR_OR_SELF AXIS\n        \n        AbbrevReverseStep : DOUBLEDOT\n        \n        ForwardStep : ForwardAxis NodeTest\n                    | AbbrevForwardStep\n        \n        ForwardAxis : CHILD AXIS\n                    | DESCENDANT AXIS\n                    | ATTRIBUTE AXIS\n                    | SELF AXIS\n                    | DESCENDANT_OR_SELF AXIS\n                    | FOLLOWING_SIBLING AXIS\n                    | FOLLOWING AXIS\n                    | NAMESPACE AXIS\n        \n        AbbrevForwardStep : '@' NodeTest\n                          | NodeTest\n        \n        NodeTest : KindTest\n                 | NameTest\n        \n        KindTest : ElementTest\n                 | AttributeTest\n                 | TextTest\n                 | AnyKindTest\n        \n        ElementTest : ELEMENT '(' ElementNameOrWildcard ')'\n                    | ELEMENT '(' ')'\n        \n        ElementNameOrWildcard : ElementName\n                              | '*'\n        \n        ElementName : EQNAME\n        \n        AttributeTest : ATTRIBUTE '(' AttributeNameOrWildcard ')'\n                      | ATTRIBUTE '(' ')'\n        \n        AttributeNameOrWildcard : AttributeName\n                                | '*'\n        \n        AttributeName : EQNAME\n        \n        TextTest : TEXT '(' ')'\n        \n        AnyKindTest : NODE '(' ')'\n        \n        NameTest : EQNAME\n                 | '*'\n        \n        PrimaryExpr : Literal\n        \n        PrimaryExpr : ParenthesizedExpr\n        \n        PrimaryExpr : CONTEXT\n        \n        PrimaryExpr : VarRef\n                    | FunctionCall\n\n        \n        Literal : STRING\n        \n        Literal : NUMBER\n        \n        VarRef : '$' VarName\n        VarName : EQNAME\n        ParenthesizedExpr : '(' ')'\n                          | '(' Expr ')'\n        \n        FunctionCall : EQNAME ArgumentList\n        \n        ArgumentList : '(' ')'\n        ArgumentList : '(' ArgumentExpr ')'\n        \n        ArgumentExpr : Argument\n        \n        ArgumentExpr : ArgumentExpr ',' Argument\n        \n        Argument : ExprSingle\n        "
+    
+_lr_action_items = {'+':([0,12,15,16,17,18,19,20,21,23,24,25,26,27,28,29,30,31,32,33,34,36,37,39,40,41,42,44,50,60,61,62,63,64,65,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,106,107,108,109,110,111,112,113,115,116,118,119,120,121,136,150,151,152,153,154,155,156,157,158,159,160,162,163,164,169,174,178,179,180,181,182,183,184,],[13,90,-39,-108,-42,-45,-48,-50,-52,-53,-54,-57,-58,-60,-67,-67,-109,-110,-111,-112,-113,-88,-70,-78,-114,-115,13,-107,-76,-89,-90,-91,-92,-93,-94,13,13,13,13,13,13,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,13,13,13,13,-46,-47,13,13,13,13,13,13,13,13,-49,-51,-59,-61,13,-63,-65,-64,-69,-107,-77,-118,-116,-117,-120,13,-87,-35,-36,-37,-38,-40,-41,-43,-44,-55,-56,-62,-66,-119,-121,-101,-96,-105,-106,-68,-122,13,-100,-95,]),'-':([0,12,15,16,17,18,19,20,21,23,24,25,26,27,28,29,30,31,32,33,34,36,37,39,40,41,42,44,50,60,61,62,63,64,65,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,106,107,108,109,110,111,112,113,115,116,118,119,120,121,136,150,151,152,153,154,155,156,157,158,159,160,162,163,164,169,174,178,179,180,181,182,183,184,],[14,91,-39,-108,-42,-45,-48,-50,-52,-53,-54,-57,-58,-60,-67,-67,-109,-110,-111,-112,-113,-88,-70,-78,-114,-115,14,-107,-76,-89,-90,-91,-92,-93,-94,14,14,14,14,14,14,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,14,14,14,14,-46,-47,14,14,14,14,14,14,14,14,-49,-51,-59,-61,14,-63,-65,-64,-69,-107,-77,-118,-116,-117,-120,14,-87,-35,-36,-37,-38,-40,-41,-43,-44,-55,-56,-62,-66,-119,-121,-101,-96,-105,-106,-68,-122,14,-100,-95,]),'SLASH':([0,13,14,16,23,24,25,26,27,28,29,30,31,32,33,34,36,37,39,40,41,42,44,50,60,61,62,63,64,65,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,94,95,96,97,98,99,100,101,106,107,108,109,110,111,112,113,115,116,118,119,120,121,136,158,159,160,162,163,164,169,174,178,179,180,181,182,183,184,],[20,20,20,-108,104,-54,-57,-58,-60,-67,-67,-109,-110,-111,-112,-113,-88,-70,-78,-114,-115,20,-107,-76,-89,-90,-91,-92,-93,-94,20,20,20,20,20,20,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,20,20,20,20,20,20,20,20,20,20,20,20,-59,-61,20,-63,-65,-64,-69,-107,-77,-118,-116,-117,-120,20,-87,-55,-56,-62,-66,-119,-121,-101,-96,-105,-106,-68,-122,20,-100,-95,]),'DOUBLESLASH':([0,13,14,16,23,24,25,26,27,28,29,30,31,32,33,34,36,37,39,40,41,42,44,50,60,61,62,63,64,65,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,94,95,96,97,98,99,100,101,106,107,108,109,110,111,112,113,115,116,118,119,120,121,136,158,159,160,162,163,164,169,174,178,179,180,181,182,183,184,],[22,22,22,-108,105,-54,-57,-58,-60,-67,-67,-109,-110,-111,-112,-113,-88,-70,-78,-114,-115,22,-107,-76,-89,-90,-91,-92,-93,-94,22,22,22,22,22,22,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,22,22,22,22,22,22,22,22,22,22,22,22,-59,-61,22,-63,-65,-64,-69,-107,-77,-118,-116,-117,-120,22,-87,-55,-56,-62,-66,-119,-121,-101,-96,-105,-106,-68,-122,22,-100,-95,]),'CONTEXT':([0,13,14,20,22,42,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,94,95,96,97,98,99,100,101,104,105,108,121,182,],[32,32,32,32,32,32,32,32,32,32,32,32,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,]),'STRING':([0,13,14,20,22,42,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,94,95,96,97,98,99,100,101,104,105,108,121,182,],[40,40,40,40,40,40,40,40,40,40,40,40,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,]),'NUMBER':([0,13,14,20,22,42,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,94,95,96,97,98,99,100,101,104,105,108,121,182,],[41,41,41,41,41,41,41,41,41,41,41,41,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,]),'(':([0,13,14,20,22,42,44,53,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,94,95,96,97,98,99,100,101,104,105,108,114,121,182,],[42,42,42,42,42,42,121,130,137,138,139,42,42,42,42,42,42,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,130,42,42,]),'$':([0,13,14,20,22,42,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,94,95,96,97,98,99,100,101,104,105,108,121,182,],[43,43,43,43,43,43,43,43,43,43,43,43,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,]),'EQNAME':([0,13,14,20,22,35,38,42,43,59,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,94,95,96,97,98,99,100,101,104,105,108,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,137,182,],[44,44,44,44,44,113,113,44,119,113,44,44,44,44,44,44,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,-71,-72,-73,-74,-75,-79,-80,-81,172,-82,-83,-84,-85,-86,177,44,]),'PARENT':([0,13,14,20,22,42,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,94,95,96,97,98,99,100,101,104,105,108,121,182,],[45,45,45,45,45,45,45,45,45,45,45,45,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,]),'ANCESTOR':([0,13,14,20,22,42,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,94,95,96,97,98,99,100,101,104,105,108,121,182,],[46,46,46,46,46,46,46,46,46,46,46,46,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,]),'PRECEDING_SIBLING':([0,13,14,20,22,42,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,94,95,96,97,98,99,100,101,104,105,108,121,182,],[47,47,47,47,47,47,47,47,47,47,47,47,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,]),'PRECEDING':([0,13,14,20,22,42,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,94,95,96,97,98,99,100,101,104,105,108,121,182,],[48,48,48,48,48,48,48,48,48,48,48,48,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,]),'ANCESTOR_OR_SELF':([0,13,14,20,22,42,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,94,95,96,97,98,99,100,101,104,105,108,121,182,],[49,49,49,49,49,49,49,49,49,49,49,49,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,]),'DOUBLEDOT':([0,13,14,20,22,42,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,94,95,96,97,98,99,100,101,104,105,108,121,182,],[50,50,50,50,50,50,50,50,50,50,50,50,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,]),'CHILD':([0,13,14,20,22,42,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,94,95,96,97,98,99,100,101,104,105,108,121,182,],[51,51,51,51,51,51,51,51,51,51,51,51,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,]),'DESCENDANT':([0,13,14,20,22,42,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,94,95,96,97,98,99,100,101,104,105,108,121,182,],[52,52,52,52,52,52,52,52,52,52,52,52,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,]),'ATTRIBUTE':([0,13,14,20,22,35,38,42,59,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,94,95,96,97,98,99,100,101,104,105,108,121,122,123,124,125,126,127,128,129,131,132,133,134,135,182,],[53,53,53,53,53,114,114,53,114,53,53,53,53,53,53,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,-71,-72,-73,-74,-75,-79,-80,-81,-82,-83,-84,-85,-86,53,]),'SELF':([0,13,14,20,22,42,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,94,95,96,97,98,99,100,101,104,105,108,121,182,],[54,54,54,54,54,54,54,54,54,54,54,54,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,]),'DESCENDANT_OR_SELF':([0,13,14,20,22,42,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,94,95,96,97,98,99,100,101,104,105,108,121,182,],[55,55,55,55,55,55,55,55,55,55,55,55,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,]),'FOLLOWING_SIBLING':([0,13,14,20,22,42,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,94,95,96,97,98,99,100,101,104,105,108,121,182,],[56,56,56,56,56,56,56,56,56,56,56,56,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,]),'FOLLOWING':([0,13,14,20,22,42,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,94,95,96,97,98,99,100,101,104,105,108,121,182,],[57,57,57,57,57,57,57,57,57,57,57,57,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,]),'NAMESPACE':([0,13,14,20,22,42,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,94,95,96,97,98,99,100,101,104,105,108,121,182,],[58,58,58,58,58,58,58,58,58,58,58,58,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,]),'@':([0,13,14,20,22,42,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,94,95,96,97,98,99,100,101,104,105,108,121,182,],[59,59,59,59,59,59,59,59,59,59,59,59,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,]),'*':([0,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,44,50,59,60,61,62,63,64,65,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,115,116,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,154,155,156,157,158,159,160,162,163,164,169,174,178,179,180,181,182,183,184,],[16,16,16,94,-108,-42,-45,-48,-50,-52,16,-53,-54,-57,-58,-60,-67,-67,-109,-110,-111,-112,-113,16,-88,-70,16,-78,-114,-115,16,-107,-76,16,-89,-90,-91,-92,-93,-94,16,16,16,16,16,16,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,16,16,16,16,-46,-47,16,16,16,16,16,16,16,16,-49,-51,16,16,-59,-61,16,-63,-65,-64,-69,-107,-77,-118,-116,-117,-120,16,-71,-72,-73,-74,-75,-79,-80,-81,171,-82,-83,-84,-85,-86,-87,176,-40,-41,-43,-44,-55,-56,-62,-66,-119,-121,-101,-96,-105,-106,-68,-122,16,-100,-95,]),'ELEMENT':([0,13,14,20,22,35,38,42,59,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,94,95,96,97,98,99,100,101,104,105,108,121,122,123,124,125,126,127,128,129,131,132,133,134,135,182,],[66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,-71,-72,-73,-74,-75,-79,-80,-81,-82,-83,-84,-85,-86,66,]),'TEXT':([0,13,14,20,22,35,38,42,59,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,94,95,96,97,98,99,100,101,104,105,108,121,122,123,124,125,126,127,128,129,131,132,133,134,135,182,],[67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,-71,-72,-73,-74,-75,-79,-80,-81,-82,-83,-84,-85,-86,67,]),'NODE':([0,13,14,20,22,35,38,42,59,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,94,95,96,97,98,99,100,101,104,105,108,121,122,123,124,125,126,127,128,129,131,132,133,134,135,182,],[68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,-71,-72,-73,-74,-75,-79,-80,-81,-82,-83,-84,-85,-86,68,]),'$end':([1,2,3,4,5,6,7,8,9,10,11,12,15,16,17,18,19,20,21,23,24,25,26,27,28,29,30,31,32,33,34,36,37,39,40,41,44,50,60,61,62,63,64,65,92,93,102,103,106,107,109,110,111,112,113,115,116,118,119,120,136,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,162,163,164,169,174,178,179,180,181,183,184,],[0,-1,-2,-3,-5,-7,-9,-13,-14,-16,-18,-34,-39,-108,-42,-45,-48,-50,-52,-53,-54,-57,-58,-60,-67,-67,-109,-110,-111,-112,-113,-88,-70,-78,-114,-115,-107,-76,-89,-90,-91,-92,-93,-94,-46,-47,-49,-51,-59,-61,-63,-65,-64,-69,-107,-77,-118,-116,-117,-120,-87,-4,-6,-8,-10,-11,-12,-15,-17,-32,-33,-35,-36,-37,-38,-40,-41,-43,-44,-55,-56,-62,-66,-119,-121,-101,-96,-105,-106,-68,-122,-100,-95,]),')':([3,4,5,6,7,8,9,10,11,12,15,16,17,18,19,20,21,23,24,25,26,27,28,29,30,31,32,33,34,36,37,39,40,41,42,44,50,60,61,62,63,64,65,92,93,102,103,106,107,109,110,111,112,113,115,116,117,118,119,120,121,130,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,183,184,185,],[-2,-3,-5,-7,-9,-13,-14,-16,-18,-34,-39,-108,-42,-45,-48,-50,-52,-53,-54,-57,-58,-60,-67,-67,-109,-110,-111,-112,-113,-88,-70,-78,-114,-115,116,-107,-76,-89,-90,-91,-92,-93,-94,-46,-47,-49,-51,-59,-61,-63,-65,-64,-69,-107,-77,-118,163,-116,-117,-120,164,169,-87,174,178,179,-4,-6,-8,-10,-11,-12,-15,-17,-32,-33,-35,-36,-37,-38,-40,-41,-43,-44,-55,-56,-62,-66,-119,-121,181,-123,-125,183,-101,-102,-103,-104,184,-96,-97,-98,-99,-105,-106,-68,-122,-100,-95,-124,]),']':([3,4,5,6,7,8,9,10,11,12,15,16,17,18,19,20,21,23,24,25,26,27,28,29,30,31,32,33,34,36,37,39,40,41,44,50,60,61,62,63,64,65,92,93,102,103,106,107,109,110,111,112,113,115,116,118,119,120,136,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,169,174,178,179,180,181,183,184,],[-2,-3,-5,-7,-9,-13,-14,-16,-18,-34,-39,-108,-42,-45,-48,-50,-52,-53,-54,-57,-58,-60,-67,-67,-109,-110,-111,-112,-113,-88,-70,-78,-114,-115,-107,-76,-89,-90,-91,-92,-93,-94,-46,-47,-49,-51,-59,-61,-63,-65,-64,-69,-107,-77,-118,-116,-117,-120,-87,-4,-6,-8,-10,-11,-12,-15,-17,-32,-33,-35,-36,-37,-38,-40,-41,-43,-44,-55,-56,-62,180,-66,-119,-121,-101,-96,-105,-106,-68,-122,-100,-95,]),',':([3,4,5,6,7,8,9,10,11,12,15,16,17,18,19,20,21,23,24,25,26,27,28,29,30,31,32,33,34,36,37,39,40,41,44,50,60,61,62,63,64,65,92,93,102,103,106,107,109,110,111,112,113,115,116,118,119,120,136,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,162,163,164,165,166,167,169,174,178,179,180,181,183,184,185,],[69,-3,-5,-7,-9,-13,-14,-16,-18,-34,-39,-108,-42,-45,-48,-50,-52,-53,-54,-57,-58,-60,-67,-67,-109,-110,-111,-112,-113,-88,-70,-78,-114,-115,-107,-76,-89,-90,-91,-92,-93,-94,-46,-47,-49,-51,-59,-61,-63,-65,-64,-69,-107,-77,-118,-116,-117,-120,-87,-4,-6,-8,-10,-11,-12,-15,-17,-32,-33,-35,-36,-37,-38,-40,-41,-43,-44,-55,-56,-62,-66,-119,-121,182,-123,-125,-101,-96,-105,-106,-68,-122,-100,-95,-124,]),'OR':([6,7,8,9,10,11,12,15,16,17,18,19,20,21,23,24,25,26,27,28,29,30,31,32,33,34,36,37,39,40,41,44,50,60,61,62,63,64,65,92,93,102,103,106,107,109,110,111,112,113,115,116,118,119,120,136,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,162,163,164,169,174,178,179,180,181,183,184,],[70,-9,-13,-14,-16,-18,-34,-39,-108,-42,-45,-48,-50,-52,-53,-54,-57,-58,-60,-67,-67,-109,-110,-111,-112,-113,-88,-70,-78,-114,-115,-107,-76,-89,-90,-91,-92,-93,-94,-46,-47,-49,-51,-59,-61,-63,-65,-64,-69,-107,-77,-118,-116,-117,-120,-87,-8,-10,-11,-12,-15,-17,-32,-33,-35,-36,-37,-38,-40,-41,-43,-44,-55,-56,-62,-66,-119,-121,-101,-96,-105,-106,-68,-122,-100,-95,]),'AND':([7,8,9,10,11,12,15,16,17,18,19,20,21,23,24,25,26,27,28,29,30,31,32,33,34,36,37,39,40,41,44,50,60,61,62,63,64,65,92,93,102,103,106,107,109,110,111,112,113,115,116,118,119,120,136,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,162,163,164,169,174,178,179,180,181,183,184,],[71,-13,-14,-16,-18,-34,-39,-108,-42,-45,-48,-50,-52,-53,-54,-57,-58,-60,-67,-67,-109,-110,-111,-112,-113,-88,-70,-78,-114,-115,-107,-76,-89,-90,-91,-92,-93,-94,-46,-47,-49,-51,-59,-61,-63,-65,-64,-69,-107,-77,-118,-116,-117,-120,-87,-10,-11,-12,-15,-17,-32,-33,-35,-36,-37,-38,-40,-41,-43,-44,-55,-56,-62,-66,-119,-121,-101,-96,-105,-106,-68,-122,-100,-95,]),'EQstr':([8,9,10,11,12,15,16,17,18,19,20,21,23,24,25,26,27,28,29,30,31,32,33,34,36,37,39,40,41,44,50,60,61,62,63,64,65,92,93,102,103,106,107,109,110,111,112,113,115,116,118,119,120,136,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,162,163,164,169,174,178,179,180,181,183,184,],[75,-14,-16,-18,-34,-39,-108,-42,-45,-48,-50,-52,-53,-54,-57,-58,-60,-67,-67,-109,-110,-111,-112,-113,-88,-70,-78,-114,-115,-107,-76,-89,-90,-91,-92,-93,-94,-46,-47,-49,-51,-59,-61,-63,-65,-64,-69,-107,-77,-118,-116,-117,-120,-87,-15,-17,-32,-33,-35,-36,-37,-38,-40,-41,-43,-44,-55,-56,-62,-66,-119,-121,-101,-96,-105,-106,-68,-122,-100,-95,]),'NEstr':([8,9,10,11,12,15,16,17,18,19,20,21,23,24,25,26,27,28,29,30,31,32,33,34,36,37,39,40,41,44,50,60,61,62,63,64,65,92,93,102,103,106,107,109,110,111,112,113,115,116,118,119,120,136,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,162,163,164,169,174,178,179,180,181,183,184,],[76,-14,-16,-18,-34,-39,-108,-42,-45,-48,-50,-52,-53,-54,-57,-58,-60,-67,-67,-109,-110,-111,-112,-113,-88,-70,-78,-114,-115,-107,-76,-89,-90,-91,-92,-93,-94,-46,-47,-49,-51,-59,-61,-63,-65,-64,-69,-107,-77,-118,-116,-117,-120,-87,-15,-17,-32,-33,-35,-36,-37,-38,-40,-41,-43,-44,-55,-56,-62,-66,-119,-121,-101,-96,-105,-106,-68,-122,-100,-95,]),'LTstr':([8,9,10,11,12,15,16,17,18,19,20,21,23,24,25,26,27,28,29,30,31,32,33,34,36,37,39,40,41,44,50,60,61,62,63,64,65,92,93,102,103,106,107,109,110,111,112,113,115,116,118,119,120,136,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,162,163,164,169,174,178,179,180,181,183,184,],[77,-14,-16,-18,-34,-39,-108,-42,-45,-48,-50,-52,-53,-54,-57,-58,-60,-67,-67,-109,-110,-111,-112,-113,-88,-70,-78,-114,-115,-107,-76,-89,-90,-91,-92,-93,-94,-46,-47,-49,-51,-59,-61,-63,-65,-64,-69,-107,-77,-118,-116,-117,-120,-87,-15,-17,-32,-33,-35,-36,-37,-38,-40,-41,-43,-44,-55,-56,-62,-66,-119,-121,-101,-96,-105,-106,-68,-122,-100,-95,]),'LEstr':([8,9,10,11,12,15,16,17,18,19,20,21,23,24,25,26,27,28,29,30,31,32,33,34,36,37,39,40,41,44,50,60,61,62,63,64,65,92,93,102,103,106,107,109,110,111,112,113,115,116,118,119,120,136,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,162,163,164,169,174,178,179,180,181,183,184,],[78,-14,-16,-18,-34,-39,-108,-42,-45,-48,-50,-52,-53,-54,-57,-58,-60,-67,-67,-109,-110,-111,-112,-113,-88,-70,-78,-114,-115,-107,-76,-89,-90,-91,-92,-93,-94,-46,-47,-49,-51,-59,-61,-63,-65,-64,-69,-107,-77,-118,-116,-117,-120,-87,-15,-17,-32,-33,-35,-36,-37,-38,-40,-41,-43,-44,-55,-56,-62,-66,-119,-121,-101,-96,-105,-106,-68,-122,-100,-95,]),'GTstr':([8,9,10,11,12,15,16,17,18,19,20,21,23,24,25,26,27,28,29,30,31,32,33,34,36,37,39,40,41,44,50,60,61,62,63,64,65,92,93,102,103,106,107,109,110,111,112,113,115,116,118,119,120,136,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,162,163,164,169,174,178,179,180,181,183,184,],[79,-14,-16,-18,-34,-39,-108,-42,-45,-48,-50,-52,-53,-54,-57,-58,-60,-67,-67,-109,-110,-111,-112,-113,-88,-70,-78,-114,-115,-107,-76,-89,-90,-91,-92,-93,-94,-46,-47,-49,-51,-59,-61,-63,-65,-64,-69,-107,-77,-118,-116,-117,-120,-87,-15,-17,-32,-33,-35,-36,-37,-38,-40,-41,-43,-44,-55,-56,-62,-66,-119,-121,-101,-96,-105,-106,-68,-122,-100,-95,]),'GEstr':([8,9,10,11,12,15,16,17,18,19,20,21,23,24,25,26,27,28,29,30,31,32,33,34,36,37,39,40,41,44,50,60,61,62,63,64,65,92,93,102,103,106,107,109,110,111,112,113,115,116,118,119,120,136,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,162,163,164,169,174,178,179,180,181,183,184,],[80,-14,-16,-18,-34,-39,-108,-42,-45,-48,-50,-52,-53,-54,-57,-58,-60,-67,-67,-109,-110,-111,-112,-113,-88,-70,-78,-114,-115,-107,-76,-89,-90,-91,-92,-93,-94,-46,-47,-49,-51,-59,-61,-63,-65,-64,-69,-107,-77,-118,-116,-117,-120,-87,-15,-17,-32,-33,-35,-36,-37,-38,-40,-41,-43,-44,-55,-56,-62,-66,-119,-121,-101,-96,-105,-106,-68,-122,-100,-95,]),'EQsym':([8,9,10,11,12,15,16,17,18,19,20,21,23,24,25,26,27,28,29,30,31,32,33,34,36,37,39,40,41,44,50,60,61,62,63,64,65,92,93,102,103,106,107,109,110,111,112,113,115,116,118,119,120,136,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,162,163,164,169,174,178,179,180,181,183,184,],[81,-14,-16,-18,-34,-39,-108,-42,-45,-48,-50,-52,-53,-54,-57,-58,-60,-67,-67,-109,-110,-111,-112,-113,-88,-70,-78,-114,-115,-107,-76,-89,-90,-91,-92,-93,-94,-46,-47,-49,-51,-59,-61,-63,-65,-64,-69,-107,-77,-118,-116,-117,-120,-87,-15,-17,-32,-33,-35,-36,-37,-38,-40,-41,-43,-44,-55,-56,-62,-66,-119,-121,-101,-96,-105,-106,-68,-122,-100,-95,]),'NEsym':([8,9,10,11,12,15,16,17,18,19,20,21,23,24,25,26,27,28,29,30,31,32,33,34,36,37,39,40,41,44,50,60,61,62,63,64,65,92,93,102,103,106,107,109,110,111,112,113,115,116,118,119,120,136,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,162,163,164,169,174,178,179,180,181,183,184,],[82,-14,-16,-18,-34,-39,-108,-42,-45,-48,-50,-52,-53,-54,-57,-58,-60,-67,-67,-109,-110,-111,-112,-113,-88,-70,-78,-114,-115,-107,-76,-89,-90,-91,-92,-93,-94,-46,-47,-49,-51,-59,-61,-63,-65,-64,-69,-107,-77,-118,-116,-117,-120,-87,-15,-17,-32,-33,-35,-36,-37,-38,-40,-41,-43,-44,-55,-56,-62,-66,-119,-121,-101,-96,-105,-106,-68,-122,-100,-95,]),'LTsym':([8,9,10,11,12,15,16,17,18,19,20,21,23,24,25,26,27,28,29,30,31,32,33,34,36,37,39,40,41,44,50,60,61,62,63,64,65,92,93,102,103,106,107,109,110,111,112,113,115,116,118,119,120,136,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,162,163,164,169,174,178,179,180,181,183,184,],[83,-14,-16,-18,-34,-39,-108,-42,-45,-48,-50,-52,-53,-54,-57,-58,-60,-67,-67,-109,-110,-111,-112,-113,-88,-70,-78,-114,-115,-107,-76,-89,-90,-91,-92,-93,-94,-46,-47,-49,-51,-59,-61,-63,-65,-64,-69,-107,-77,-118,-116,-117,-120,-87,-15,-17,-32,-33,-35,-36,-37,-38,-40,-41,-43,-44,-55,-56,-62,-66,-119,-121,-101,-96,-105,-106,-68,-122,-100,-95,]),'LEsym':([8,9,10,11,12,15,16,17,18,19,20,21,23,24,25,26,27,28,29,30,31,32,33,34,36,37,39,40,41,44,50,60,61,62,63,64,65,92,93,102,103,106,107,109,110,111,112,113,115,116,118,119,120,136,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,162,163,164,169,174,178,179,180,181,183,184,],[84,-14,-16,-18,-34,-39,-108,-42,-45,-48,-50,-52,-53,-54,-57,-58,-60,-67,-67,-109,-110,-111,-112,-113,-88,-70,-78,-114,-115,-107,-76,-89,-90,-91,-92,-93,-94,-46,-47,-49,-51,-59,-61,-63,-65,-64,-69,-107,-77,-118,-116,-117,-120,-87,-15,-17,-32,-33,-35,-36,-37,-38,-40,-41,-43,-44,-55,-56,-62,-66,-119,-121,-101,-96,-105,-106,-68,-122,-100,-95,]),'GTsym':([8,9,10,11,12,15,16,17,18,19,20,21,23,24,25,26,27,28,29,30,31,32,33,34,36,37,39,40,41,44,50,60,61,62,63,64,65,92,93,102,103,106,107,109,110,111,112,113,115,116,118,119,120,136,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,162,163,164,169,174,178,179,180,181,183,184,],[85,-14,-16,-18,-34,-39,-108,-42,-45,-48,-50,-52,-53,-54,-57,-58,-60,-67,-67,-109,-110,-111,-112,-113,-88,-70,-78,-114,-115,-107,-76,-89,-90,-91,-92,-93,-94,-46,-47,-49,-51,-59,-61,-63,-65,-64,-69,-107,-77,-118,-116,-117,-120,-87,-15,-17,-32,-33,-35,-36,-37,-38,-40,-41,-43,-44,-55,-56,-62,-66,-119,-121,-101,-96,-105,-106,-68,-122,-100,-95,]),'GEsym':([8,9,10,11,12,15,16,17,18,19,20,21,23,24,25,26,27,28,29,30,31,32,33,34,36,37,39,40,41,44,50,60,61,62,63,64,65,92,93,102,103,106,107,109,110,111,112,113,115,116,118,119,120,136,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,162,163,164,169,174,178,179,180,181,183,184,],[86,-14,-16,-18,-34,-39,-108,-42,-45,-48,-50,-52,-53,-54,-57,-58,-60,-67,-67,-109,-110,-111,-112,-113,-88,-70,-78,-114,-115,-107,-76,-89,-90,-91,-92,-93,-94,-46,-47,-49,-51,-59,-61,-63,-65,-64,-69,-107,-77,-118,-116,-117,-120,-87,-15,-17,-32,-33,-35,-36,-37,-38,-40,-41,-43,-44,-55,-56,-62,-66,-119,-121,-101,-96,-105,-106,-68,-122,-100,-95,]),'IS':([8,9,10,11,12,15,16,17,18,19,20,21,23,24,25,26,27,28,29,30,31,32,33,34,36,37,39,40,41,44,50,60,61,62,63,64,65,92,93,102,103,106,107,109,110,111,112,113,115,116,118,119,120,136,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,162,163,164,169,174,178,179,180,181,183,184,],[87,-14,-16,-18,-34,-39,-108,-42,-45,-48,-50,-52,-53,-54,-57,-58,-60,-67,-67,-109,-110,-111,-112,-113,-88,-70,-78,-114,-115,-107,-76,-89,-90,-91,-92,-93,-94,-46,-47,-49,-51,-59,-61,-63,-65,-64,-69,-107,-77,-118,-116,-117,-120,-87,-15,-17,-32,-33,-35,-36,-37,-38,-40,-41,-43,-44,-55,-56,-62,-66,-119,-121,-101,-96,-105,-106,-68,-122,-100,-95,]),'CONCAT':([9,10,11,12,15,16,17,18,19,20,21,23,24,25,26,27,28,29,30,31,32,33,34,36,37,39,40,41,44,50,60,61,62,63,64,65,92,93,102,103,106,107,109,110,111,112,113,115,116,118,119,120,136,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,162,163,164,169,174,178,179,180,181,183,184,],[88,-16,-18,-34,-39,-108,-42,-45,-48,-50,-52,-53,-54,-57,-58,-60,-67,-67,-109,-110,-111,-112,-113,-88,-70,-78,-114,-115,-107,-76,-89,-90,-91,-92,-93,-94,-46,-47,-49,-51,-59,-61,-63,-65,-64,-69,-107,-77,-118,-116,-117,-120,-87,-15,-17,-32,-33,-35,-36,-37,-38,-40,-41,-43,-44,-55,-56,-62,-66,-119,-121,-101,-96,-105,-106,-68,-122,-100,-95,]),'TO':([11,12,15,16,17,18,19,20,21,23,24,25,26,27,28,29,30,31,32,33,34,36,37,39,40,41,44,50,60,61,62,63,64,65,92,93,102,103,106,107,109,110,111,112,113,115,116,118,119,120,136,148,149,150,151,152,153,154,155,156,157,158,159,160,162,163,164,169,174,178,179,180,181,183,184,],[89,-34,-39,-108,-42,-45,-48,-50,-52,-53,-54,-57,-58,-60,-67,-67,-109,-110,-111,-112,-113,-88,-70,-78,-114,-115,-107,-76,-89,-90,-91,-92,-93,-94,-46,-47,-49,-51,-59,-61,-63,-65,-64,-69,-107,-77,-118,-116,-117,-120,-87,-32,-33,-35,-36,-37,-38,-40,-41,-43,-44,-55,-56,-62,-66,-119,-121,-101,-96,-105,-106,-68,-122,-100,-95,]),'DIV':([15,16,17,18,19,20,21,23,24,25,26,27,28,29,30,31,32,33,34,36,37,39,40,41,44,50,60,61,62,63,64,65,92,93,102,103,106,107,109,110,111,112,113,115,116,118,119,120,136,154,155,156,157,158,159,160,162,163,164,169,174,178,179,180,181,183,184,],[95,-108,-42,-45,-48,-50,-52,-53,-54,-57,-58,-60,-67,-67,-109,-110,-111,-112,-113,-88,-70,-78,-114,-115,-107,-76,-89,-90,-91,-92,-93,-94,-46,-47,-49,-51,-59,-61,-63,-65,-64,-69,-107,-77,-118,-116,-117,-120,-87,-40,-41,-43,-44,-55,-56,-62,-66,-119,-121,-101,-96,-105,-106,-68,-122,-100,-95,]),'IDIV':([15,16,17,18,19,20,21,23,24,25,26,27,28,29,30,31,32,33,34,36,37,39,40,41,44,50,60,61,62,63,64,65,92,93,102,103,106,107,109,110,111,112,113,115,116,118,119,120,136,154,155,156,157,158,159,160,162,163,164,169,174,178,179,180,181,183,184,],[96,-108,-42,-45,-48,-50,-52,-53,-54,-57,-58,-60,-67,-67,-109,-110,-111,-112,-113,-88,-70,-78,-114,-115,-107,-76,-89,-90,-91,-92,-93,-94,-46,-47,-49,-51,-59,-61,-63,-65,-64,-69,-107,-77,-118,-116,-117,-120,-87,-40,-41,-43,-44,-55,-56,-62,-66,-119,-121,-101,-96,-105,-106,-68,-122,-100,-95,]),'MOD':([15,16,17,18,19,20,21,23,24,25,26,27,28,29,30,31,32,33,34,36,37,39,40,41,44,50,60,61,62,63,64,65,92,93,102,103,106,107,109,110,111,112,113,115,116,118,119,120,136,154,155,156,157,158,159,160,162,163,164,169,174,178,179,180,181,183,184,],[97,-108,-42,-45,-48,-50,-52,-53,-54,-57,-58,-60,-67,-67,-109,-110,-111,-112,-113,-88,-70,-78,-114,-115,-107,-76,-89,-90,-91,-92,-93,-94,-46,-47,-49,-51,-59,-61,-63,-65,-64,-69,-107,-77,-118,-116,-117,-120,-87,-40,-41,-43,-44,-55,-56,-62,-66,-119,-121,-101,-96,-105,-106,-68,-122,-100,-95,]),'UNION':([15,16,17,18,19,20,21,23,24,25,26,27,28,29,30,31,32,33,34,36,37,39,40,41,44,50,60,61,62,63,64,65,92,93,102,103,106,107,109,110,111,112,113,115,116,118,119,120,136,150,151,152,153,154,155,156,157,158,159,160,162,163,164,169,174,178,179,180,181,183,184,],[98,-108,-42,-45,-48,-50,-52,-53,-54,-57,-58,-60,-67,-67,-109,-110,-111,-112,-113,-88,-70,-78,-114,-115,-107,-76,-89,-90,-91,-92,-93,-94,-46,-47,-49,-51,-59,-61,-63,-65,-64,-69,-107,-77,-118,-116,-117,-120,-87,98,98,98,98,-40,-41,-43,-44,-55,-56,-62,-66,-119,-121,-101,-96,-105,-106,-68,-122,-100,-95,]),'|':([15,16,17,18,19,20,21,23,24,25,26,27,28,29,30,31,32,33,34,36,37,39,40,41,44,50,60,61,62,63,64,65,92,93,102,103,106,107,109,110,111,112,113,115,116,118,119,120,136,150,151,152,153,154,155,156,157,158,159,160,162,163,164,169,174,178,179,180,181,183,184,],[99,-108,-42,-45,-48,-50,-52,-53,-54,-57,-58,-60,-67,-67,-109,-110,-111,-112,-113,-88,-70,-78,-114,-115,-107,-76,-89,-90,-91,-92,-93,-94,-46,-47,-49,-51,-59,-61,-63,-65,-64,-69,-107,-77,-118,-116,-117,-120,-87,99,99,99,99,-40,-41,-43,-44,-55,-56,-62,-66,-119,-121,-101,-96,-105,-106,-68,-122,-100,-95,]),'[':([16,27,28,29,30,31,32,33,34,36,37,39,40,41,44,50,60,61,62,63,64,65,106,107,109,110,111,112,113,115,116,118,119,120,136,160,162,163,164,169,174,178,179,180,181,183,184,],[-108,108,108,108,-109,-110,-111,-112,-113,-88,-70,-78,-114,-115,-107,-76,-89,-90,-91,-92,-93,-94,108,-61,108,-65,108,-69,-107,-77,-118,-116,-117,-120,-87,-62,-66,-119,-121,-101,-96,-105,-106,-68,-122,-100,-95,]),'INTERSECT':([16,17,18,19,20,21,23,24,25,26,27,28,29,30,31,32,33,34,36,37,39,40,41,44,50,60,61,62,63,64,65,92,93,102,103,106,107,109,110,111,112,113,115,116,118,119,120,136,154,155,156,157,158,159,160,162,163,164,169,174,178,179,180,181,183,184,],[-108,100,-45,-48,-50,-52,-53,-54,-57,-58,-60,-67,-67,-109,-110,-111,-112,-113,-88,-70,-78,-114,-115,-107,-76,-89,-90,-91,-92,-93,-94,-46,-47,-49,-51,-59,-61,-63,-65,-64,-69,-107,-77,-118,-116,-117,-120,-87,100,100,-43,-44,-55,-56,-62,-66,-119,-121,-101,-96,-105,-106,-68,-122,-100,-95,]),'EXCEPT':([16,17,18,19,20,21,23,24,25,26,27,28,29,30,31,32,33,34,36,37,39,40,41,44,50,60,61,62,63,64,65,92,93,102,103,106,107,109,110,111,112,113,115,116,118,119,120,136,154,155,156,157,158,159,160,162,163,164,169,174,178,179,180,181,183,184,],[-108,101,-45,-48,-50,-52,-53,-54,-57,-58,-60,-67,-67,-109,-110,-111,-112,-113,-88,-70,-78,-114,-115,-107,-76,-89,-90,-91,-92,-93,-94,-46,-47,-49,-51,-59,-61,-63,-65,-64,-69,-107,-77,-118,-116,-117,-120,-87,101,101,-43,-44,-55,-56,-62,-66,-119,-121,-101,-96,-105,-106,-68,-122,-100,-95,]),'AXIS':([45,46,47,48,49,51,52,53,54,55,56,57,58,],[122,123,124,125,126,127,128,129,131,132,133,134,135,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'path':([0,],[1,]),'Expr':([0,42,108,],[2,117,161,]),'ExprList':([0,42,108,],[3,3,3,]),'ExprSingle':([0,42,69,108,121,182,],[4,4,140,4,167,167,]),'OrExpr':([0,42,69,108,121,182,],[5,5,5,5,5,5,]),'AndExpr':([0,42,69,70,108,121,182,],[6,6,6,141,6,6,6,]),'ComparisonExpr':([0,42,69,70,71,108,121,182,],[7,7,7,7,142,7,7,7,]),'StringConcatExpr':([0,42,69,70,71,72,73,74,108,121,182,],[8,8,8,8,8,143,144,145,8,8,8,]),'StringConcatList':([0,42,69,70,71,72,73,74,108,121,182,],[9,9,9,9,9,9,9,9,9,9,9,]),'RangeExpr':([0,42,69,70,71,72,73,74,88,108,121,182,],[10,10,10,10,10,10,10,10,146,10,10,10,]),'AdditiveExpr':([0,42,69,70,71,72,73,74,88,89,108,121,182,],[11,11,11,11,11,11,11,11,11,147,11,11,11,]),'MultiplicativeExpr':([0,42,69,70,71,72,73,74,88,89,90,91,108,121,182,],[12,12,12,12,12,12,12,12,12,12,148,149,12,12,12,]),'UnionExpr':([0,42,69,70,71,72,73,74,88,89,90,91,94,95,96,97,108,121,182,],[15,15,15,15,15,15,15,15,15,15,15,15,150,151,152,153,15,15,15,]),'IntersectExceptExpr':([0,42,69,70,71,72,73,74,88,89,90,91,94,95,96,97,98,99,108,121,182,],[17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,154,155,17,17,17,]),'UnaryExpr':([0,42,69,70,71,72,73,74,88,89,90,91,94,95,96,97,98,99,100,101,108,121,182,],[18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,156,157,18,18,18,]),'ValueExpr':([0,13,14,42,69,70,71,72,73,74,88,89,90,91,94,95,96,97,98,99,100,101,108,121,182,],[19,92,93,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,]),'RelativePathExpr':([0,13,14,20,22,42,69,70,71,72,73,74,88,89,90,91,94,95,96,97,98,99,100,101,108,121,182,],[21,21,21,102,103,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,]),'RelativePathList':([0,13,14,20,22,42,69,70,71,72,73,74,88,89,90,91,94,95,96,97,98,99,100,101,108,121,182,],[23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,]),'StepExpr':([0,13,14,20,22,42,69,70,71,72,73,74,88,89,90,91,94,95,96,97,98,99,100,101,104,105,108,121,182,],[24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,158,159,24,24,24,]),'PostfixExpr':([0,13,14,20,22,42,69,70,71,72,73,74,88,89,90,91,94,95,96,97,98,99,100,101,104,105,108,121,182,],[25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,]),'AxisStep':([0,13,14,20,22,42,69,70,71,72,73,74,88,89,90,91,94,95,96,97,98,99,100,101,104,105,108,121,182,],[26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,]),'PrimaryExpr':([0,13,14,20,22,42,69,70,71,72,73,74,88,89,90,91,94,95,96,97,98,99,100,101,104,105,108,121,182,],[27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,]),'ReverseStep':([0,13,14,20,22,42,69,70,71,72,73,74,88,89,90,91,94,95,96,97,98,99,100,101,104,105,108,121,182,],[28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,]),'ForwardStep':([0,13,14,20,22,42,69,70,71,72,73,74,88,89,90,91,94,95,96,97,98,99,100,101,104,105,108,121,182,],[29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,]),'Literal':([0,13,14,20,22,42,69,70,71,72,73,74,88,89,90,91,94,95,96,97,98,99,100,101,104,105,108,121,182,],[30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,]),'ParenthesizedExpr':([0,13,14,20,22,42,69,70,71,72,73,74,88,89,90,91,94,95,96,97,98,99,100,101,104,105,108,121,182,],[31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,]),'VarRef':([0,13,14,20,22,42,69,70,71,72,73,74,88,89,90,91,94,95,96,97,98,99,100,101,104,105,108,121,182,],[33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,]),'FunctionCall':([0,13,14,20,22,42,69,70,71,72,73,74,88,89,90,91,94,95,96,97,98,99,100,101,104,105,108,121,182,],[34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,]),'ReverseAxis':([0,13,14,20,22,42,69,70,71,72,73,74,88,89,90,91,94,95,96,97,98,99,100,101,104,105,108,121,182,],[35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,]),'NodeTest':([0,13,14,20,22,35,38,42,59,69,70,71,72,73,74,88,89,90,91,94,95,96,97,98,99,100,101,104,105,108,121,182,],[36,36,36,36,36,112,115,36,136,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,]),'AbbrevReverseStep':([0,13,14,20,22,42,69,70,71,72,73,74,88,89,90,91,94,95,96,97,98,99,100,101,104,105,108,121,182,],[37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,]),'ForwardAxis':([0,13,14,20,22,42,69,70,71,72,73,74,88,89,90,91,94,95,96,97,98,99,100,101,104,105,108,121,182,],[38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,]),'AbbrevForwardStep':([0,13,14,20,22,42,69,70,71,72,73,74,88,89,90,91,94,95,96,97,98,99,100,101,104,105,108,121,182,],[39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,]),'KindTest':([0,13,14,20,22,35,38,42,59,69,70,71,72,73,74,88,89,90,91,94,95,96,97,98,99,100,101,104,105,108,121,182,],[60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,]),'NameTest':([0,13,14,20,22,35,38,42,59,69,70,71,72,73,74,88,89,90,91,94,95,96,97,98,99,100,101,104,105,108,121,182,],[61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,]),'ElementTest':([0,13,14,20,22,35,38,42,59,69,70,71,72,73,74,88,89,90,91,94,95,96,97,98,99,100,101,104,105,108,121,182,],[62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,]),'AttributeTest':([0,13,14,20,22,35,38,42,59,69,70,71,72,73,74,88,89,90,91,94,95,96,97,98,99,100,101,104,105,108,121,182,],[63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,]),'TextTest':([0,13,14,20,22,35,38,42,59,69,70,71,72,73,74,88,89,90,91,94,95,96,97,98,99,100,101,104,105,108,121,182,],[64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,]),'AnyKindTest':([0,13,14,20,22,35,38,42,59,69,70,71,72,73,74,88,89,90,91,94,95,96,97,98,99,100,101,104,105,108,121,182,],[65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,]),'ValueComp':([8,],[72,]),'GeneralComp':([8,],[73,]),'NodeComp':([8,],[74,]),'PostfixListChain':([27,],[106,]),'Predicate':([27,28,29,106,109,111,],[107,110,110,160,162,162,]),'PredicateList':([28,29,],[109,111,]),'VarName':([43,],[118,]),'ArgumentList':([44,],[120,]),'ArgumentExpr':([121,],[165,]),'Argument':([121,182,],[166,185,]),'AttributeNameOrWildcard':([130,],[168,]),'AttributeName':([130,],[170,]),'ElementNameOrWildcard':([137,],[173,]),'ElementName':([137,],[175,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> path","S'",1,None,None,None),
+  ('path -> Expr','path',1,'p_Path','parser.py',37),
+  ('Expr -> ExprList','Expr',1,'p_Expr','parser.py',43),
+  ('ExprList -> ExprSingle','ExprList',1,'p_ExprList','parser.py',52),
+  ('ExprList -> ExprList , ExprSingle','ExprList',3,'p_ExprList','parser.py',53),
+  ('ExprSingle -> OrExpr','ExprSingle',1,'p_ExprSingle','parser.py',63),
+  ('OrExpr -> AndExpr OR AndExpr','OrExpr',3,'p_OrExpr','parser.py',69),
+  ('OrExpr -> AndExpr','OrExpr',1,'p_OrExpr','parser.py',70),
+  ('AndExpr -> ComparisonExpr AND ComparisonExpr','AndExpr',3,'p_AndExpr','parser.py',80),
+  ('AndExpr -> ComparisonExpr','AndExpr',1,'p_AndExpr','parser.py',81),
+  ('ComparisonExpr -> StringConcatExpr ValueComp StringConcatExpr','ComparisonExpr',3,'p_ComparisonExpr','parser.py',91),
+  ('ComparisonExpr -> StringConcatExpr GeneralComp StringConcatExpr','ComparisonExpr',3,'p_ComparisonExpr','parser.py',92),
+  ('ComparisonExpr -> StringConcatExpr NodeComp StringConcatExpr','ComparisonExpr',3,'p_ComparisonExpr','parser.py',93),
+  ('ComparisonExpr -> StringConcatExpr','ComparisonExpr',1,'p_ComparisonExpr','parser.py',94),
+  ('StringConcatExpr -> StringConcatList','StringConcatExpr',1,'p_StringConcatExpr','parser.py',110),
+  ('StringConcatList -> StringConcatList CONCAT RangeExpr','StringConcatList',3,'p_StringConcatList','parser.py',120),
+  ('StringConcatList -> RangeExpr','StringConcatList',1,'p_StringConcatList','parser.py',121),
+  ('RangeExpr -> AdditiveExpr TO AdditiveExpr','RangeExpr',3,'p_RangeExpr','parser.py',135),
+  ('RangeExpr -> AdditiveExpr','RangeExpr',1,'p_RangeExpr','parser.py',136),
+  ('ValueComp -> EQstr','ValueComp',1,'p_ValueComp','parser.py',145),
+  ('ValueComp -> NEstr','ValueComp',1,'p_ValueComp','parser.py',146),
+  ('ValueComp -> LTstr','ValueComp',1,'p_ValueComp','parser.py',147),
+  ('ValueComp -> LEstr','ValueComp',1,'p_ValueComp','parser.py',148),
+  ('ValueComp -> GTstr','ValueComp',1,'p_ValueComp','parser.py',149),
+  ('ValueComp -> GEstr','ValueComp',1,'p_ValueComp','parser.py',150),
+  ('GeneralComp -> EQsym','GeneralComp',1,'p_GeneralComp','parser.py',156),
+  ('GeneralComp -> NEsym','GeneralComp',1,'p_GeneralComp','parser.py',157),
+  ('GeneralComp -> LTsym','GeneralComp',1,'p_GeneralComp','parser.py',158),
+  ('GeneralComp -> LEsym','GeneralComp',1,'p_GeneralComp','parser.py',159),
+  ('GeneralComp -> GTsym','GeneralComp',1,'p_GeneralComp','parser.py',160),
+  ('GeneralComp -> GEsym','GeneralComp',1,'p_GeneralComp','parser.py',161),
+  ('NodeComp -> IS','NodeComp',1,'p_NodeComp','parser.py',167),
+  ('AdditiveExpr -> MultiplicativeExpr + MultiplicativeExpr','AdditiveExpr',3,'p_AdditiveExpr','parser.py',173),
+  ('AdditiveExpr -> MultiplicativeExpr - MultiplicativeExpr','AdditiveExpr',3,'p_AdditiveExpr','parser.py',174),
+  ('AdditiveExpr -> MultiplicativeExpr','AdditiveExpr',1,'p_AdditiveExpr','parser.py',175),
+  ('MultiplicativeExpr -> UnionExpr * UnionExpr','MultiplicativeExpr',3,'p_MultiplicativeExpr','parser.py',185),
+  ('MultiplicativeExpr -> UnionExpr DIV UnionExpr','MultiplicativeExpr',3,'p_MultiplicativeExpr','parser.py',186),
+  ('MultiplicativeExpr -> UnionExpr IDIV UnionExpr','MultiplicativeExpr',3,'p_MultiplicativeExpr','parser.py',187),
+  ('MultiplicativeExpr -> UnionExpr MOD UnionExpr','MultiplicativeExpr',3,'p_MultiplicativeExpr','parser.py',188),
+  ('MultiplicativeExpr -> UnionExpr','MultiplicativeExpr',1,'p_MultiplicativeExpr','parser.py',189),
+  ('UnionExpr -> UnionExpr UNION IntersectExceptExpr','UnionExpr',3,'p_UnionExpr','parser.py',199),
+  ('UnionExpr -> UnionExpr | IntersectExceptExpr','UnionExpr',3,'p_UnionExpr','parser.py',200),
+  ('UnionExpr -> IntersectExceptExpr','UnionExpr',1,'p_UnionExpr','parser.py',201),
+  ('IntersectExceptExpr -> IntersectExceptExpr INTERSECT UnaryExpr','IntersectExceptExpr',3,'p_IntersectExceptExpr','parser.py',210),
+  ('IntersectExceptExpr -> IntersectExceptExpr EXCEPT UnaryExpr','IntersectExceptExpr',3,'p_IntersectExceptExpr','parser.py',211),
+  ('IntersectExceptExpr -> UnaryExpr','IntersectExceptExpr',1,'p_IntersectExceptExpr','parser.py',212),
+  ('UnaryExpr -> + ValueExpr','UnaryExpr',2,'p_UnaryExpr','parser.py',221),
+  ('UnaryExpr -> - ValueExpr','UnaryExpr',2,'p_UnaryExpr','parser.py',222),
+  ('UnaryExpr -> ValueExpr','UnaryExpr',1,'p_UnaryExpr','parser.py',223),
+  ('ValueExpr -> SLASH RelativePathExpr','ValueExpr',2,'p_ValueExpr','parser.py',233),
+  ('ValueExpr -> SLASH','ValueExpr',1,'p_ValueExpr','parser.py',234),
+  ('ValueExpr -> DOUBLESLASH RelativePathExpr','ValueExpr',2,'p_ValueExpr','parser.py',235),
+  ('ValueExpr -> RelativePathExpr','ValueExpr',1,'p_ValueExpr','parser.py',236),
+  ('RelativePathExpr -> RelativePathList','RelativePathExpr',1,'p_RelativePathExpr','parser.py',251),
+  ('RelativePathList -> StepExpr','RelativePathList',1,'p_RelativePathList','parser.py',258),
+  ('RelativePathList -> RelativePathList SLASH StepExpr','RelativePathList',3,'p_RelativePathList','parser.py',259),
+  ('RelativePathList -> RelativePathList DOUBLESLASH StepExpr','RelativePathList',3,'p_RelativePathList','parser.py',260),
+  ('StepExpr -> PostfixExpr','StepExpr',1,'p_StepExpr','parser.py',274),
+  ('StepExpr -> AxisStep','StepExpr',1,'p_StepExpr','parser.py',275),
+  ('PostfixExpr -> PrimaryExpr PostfixListChain','PostfixExpr',2,'p_PostfixExpr','parser.py',281),
+  ('PostfixExpr -> PrimaryExpr','PostfixExpr',1,'p_PostfixExpr','parser.py',282),
+  ('PostfixListChain -> Predicate','PostfixListChain',1,'p_PostfixListChain','parser.py',291),
+  ('PostfixListChain -> PostfixListChain Predicate','PostfixListChain',2,'p_PostfixListChain','parser.py',292),
+  ('AxisStep -> ReverseStep PredicateList','AxisStep',2,'p_AxisStep','parser.py',303),
+  ('AxisStep -> ForwardStep PredicateList','AxisStep',2,'p_AxisStep','parser.py',304),
+  ('PredicateList -> Predicate','PredicateList',1,'p_PredicateList','parser.py',312),
+  ('PredicateList -> PredicateList Predicate','PredicateList',2,'p_PredicateList','parser.py',313),
+  ('PredicateList -> <empty>','PredicateList',0,'p_PredicateList','parser.py',314),
+  ('Predicate -> [ Expr ]','Predicate',3,'p_Predicate','parser.py',326),
+  ('ReverseStep -> ReverseAxis NodeTest','ReverseStep',2,'p_ReverseStep','parser.py',332),
+  ('ReverseStep -> AbbrevReverseStep','ReverseStep',1,'p_ReverseStep','parser.py',333),
+  ('ReverseAxis -> PARENT AXIS','ReverseAxis',2,'p_ReverseAxis','parser.py',343),
+  ('ReverseAxis -> ANCESTOR AXIS','ReverseAxis',2,'p_ReverseAxis','parser.py',344),
+  ('ReverseAxis -> PRECEDING_SIBLING AXIS','ReverseAxis',2,'p_ReverseAxis','parser.py',345),
+  ('ReverseAxis -> PRECEDING AXIS','ReverseAxis',2,'p_ReverseAxis','parser.py',346),
+  ('ReverseAxis -> ANCESTOR_OR_SELF AXIS','ReverseAxis',2,'p_ReverseAxis','parser.py',347),
+  ('AbbrevReverseStep -> DOUBLEDOT','AbbrevReverseStep',1,'p_AbbrevReverseStep','parser.py',353),
+  ('ForwardStep -> ForwardAxis NodeTest','ForwardStep',2,'p_ForwardStep','parser.py',360),
+  ('ForwardStep -> AbbrevForwardStep','ForwardStep',1,'p_ForwardStep','parser.py',361),
+  ('ForwardAxis -> CHILD AXIS','ForwardAxis',2,'p_ForwardAxis','parser.py',371),
+  ('ForwardAxis -> DESCENDANT AXIS','ForwardAxis',2,'p_ForwardAxis','parser.py',372),
+  ('ForwardAxis -> ATTRIBUTE AXIS','ForwardAxis',2,'p_ForwardAxis','parser.py',373),
+  ('ForwardAxis -> SELF AXIS','ForwardAxis',2,'p_ForwardAxis','parser.py',374),
+  ('ForwardAxis -> DESCENDANT_OR_SELF AXIS','ForwardAxis',2,'p_ForwardAxis','parser.py',375),
+  ('ForwardAxis -> FOLLOWING_SIBLING AXIS','ForwardAxis',2,'p_ForwardAxis','parser.py',376),
+  ('ForwardAxis -> FOLLOWING AXIS','ForwardAxis',2,'p_ForwardAxis','parser.py',377),
+  ('ForwardAxis -> NAMESPACE AXIS','ForwardAxis',2,'p_ForwardAxis','parser.py',378),
+  ('AbbrevForwardStep -> @ NodeTest','AbbrevForwardStep',2,'p_AbbrevForwardStep','parser.py',384),
+  ('AbbrevForwardStep -> NodeTest','AbbrevForwardStep',1,'p_AbbrevForwardStep','parser.py',385),
+  ('NodeTest -> KindTest','NodeTest',1,'p_NodeTest','parser.py',394),
+  ('NodeTest -> NameTest','NodeTest',1,'p_NodeTest','parser.py',395),
+  ('KindTest -> ElementTest','KindTest',1,'p_KindTest','parser.py',401),
+  ('KindTest -> AttributeTest','KindTest',1,'p_KindTest','parser.py',402),
+  ('KindTest -> TextTest','KindTest',1,'p_KindTest','parser.py',403),
+  ('KindTest -> AnyKindTest','KindTest',1,'p_KindTest','parser.py',404),
+  ('ElementTest -> ELEMENT ( ElementNameOrWildcard )','ElementTest',4,'p_ElementTest','parser.py',410),
+  ('ElementTest -> ELEMENT ( )','ElementTest',3,'p_ElementTest','parser.py',411),
+  ('ElementNameOrWildcard -> ElementName','ElementNameOrWildcard',1,'p_ElementNameOrWildcard','parser.py',418),
+  ('ElementNameOrWildcard -> *','ElementNameOrWildcard',1,'p_ElementNameOrWildcard','parser.py',419),
+  ('ElementName -> EQNAME','ElementName',1,'p_ElemenName','parser.py',425),
+  ('AttributeTest -> ATTRIBUTE ( AttributeNameOrWildcard )','AttributeTest',4,'p_AttributeTest','parser.py',431),
+  ('AttributeTest -> ATTRIBUTE ( )','AttributeTest',3,'p_AttributeTest','parser.py',432),
+  ('AttributeNameOrWildcard -> AttributeName','AttributeNameOrWildcard',1,'p_AttributeNameOrWildcard','parser.py',439),
+  ('AttributeNameOrWildcard -> *','AttributeNameOrWildcard',1,'p_AttributeNameOrWildcard','parser.py',440),
+  ('AttributeName -> EQNAME','AttributeName',1,'p_AttributeName','parser.py',446),
+  ('TextTest -> TEXT ( )','TextTest',3,'p_TextTest','parser.py',452),
+  ('AnyKindTest -> NODE ( )','AnyKindTest',3,'p_AnyKindTest','parser.py',458),
+  ('NameTest -> EQNAME','NameTest',1,'p_NameTest','parser.py',465),
+  ('NameTest -> *','NameTest',1,'p_NameTest','parser.py',466),
+  ('PrimaryExpr -> Literal','PrimaryExpr',1,'p_PrimaryExpr_Literal','parser.py',472),
+  ('PrimaryExpr -> ParenthesizedExpr','PrimaryExpr',1,'p_PrimaryExpr_Parens','parser.py',478),
+  ('PrimaryExpr -> CONTEXT','PrimaryExpr',1,'p_PrimaryExpr_Context','parser.py',484),
+  ('PrimaryExpr -> VarRef','PrimaryExpr',1,'p_PrimaryExpr','parser.py',490),
+  ('PrimaryExpr -> FunctionCall','PrimaryExpr',1,'p_PrimaryExpr','parser.py',491),
+  ('Literal -> STRING','Literal',1,'p_Literal_str','parser.py',498),
+  ('Literal -> NUMBER','Literal',1,'p_Literal_num','parser.py',504),
+  ('VarRef -> $ VarName','VarRef',2,'p_VarRef','parser.py',513),
+  ('VarName -> EQNAME','VarName',1,'p_VarName','parser.py',518),
+  ('ParenthesizedExpr -> ( )','ParenthesizedExpr',2,'p_ParenthesizedExpr','parser.py',523),
+  ('ParenthesizedExpr -> ( Expr )','ParenthesizedExpr',3,'p_ParenthesizedExpr','parser.py',524),
+  ('FunctionCall -> EQNAME ArgumentList','FunctionCall',2,'p_FunctionCall','parser.py',531),
+  ('ArgumentList -> ( )','ArgumentList',2,'p_ArgumentList','parser.py',537),
+  ('ArgumentList -> ( ArgumentExpr )','ArgumentList',3,'p_ArgumentList','parser.py',538),
+  ('ArgumentExpr -> Argument','ArgumentExpr',1,'p_ArgumentExpr_single','parser.py',544),
+  ('ArgumentExpr -> ArgumentExpr , Argument','ArgumentExpr',3,'p_ArgumentExpr_chain','parser.py',550),
+  ('Argument -> ExprSingle','Argument',1,'p_Argument','parser.py',557),
+]
@@ -0,0 +1,48 @@
+"""
+Compact, marshal-able form of the AST.
+
+A node becomes a tuple of its class name followed by its field values, ie.
+ AxisStep("child", NameTest("a")) -> ("AxisStep", "child", ("NameTest", "a"), None)
+Plain tuples inside the tree are tagged with an empty name, lists and scalars are kept as is.
+"""
+
+from dataclasses import fields, is_dataclass
+from typing import Any, Dict, Tuple
+
+from pyopath.xpath.AST import ast
+
+TUPLE_TAG = ""
+
+NODE_CLASSES: Dict[str, type] = {
+    name: cls
+    for name, cls in vars(ast).items()
+    if isinstance(cls, type) and issubclass(cls, (ast.ASTNode, ast.NodeTest)) and is_dataclass(cls)
+}
+
+FIELD_NAMES: Dict[type, Tuple[str, ...]] = {
+    cls: tuple(field.name for field in fields(cls)) for cls in NODE_CLASSES.values()
+}
+
+
+def dump(node: Any) -> Any:
+    if isinstance(node, (ast.ASTNode, ast.NodeTest)):
+        cls = type(node)
+        return (cls.__name__,) + tuple(dump(getattr(node, name)) for name in FIELD_NAMES[cls])
+    if isinstance(node, tuple):
+        return (TUPLE_TAG,) + tuple(dump(value) for value in node)
+    if isinstance(node, list):
+        return [dump(value) for value in node]
+    assert node is None or isinstance(node, (str, int, float)), f"Can't serialize {type(node)}"
+    return node
+
+
+def load(data: Any) -> Any:
+    typ = type(data)
+    if typ is tuple:
+        tag = data[0]
+        if tag == TUPLE_TAG:
+            return tuple(map(load, data[1:]))
+        return ast.make(NODE_CLASSES[tag], tuple(map(load, data[1:])))
+    if typ is list:
+        return list(map(load, data))
+    return data
@@ -0,0 +1,92 @@
+import xml.etree.ElementTree as XMLET
+
+import pytest
+from test_doer import basic_xml_str, test_xml_cases
+
+import pyopath.nodewrappers.etree  # noqa: F401
+from pyopath.closures import compile_node
+from pyopath.doer import create_context, evaluate
+from pyopath.nodewrappers.base import NodeBase, unwrap
+from pyopath.xpath.AST.parser import parse
+
+xml_data = XMLET.fromstring(basic_xml_str)
+
+queries = [case[1] for case in test_xml_cases if case[3] is None] + [
+    "country[2]",
+    "country[2][1]",
+    "country[1][2]",
+    "country[4]",
+    "country[1.0]/rank",
+    "country[neighbor]",
+    "country[neighbor[2]]/@name",
+    "country[neighbor/@direction eq 'N']/@name",
+    "country[@name eq 'Panama']/neighbor[2]/@name",
+    "country/neighbor[1]/@name",
+    "country[year/text() eq '2011'][2]/rank/text()",
+    "country/text()",
+    "./country/./rank/.",
+    "@asd eq 'dsa'",
+    "'x'",
+    "country[.]",
+    "country['']",
+    "country[rank/text()]",
+    "country[2 eq 2]",
+    "country/rank/text()/x",
+    "country[rank eq 1]",
+    "country[rank/text() eq 1]",
+    "country[rank/text() eq '1']/year/text() eq '2008'",
+    "country/rank eq '1'",
+    "$var",
+    "country[last()]",
+    "country[neighbor[last()]/@direction eq 'W']/@name",
+    "country/neighbor[last()][1]/@name",
+    "country[last()][last()]/@name",
+    "country/neighbor/position()",
+    "country/neighbor/last()",
+    "last()",
+    "f(1)",
+    "country[0]",
+    "country[1.5]",
+    "country[neighbor][1]/@name",
+    "country[@name][last()]/@name",
+    "country[2][last()]/@name",
+    "country[last()][2]",
+    "country[last()][@name][last()]/rank/text()",
+    "country/text()[last()]",
+    "country/neighbor[last()]/@name",
+    ".//neighbor/@name",
+    "country//text()",
+    "descendant::neighbor[2]/@name",
+    "descendant::country[@name][2]/rank/text()",
+    "/",
+    "/country[2]/@name",
+    "//neighbor[1]/@name",
+    "//@direction",
+    "country/rank/(/@asd)",
+    "country[/country[3]/@name eq @name]/rank/text()",
+    "$var/(/country)",
+    "country[neighbor/@name!='Austria']/@name",
+    "country[@name=/country/@name][2]/@name",
+    "country[rank/text()<5]/@name",
+    "country/rank/text()>=4",
+    "'1'=1",
+    "'a'=1",
+    "'a'!=1",
+    "country[@name=country/@name]",
+]
+
+
+def outcome(evaluate_with):
+    context = create_context(xml_data)
+    try:
+        return [unwrap(item) if isinstance(item, NodeBase) else item for item in evaluate_with(context)]
+    except Exception as e:
+        return type(e)
+
+
+@pytest.mark.parametrize("query", queries)
+def test_closures_match_interpreter(query: str):
+    node = parse(query)
+    expected = outcome(lambda context: evaluate(node, context))
+    evaluator = compile_node(node)
+    assert outcome(lambda context: [item.item for item in evaluator(context)]) == expected
@@ -0,0 +1,70 @@
+import pytest
+from test_closures import outcome, queries, xml_data
+
+import pyopath
+from pyopath.codegen import compile_query, generate_source
+from pyopath.doer import evaluate
+from pyopath.xpath.AST.parser import parse
+
+generated_queries = [
+    "country",
+    "country[@name]/rank/text()",
+    "country[1.0]/rank",
+    "country[neighbor[2]]/@name",
+    "country[year/text() eq '2011'][2]/rank/text()",
+    "./country/./rank/.",
+    "country[rank/text() eq 1]",
+    "country[last()]",
+    "country[@name][last()][1]/rank",
+    "country/neighbor[last()]/@name",
+    "/country[2]/@name",
+    "country/neighbor[1]/@name",
+    "descendant::neighbor[@direction eq 'W']/@name",
+    "country[2]/descendant::text()",
+]
+
+
+@pytest.mark.parametrize("query", queries)
+def test_codegen_matches_interpreter(query: str):
+    node = parse(query)
+    expected = outcome(lambda context: evaluate(node, context))
+    generated = compile_query(node)
+    if generated is None:
+        assert query not in generated_queries
+        return
+    assert outcome(generated) == expected
+
+
+@pytest.mark.parametrize("query", generated_queries)
+def test_codegen_generates(query: str):
+    assert generate_source(parse(query)) is not None
+
+
+@pytest.mark.parametrize("query", ["//neighbor[1]/@name", "country[2]//text()", "country/(/country)"])
+def test_codegen_leaves_sorting_to_closures(query: str):
+    assert generate_source(parse(query)) is None
+    assert generate_source(parse(f"country[{query}]")) is not None
+
+
+def test_codegen_is_cached():
+    node = parse("country/rank")
+    assert compile_query(node) is compile_query(node)
+    assert outcome(compile_query(node)) == outcome(lambda context: evaluate(node, context))
+
+
+def test_compiled_query_source():
+    compiled = pyopath.compile("country[@name]/rank/text()")
+    assert "def query(context):" in compiled.source
+    assert "node_name() == 'rank'" in compiled.source
+    assert pyopath.compile("$var").source is None
+
+
+def test_default_evaluator():
+    compiled = pyopath.compile("country[2]/@name")
+    assert pyopath.compiled.get_default_evaluator() == "codegen"
+    try:
+        pyopath.compiled.set_default_evaluator("closures")
+        assert compiled.evaluate(xml_data) == ["Singapore"]
+    finally:
+        pyopath.compiled.set_default_evaluator("codegen")
+    assert compiled.evaluate(xml_data) == ["Singapore"]
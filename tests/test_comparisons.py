@@ -0,0 +1,83 @@
+import random
+from math import nan
+from operator import eq, lt, ne
+from typing import Any, List
+
+import pytest
+
+from pyopath.comparisons import GENERAL_OPERATORS, ValueSet, compare_general, compare_pair, general_operand
+
+
+@pytest.mark.parametrize(
+    "left, right, operator, expected",
+    [
+        ("a", "a", eq, True),
+        ("1", 1, eq, True),
+        (1.0, "1", eq, True),
+        ("x", 1, eq, False),
+        ("x", 1, ne, True),
+        (2, 10, lt, True),
+        ("2", "10", lt, False),
+        (True, True, eq, True),
+        (nan, nan, eq, False),
+    ],
+)
+def test_compare_pair(left: Any, right: Any, operator: Any, expected: bool):
+    assert compare_pair(left, right, operator) is expected
+
+
+def test_compare_pair_types():
+    with pytest.raises(TypeError):
+        compare_pair(True, "true", eq)
+
+
+@pytest.mark.parametrize(
+    "values, value, expected",
+    [
+        (["a", "b"], "b", True),
+        (["a", "b"], "c", False),
+        (["1", "b"], 1, True),
+        (["1.0"], 1, True),
+        ([1, 2], "2", True),
+        ([1, 2], "x", False),
+        ([True], 1, False),
+        ([1], True, False),
+        ([], "a", False),
+        ([nan, 1], nan, False),
+        (["x"], nan, False),
+    ],
+)
+def test_value_set(values: List[Any], value: Any, expected: bool):
+    assert (value in ValueSet(values)) is expected
+
+
+@pytest.mark.parametrize(
+    "left, right",
+    [
+        (["a", "b"], ["c", "b"]),
+        (["a", "b"], ["c"]),
+        (["1", "b"], [1.0, 3]),
+        ([2, "x"], ["2.0"]),
+        ([], ["a"]),
+    ],
+)
+def test_hashed_matches_pairwise(left: List[Any], right: List[Any]):
+    expected = any(compare_pair(lhs, rhs, eq) for lhs in left for rhs in right)
+    assert compare_general(left, right, "=") is expected
+    assert compare_general(left, general_operand(right, "="), "=") is expected
+    assert compare_general(general_operand(left, "="), right, "=") is expected
+    assert isinstance(general_operand(right, "!="), list)
+
+
+VALUES = ("a", "b", "1", "2.5", "10", "x", "", 1, 2, 2.5, 10, -3, nan)
+
+
+@pytest.mark.parametrize("op", sorted(GENERAL_OPERATORS))
+def test_fast_comparisons_match_pairs(op: str):
+    rnd = random.Random(op)
+    operator = GENERAL_OPERATORS[op]
+    for _ in range(1000):
+        left = rnd.choices(VALUES, k=rnd.randrange(4))
+        right = rnd.choices(VALUES, k=rnd.randrange(4))
+        expected = any(compare_pair(lhs, rhs, operator) for lhs in left for rhs in right)
+        assert compare_general(left, right, op) is expected, (left, right)
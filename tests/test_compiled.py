@@ -0,0 +1,177 @@
+import xml.etree.ElementTree as XMLET
+
+import pytest
+
+import pyopath
+import pyopath.nodewrappers.etree
+from pyopath.doer import create_context
+from pyopath.lru import LRUCache
+from pyopath.nodewrappers.base import unwrap
+from pyopath.xpath.AST.parser import parse
+
+xml_data = XMLET.fromstring("<data><a>1</a><a>2</a><b x='y'/></data>")
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    pyopath.clear_cache()
+    pyopath.set_cache_size(pyopath.compiled.DEFAULT_CACHE_SIZE)
+    yield
+    pyopath.clear_cache()
+    pyopath.set_cache_size(pyopath.compiled.DEFAULT_CACHE_SIZE)
+
+
+def test_compile_evaluate():
+    compiled = pyopath.compile("a/text()")
+    assert isinstance(compiled, pyopath.CompiledQuery)
+    assert compiled.evaluate(xml_data) == ["1", "2"]
+    assert compiled.evaluate(xml_data) == ["1", "2"]
+
+
+def test_compile_variables():
+    compiled = pyopath.compile("$var")
+    assert compiled.evaluate(xml_data, variables=dict(var="hello")) == ["hello"]
+    assert compiled.evaluate(xml_data, variables=dict(var=2)) == [2]
+
+
+def test_compile_is_cached():
+    assert pyopath.compile("a") is pyopath.compile("a")
+    info = pyopath.cache_info()
+    assert info.hits == 1
+    assert info.misses == 1
+    assert info.currsize == 1
+
+
+def test_query_uses_cache():
+    pyopath.query(xml_data, "@x")
+    pyopath.query(xml_data, "b/@x")
+    pyopath.query(xml_data, "b/@x")
+    info = pyopath.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (1, 2, 2)
+
+
+def test_cache_size():
+    pyopath.set_cache_size(1)
+    first = pyopath.compile("a")
+    pyopath.compile("b")
+    assert pyopath.cache_info().currsize == 1
+    assert pyopath.compile("a") is not first
+
+    pyopath.set_cache_size(0)
+    assert pyopath.compile("a") is not pyopath.compile("a")
+    assert pyopath.cache_info().currsize == 0
+
+
+def test_lru_eviction_order():
+    cache: LRUCache[str, int] = LRUCache(2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    cache.resize(1)
+    assert len(cache) == 1
+    assert cache.get("c") == 3
+
+
+@pytest.fixture(params=pyopath.compiled.EVALUATORS)
+def evaluator(request):
+    pyopath.compiled.set_default_evaluator(request.param)
+    yield request.param
+    pyopath.compiled.set_default_evaluator("codegen")
+
+
+@pytest.fixture()
+def enumerated(monkeypatch):
+    """
+    Counts the children the evaluation has looked at.
+    """
+    counter = [0]
+    children = pyopath.nodewrappers.etree.EtreeElement.children
+
+    def counting_children(self):
+        for child in children(self):
+            counter[0] += 1
+            yield child
+
+    monkeypatch.setattr(pyopath.nodewrappers.etree.EtreeElement, "children", counting_children)
+    return counter
+
+
+def test_iterquery(evaluator):
+    assert list(pyopath.iterquery(xml_data, "a/text()")) == ["1", "2"]
+    assert list(pyopath.compile("b/@x").iter(xml_data)) == ["y"]
+    assert list(pyopath.iterquery(xml_data, "a[last()]/text()")) == ["2"]
+
+
+@pytest.mark.parametrize("expression", ["a/text()", "a[@x]", "a[text() eq '1']/text()"])
+def test_iterquery_streams(evaluator, enumerated, expression):
+    data = XMLET.fromstring("<data>" + "<a x='y'>1</a>" * 1000 + "</data>")
+    results = pyopath.iterquery(data, expression)
+    next(results)
+    assert enumerated[0] < 10
+
+
+wide_data = XMLET.fromstring("<r><data>" + "<a x='y'>1</a>" * 1000 + "</data></r>")
+early_expressions = ["data/a[1]", "data/a[2]/text()", "data/a[@x][1]", "data/a[last()]", "data[a]", "data[a/@x]"]
+
+
+@pytest.mark.parametrize("expression", early_expressions)
+def test_predicates_stop_early(evaluator, enumerated, expression):
+    assert len(pyopath.query(wide_data, expression)) == 1
+    assert enumerated[0] < 10
+
+
+@pytest.mark.parametrize("expression", [e for e in early_expressions if "last()" not in e])
+def test_interpreter_predicates_stop_early(enumerated, expression):
+    assert len(pyopath.doer.evaluate(parse(expression), create_context(wide_data))) == 1
+    assert enumerated[0] < 10
+
+
+priced_data = XMLET.fromstring("<data>" + "<item price='5'/>" * 100 + "</data>")
+limits = XMLET.fromstring("<limits><limit>3</limit></limits>")
+hoisted_expression = "item[@price ne $limits/limit/text()]"
+
+
+def test_invariants_are_hoisted(evaluator, enumerated):
+    results = pyopath.query(priced_data, hoisted_expression, variables=dict(limits=limits))
+    assert len(results) == 100
+    # The children of the items and the data, and those of $limits and its limit only once
+    assert enumerated[0] < 110
+
+
+def test_interpreter_invariants_are_hoisted(enumerated):
+    context = create_context(priced_data, variables=dict(limits=limits))
+    assert len(pyopath.doer.evaluate(parse(hoisted_expression), context)) == 100
+    assert enumerated[0] < 110
+
+
+def deep_tree(depth: int) -> XMLET.Element:
+    top = node = XMLET.Element("a", top="yes")
+    for _ in range(depth):
+        node = XMLET.SubElement(node, "a")
+    node.set("bottom", "1")
+    node.text = "bottom"
+    return top
+
+
+# Deeper than the recursion limit
+deep_data = deep_tree(10000)
+deep_expressions = [
+    ("//a[@bottom]/text()", ["bottom"]),
+    ("descendant::a[last()]/@bottom", ["1"]),
+    ("descendant::a[@bottom]/(/@top)", ["yes"]),
+]
+
+
+@pytest.mark.parametrize("expression, expected", deep_expressions)
+def test_deep_tree(evaluator, expression, expected):
+    assert pyopath.query(deep_data, expression) == expected
+
+
+@pytest.mark.parametrize("expression, expected", deep_expressions)
+def test_interpreter_deep_tree(expression, expected):
+    results = pyopath.doer.evaluate(parse(expression), create_context(deep_data))
+    assert [unwrap(item) for item in results] == expected
@@ -0,0 +1,136 @@
+import os
+import xml.etree.ElementTree as XMLET
+
+import pytest
+from test_xpath_parser import test_cases as parser_cases
+from test_xpath_parser_backends import generate_corpus
+
+import pyopath
+import pyopath.nodewrappers.etree
+from pyopath import diskcache
+from pyopath.xpath.AST import serialize
+from pyopath.xpath.AST.parser import parse
+
+xml_data = XMLET.fromstring("<data><a>1</a><a>2</a><b x='y'/></data>")
+
+
+def parseable(expressions):
+    for expression in expressions:
+        try:
+            yield expression, parse(expression)
+        except Exception:
+            pass
+
+
+@pytest.mark.parametrize("expression, node", list(parseable([case[0] for case in parser_cases] + generate_corpus(100))))
+def test_serialize_roundtrip(expression, node):
+    data = serialize.dump(node)
+    assert serialize.load(data) == node
+    assert repr(serialize.load(data)) == repr(node)
+
+
+@pytest.fixture()
+def compile_cache():
+    pyopath.clear_cache()
+    yield
+    pyopath.set_disk_cache(None)
+    pyopath.clear_cache()
+
+
+def test_cache_persists(tmp_path, compile_cache):
+    cache = pyopath.AstDiskCache(str(tmp_path))
+    assert pyopath.preload(["a/text()", "@x"], cache=cache) == 0
+
+    worker = pyopath.AstDiskCache(str(tmp_path))
+    assert len(worker) == 2
+    assert worker.get("a/text()") == parse("a/text()")
+
+    pyopath.clear_cache()
+    assert pyopath.preload(cache=worker) == 2
+    assert pyopath.cache_info().currsize == 2
+    assert pyopath.query(xml_data, "a/text()") == ["1", "2"]
+    assert [name for name in os.listdir(tmp_path)] == [os.path.basename(cache.path)]
+
+
+def test_compile_uses_disk_cache(tmp_path, compile_cache, monkeypatch):
+    cache = pyopath.AstDiskCache(str(tmp_path))
+    pyopath.set_disk_cache(cache)
+    pyopath.compile("b/@x")
+    cache.save()
+
+    def no_parsing(expression):
+        assert False, f"Should not parse {expression}"
+
+    monkeypatch.setattr(pyopath.compiled, "parse", no_parsing)
+    pyopath.clear_cache()
+    pyopath.set_disk_cache(pyopath.AstDiskCache(str(tmp_path)))
+    assert pyopath.query(xml_data, "b/@x") == ["y"]
+
+
+def test_cache_size_limit(tmp_path):
+    cache = pyopath.AstDiskCache(str(tmp_path), max_entries=2)
+    for expression in ("a", "b", "c"):
+        cache.put(expression, parse(expression))
+        cache.save()
+    cache.load()
+    assert list(cache.entries()) == ["b", "c"]
+
+
+def test_grammar_change_invalidates(tmp_path, monkeypatch):
+    cache = pyopath.AstDiskCache(str(tmp_path))
+    cache.put("a", parse("a"))
+    cache.save()
+    old_path = cache.path
+
+    monkeypatch.setattr(diskcache, "_grammar_fingerprint", "changed")
+    changed = pyopath.AstDiskCache(str(tmp_path))
+    assert changed.path != old_path
+    assert changed.get("a") is None
+
+    changed.put("b", parse("b"))
+    changed.save()
+    assert not os.path.exists(old_path)
+
+
+def test_corrupt_file_is_ignored(tmp_path):
+    cache = pyopath.AstDiskCache(str(tmp_path))
+    with open(cache.path, "wb") as f:
+        f.write(b"garbage")
+    assert cache.get("a") is None
+    cache.put("a", parse("a"))
+    cache.save()
+    assert pyopath.AstDiskCache(str(tmp_path)).get("a") == parse("a")
+
+
+def test_other_versions_are_kept(tmp_path):
+    cache = pyopath.AstDiskCache(str(tmp_path))
+    python = cache.path.rsplit("-", 1)[1]
+    others = [
+        f"{diskcache.FILE_PREFIX}{diskcache.library_version()}-{diskcache.grammar_fingerprint()}-py27.marshal",
+        f"{diskcache.FILE_PREFIX}0.0.1-{diskcache.grammar_fingerprint()}-{python}",
+        f"{diskcache.FILE_PREFIX}{diskcache.library_version()}-dev-{diskcache.grammar_fingerprint()}-{python}",
+    ]
+    for name in others:
+        (tmp_path / name).write_bytes(b"")
+    cache.put("a", parse("a"))
+    cache.save()
+    assert sorted(os.listdir(tmp_path)) == sorted(others + [os.path.basename(cache.path)])
+
+
+def test_put_while_saving(tmp_path, monkeypatch):
+    cache = pyopath.AstDiskCache(str(tmp_path))
+    cache.put("a", parse("a"))
+    read = cache._read
+
+    def read_and_put():
+        # Another thread compiling while the file is written
+        cache.put("b", parse("b"))
+        return read()
+
+    monkeypatch.setattr(cache, "_read", read_and_put)
+    cache.save()
+    monkeypatch.undo()
+    assert "b" in cache
+    assert pyopath.AstDiskCache(str(tmp_path)).get("b") is None
+    cache.save()
+    assert pyopath.AstDiskCache(str(tmp_path)).get("b") == parse("b")
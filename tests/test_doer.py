@@ -6,6 +6,8 @@ import pytest
 
 import pyopath
 import pyopath.nodewrappers.etree
+from pyopath.doer import is_context_independent
+from pyopath.xpath.AST.parser import parse
 
 basic_xml_str = """
 <data asd="dsa">
@@ -67,6 +69,14 @@ test_xml_cases: Sequence[Tuple[int, str, Any, VarType]] = (
     # Conditionals
     (1, "country[@name]", all_countries, None),
     (1, "country[1]", first_country, None),
+    (1, "country[neighbor]", all_countries, None),
+    (1, "country[neighbor/@name]/@name", ["Liechtenstein", "Singapore", "Panama"], None),
+    # Focus functions
+    (1, "country[last()]/@name", ["Panama"], None),
+    (1, "country/neighbor[last()]/@name", ["Switzerland", "Malaysia", "Colombia"], None),
+    (1, "country[@name][last()]/@name", ["Panama"], None),
+    (3, "country[position() eq 2]/@name", ["Singapore"], None),
+    (3, "country/last()", [3, 3, 3], None),
     # Paths
     (1, "country/rank", all_ranks, None),
     # Obtaining text results
@@ -81,12 +91,112 @@ test_xml_cases: Sequence[Tuple[int, str, Any, VarType]] = (
     (1, "$var", ["hello"], dict(var="hello")),
     (1, "$var", root, dict(var=lambda x: root(x)[0])),  # value=element
     (1, "$var", root, dict(var=root)),  # value=element, but through singleton-unwrap of argument, since those are equal
-    # (1, "$var", all_countries, dict(var=all_countries)), Need to implement proper array/sequence handling
+    (1, "$var", all_countries, dict(var=all_countries)),
+    (3, "$var", ["a", "b"], dict(var=["a", ["b"]])),
     (1, "$var", [2], dict(var=2)),
     (-1, "$var", [DummyVar], dict(var=DummyVar)),  # -1 = don't support random types in pure lxml / xpath
+    (3, "country[rank/text() eq $rank]/@name", ["Singapore"], dict(rank="4")),
+    (3, "country[$flag]/@name", ["Liechtenstein", "Singapore", "Panama"], dict(flag="x")),
+    (3, "country[$position]/@name", ["Singapore"], dict(position=2)),
+    (3, "country[year/text() eq $var/country[2]/year/text()]/@name", ["Singapore", "Panama"], dict(var=root)),
     # Complex!
     (3, "country[1]/rank/text() eq '1'", [True], None),
     (3, "country[rank/text() eq '1']/year/text()", ["2008"], None),
+    (3, "country[rank/text() eq '68']/year/text()", ["2011"], None),
+    # General comparisons
+    (1, "country[@name='Panama']/rank/text()", ["68"], None),
+    (1, "country[neighbor/@name='Malaysia']/@name", ["Singapore"], None),
+    (1, "country[neighbor/@direction!='E']/@name", ["Liechtenstein", "Singapore", "Panama"], None),
+    (1, "country[rank/text()=4]/@name", ["Singapore"], None),
+    (1, "country/@name='Panama'", [True], None),
+    (1, "country/@name=//neighbor/@name", [False], None),
+    (
+        1,
+        "country[@name=$var/country[neighbor/@direction='W']/@name]/@name",
+        ["Liechtenstein", "Panama"],
+        dict(var=root),
+    ),
+    (1, "//neighbor[@direction=$var//neighbor[@name='Malaysia']/@direction]/@name", ["Malaysia"], dict(var=root)),
+    (3, "country[@name=$var]/rank/text()", ["4", "68"], dict(var=["Panama", "Singapore", "Nowhere"])),
+    (3, "country[rank/text()=$var]/@name", ["Liechtenstein", "Panama"], dict(var=[1, 68])),
+    (1, "country[rank/text()<5]/@name", ["Liechtenstein", "Singapore"], None),
+    (1, "country[rank/text()>=4]/@name", ["Singapore", "Panama"], None),
+    (1, "country/rank/text()>60", [True], None),
+    (1, "country/rank/text()>100", [False], None),
+    (1, "country/@name!=country/@name", [True], None),
+    (1, "country[1]/@name!=country[1]/@name", [False], None),
+    (3, "//neighbor/@name<'B'", [True], None),
+    (3, "1 lt 2", [True], None),
+    (3, "$var>=3", [False], dict(var=[1, "2", "x"])),
+    # String values of elements
+    (1, "country[rank='1']/@name", ["Liechtenstein"], None),
+    (1, "country[year=2011]/@name", ["Singapore", "Panama"], None),
+    (1, "country[neighbor/@name='Malaysia']/gdppc>50000", [True], None),
+    (1, "string(country[3]/rank)", ["68"], None),
+    (1, "string(country[2]/@name)", ["Singapore"], None),
+    (1, "string(country[4])", [""], None),
+    (3, "country[string(year) eq '2008']/@name", ["Liechtenstein"], None),
+    (3, "country[rank eq '4']/@name", ["Singapore"], None),
+    # Descendants
+    (1, "//country", all_countries, None),
+    (1, "//neighbor/@name", ["Austria", "Switzerland", "Malaysia", "Costa Rica", "Colombia"], None),
+    (1, "//country[2]/@name", ["Singapore"], None),
+    (1, "descendant::neighbor[2]/@name", ["Switzerland"], None),
+    (1, "country[2]//@name", ["Singapore", "Malaysia"], None),
+    # Paths are in document order, each node once
+    (1, "//neighbor[1]/@name", ["Austria", "Malaysia", "Costa Rica"], None),
+    (3, "(country[3],country[1])/@name", ["Liechtenstein", "Panama"], None),
+    (3, "country/rank/(/country[3]/@name)", ["Panama"], None),
+    (
+        3,
+        "country/(neighbor,.)/@name",
+        ["Liechtenstein", "Austria", "Switzerland", "Singapore", "Malaysia", "Panama", "Costa Rica", "Colombia"],
+        None,
+    ),
+    # Combining node sequences
+    (1, "country[2]/@name|country[1]/@name", ["Liechtenstein", "Singapore"], None),
+    (
+        1,
+        "country/@name|country/neighbor/@name",
+        ["Liechtenstein", "Austria", "Switzerland", "Singapore", "Malaysia", "Panama", "Costa Rica", "Colombia"],
+        None,
+    ),
+    (1, "(country/year|country/rank)/text()", ["1", "2008", "4", "2011", "68", "2011"], None),
+    (1, "country/year/text()|country/rank/text()", ["1", "2008", "4", "2011", "68", "2011"], None),
+    (
+        1,
+        "(//neighbor|country/neighbor|country[3]/neighbor)/@name",
+        ["Austria", "Switzerland", "Malaysia", "Costa Rica", "Colombia"],
+        None,
+    ),
+    (
+        1,
+        "//neighbor[@direction='W']/@name|//neighbor[@direction='N']/@name",
+        ["Switzerland", "Malaysia", "Costa Rica"],
+        None,
+    ),
+    (1, "country[neighbor[@direction='N']|rank[text()='68']]/@name", ["Singapore", "Panama"], None),
+    (3, "country[1]/rank union country[1]/year union country[1]/rank", lambda x: [x[0][0], x[0][1]], None),
+    (3, "(country/neighbor except country[1]/neighbor)/@name", ["Malaysia", "Costa Rica", "Colombia"], None),
+    (3, "(//neighbor intersect country[3]/neighbor)/@name", ["Costa Rica", "Colombia"], None),
+    (
+        3,
+        "(//neighbor intersect country/neighbor[@direction='W'] except country[1]/neighbor)/@name",
+        ["Costa Rica"],
+        None,
+    ),
+    (3, "country[neighbor except neighbor[@direction='E']]/@name", ["Liechtenstein", "Singapore", "Panama"], None),
+    (3, "country[neighbor except neighbor[@direction!='W']]/@name", ["Liechtenstein", "Panama"], None),
+    # Nodes reached through a variable holding an element inside the tree are the same nodes
+    (1, "country[1]/rank|$var/rank", lambda x: [x[0][0]], dict(var=first_country)),
+    (3, "country/rank intersect $var/rank", lambda x: [x[0][0]], dict(var=first_country)),
+    (3, "(country/rank except $var/rank)/text()", ["4", "68"], dict(var=first_country)),
+    (3, "($var,country[1])/rank", lambda x: [x[0][0]], dict(var=first_country)),
+    # There is no document node above the root, so / is the root itself and /country its children
+    (3, "/", root, None),
+    (3, "/country/@name", ["Liechtenstein", "Singapore", "Panama"], None),
+    (3, "country[1]/rank/(/country[3]/@name)", ["Panama"], None),
+    (3, "$var/(/@name)", ["Liechtenstein"], dict(var=first_country)),
     # test?
     (1, ".", root, None),
     (1, "./.", root, None),
@@ -162,3 +272,23 @@ basic_py_cases = (
     # Index in array?
     # ("pets[2]", basic_py_data, 2),
 )
+
+
+@pytest.mark.parametrize(
+    "query, independent",
+    [
+        ("'x'", True),
+        ("$var", True),
+        ("$var/a[1]/text()", True),
+        ("$var eq 2", True),
+        ("$var=2", True),
+        (".", False),
+        ("a", False),
+        ("a eq $var", False),
+        ("@a=$var//b", False),
+        ("last()", False),
+        ("./$var", False),
+    ],
+)
+def test_context_independence(query: str, independent: bool):
+    assert is_context_independent(parse(query)) == independent
@@ -0,0 +1,91 @@
+import xml.etree.ElementTree as XMLET
+
+from test_doer import basic_xml_str
+
+import pyopath
+from pyopath.doer import create_context
+from pyopath.explain import LABEL_WIDTH, analyze
+from pyopath.xpath.AST.parser import parse
+
+xml_data = XMLET.fromstring(basic_xml_str)
+
+
+def test_explain_plan():
+    text = pyopath.compile("country[@name][2 eq 2]//neighbor/@name").explain_text()
+    assert text.splitlines() == [
+        "PathOperator /",
+        "  PathOperator /",
+        "    AxisStep child::country",
+        "      Predicate",
+        "        AxisStep attribute::name",
+        "    AxisStep descendant::neighbor",
+        "  AxisStep attribute::name",
+    ]
+
+
+def test_explain_sorted_path():
+    text = pyopath.compile("//neighbor[1]/@name").explain_text()
+    assert text.splitlines()[:2] == ["PathOperator / sorted", "  PathOperator /"]
+
+
+def test_explain_prints(capsys):
+    compiled = pyopath.compile("country/rank")
+    compiled.explain()
+    assert capsys.readouterr().out == compiled.explain_text() + "\n"
+
+
+def test_explain_analyze():
+    text = pyopath.compile("country[@name]/rank").explain_text(xml_data, analyze=True)
+    assert [line[:LABEL_WIDTH].split() for line in text.splitlines()] == [
+        ["PathOperator", "/"],
+        ["AxisStep", "child::country"],
+        ["Predicate"],
+        ["AxisStep", "attribute::name"],
+        ["AxisStep", "child::rank"],
+    ]
+    path, country, predicate, name, rank = text.splitlines()
+    assert "in 1      out 3" in path and "nodes" not in path
+    # The three countries and the text of data
+    assert "in 1      out 3      nodes 4 " in country
+    assert predicate.split()[1:] == ["in", "3", "out", "3"]
+    assert "in 3      out 3      nodes 3 " in name
+    assert "in 3      out 3      nodes 17 " in rank
+    assert path.endswith(" ms")
+
+
+def test_explain_analyze_early_exit_and_hoisting():
+    text = pyopath.compile("country[1]/neighbor[@name ne $name]/@name").explain_text(
+        xml_data, analyze=True, variables=dict(name="Austria")
+    )
+    lines = text.splitlines()
+    assert "Literal 1" in lines[4] and "never evaluated" in lines[4]
+    # Only the first country is produced, and $name is evaluated once for both neighbors
+    assert "nodes 1 " in lines[2]
+    variable = next(line for line in lines if "VarRef $name" in line)
+    assert "in 1      out 1" in variable
+
+
+def test_explain_analyze_streams_predicates():
+    text = pyopath.compile("country[neighbor][1]/@name").explain_text(xml_data, analyze=True)
+    country = next(line for line in text.splitlines() if "AxisStep child::country" in line)
+    # Evaluated as without analyze, the axis stops once the first country has a neighbor
+    assert "nodes 1 " in country
+    assert pyopath.compile("country[neighbor][1]/@name").evaluate(xml_data) == ["Liechtenstein"]
+
+
+def test_explain_analyze_hash_join():
+    text = pyopath.compile("country[@name=$var//neighbor/@name]/@name").explain_text(
+        xml_data, analyze=True, variables=dict(var=xml_data)
+    )
+    # The neighbors are looked up once, not once per country
+    variable = next(line for line in text.splitlines() if "VarRef $var" in line)
+    assert "in 1      out 1" in variable
+    assert "GeneralCompare =" in text
+
+
+def test_analyze_results():
+    context = create_context(xml_data)
+    results, profile = analyze(parse("country/rank/text()"), context)
+    assert [result.string_value() for result in results] == ["1", "4", "68"]
+    assert profile[parse("country")].items_out == 3
+    assert context.static.profile is None
@@ -0,0 +1,117 @@
+import xml.etree.ElementTree as XMLET
+from typing import Any
+
+import pytest
+from test_doer import basic_xml_str
+
+import pyopath
+from pyopath.doer import StaticContext, create_context, evaluate
+from pyopath.nodewrappers.base import unwrap
+
+
+@pytest.fixture
+def xml_data() -> XMLET.Element:
+    return XMLET.fromstring(basic_xml_str)
+
+
+def static_context(document: Any) -> StaticContext:
+    return StaticContext(
+        indexes={
+            "countries": pyopath.Index(document, match="country", use="@name"),
+            "neighbors": pyopath.Index(document, match="country", use="neighbor/@name"),
+            "directions": pyopath.Index(document, match="neighbor", use="@direction"),
+        }
+    )
+
+
+key_cases = [
+    ("key('countries','Panama')/rank/text()", ["68"]),
+    ("key('countries','Nowhere')", []),
+    ("key('countries',('Panama','Liechtenstein'))/@name", ["Liechtenstein", "Panama"]),
+    ("key('neighbors','Malaysia')/@name", ["Singapore"]),
+    ("key('neighbors',//neighbor/@name)/@name", ["Liechtenstein", "Singapore", "Panama"]),
+    ("key('directions','W')/@name", ["Switzerland", "Costa Rica"]),
+    ("key('countries','Panama')/neighbor[last()]/@name", ["Colombia"]),
+    ("country[1]/key('countries','Singapore')/year/text()", ["2011"]),
+    ("country[year/text() eq key('countries','Singapore')/year/text()]/@name", ["Singapore", "Panama"]),
+]
+
+
+@pytest.mark.parametrize("evaluator", pyopath.compiled.EVALUATORS)
+@pytest.mark.parametrize("query, expected", key_cases)
+def test_key(xml_data: Any, evaluator: str, query: str, expected: Any):
+    context = static_context(xml_data)
+    pyopath.compiled.set_default_evaluator(evaluator)
+    try:
+        assert pyopath.query(xml_data, query, static_context=context) == expected
+        assert pyopath.query(xml_data, query, static_context=context) == expected
+    finally:
+        pyopath.compiled.set_default_evaluator("codegen")
+    plan = pyopath.compile(query).plan
+    assert [unwrap(item) for item in evaluate(plan, create_context(xml_data, context))] == expected
+
+
+def test_key_variable(xml_data: Any):
+    context = static_context(xml_data)
+    query = "key('countries',$name)/rank/text()"
+    assert pyopath.query(xml_data, query, static_context=context, variables=dict(name="Singapore")) == ["4"]
+    assert pyopath.query(xml_data, query, static_context=context, variables=dict(name="Panama")) == ["68"]
+
+
+def test_index_is_shared(xml_data: Any):
+    countries = pyopath.Index(xml_data, match="country", use="@name")
+    first = StaticContext(indexes={"countries": countries})
+    second = StaticContext(indexes={"c": countries})
+    assert pyopath.query(xml_data, "key('countries','Panama')/@name", static_context=first) == ["Panama"]
+    groups = countries._groups
+    assert pyopath.query(xml_data, "key('c','Singapore')/@name", static_context=second) == ["Singapore"]
+    # Built once, by the first lookup
+    assert countries._groups is groups
+    assert len(countries) == 3
+
+
+def test_update(xml_data: Any):
+    context = static_context(xml_data)
+    countries = context.indexes["countries"]
+    panama = xml_data[2]
+    assert pyopath.query(xml_data, "key('countries','Panama')", static_context=context) == [panama]
+    panama.set("name", "Liechtenstein")
+    # Not told yet
+    assert pyopath.query(xml_data, "key('countries','Panama')", static_context=context) == [panama]
+    countries.update(panama)
+    assert pyopath.query(xml_data, "key('countries','Panama')", static_context=context) == []
+    assert pyopath.query(xml_data, "key('countries','Liechtenstein')", static_context=context) == [
+        xml_data[0],
+        panama,
+    ]
+    groups = countries._groups
+    added = XMLET.SubElement(xml_data, "country", name="Panama")
+    countries.update(added)
+    assert countries._groups is None
+    assert pyopath.query(xml_data, "key('countries','Panama')", static_context=context) == [added]
+    assert countries._groups is not groups
+
+
+def test_remove_and_rebuild(xml_data: Any):
+    context = static_context(xml_data)
+    countries = context.indexes["countries"]
+    singapore = xml_data[1]
+    assert len(countries) == 3
+    xml_data.remove(singapore)
+    countries.remove(singapore)
+    assert pyopath.query(xml_data, "key('countries','Singapore')", static_context=context) == []
+    assert len(countries) == 2
+    xml_data.append(singapore)
+    countries.rebuild()
+    assert pyopath.query(xml_data, "key('countries','Singapore')", static_context=context) == [singapore]
+
+
+def test_key_errors(xml_data: Any):
+    context = static_context(xml_data)
+    with pytest.raises(ValueError):
+        pyopath.query(xml_data, "key('missing','Panama')", static_context=context)
+    with pytest.raises(TypeError):
+        pyopath.query(xml_data, "key('countries')", static_context=context)
+    # An index is over the document it was declared for
+    with pytest.raises(ValueError):
+        pyopath.query(XMLET.fromstring(basic_xml_str), "key('countries','Panama')", static_context=context)
@@ -0,0 +1,185 @@
+import xml.etree.ElementTree as XMLET
+from typing import Any, Generator, Optional, Tuple
+
+import pytest
+from test_doer import basic_xml_str
+
+import pyopath
+from pyopath.doer import create_context, evaluate
+from pyopath.nameindex import document_index
+from pyopath.nodewrappers.base import ElementBase, NodeBase, unwrap
+from pyopath.nodewrappers.registry import register_nodetype, wrap
+
+xml_data = XMLET.fromstring(basic_xml_str)
+
+indexed_queries = [
+    "//country/@name",
+    "//neighbor[2]/@name",
+    "//neighbor[@direction eq 'W']/@name",
+    "descendant::rank/text()",
+    "descendant::neighbor[last()]/@name",
+    "//missing",
+    "country[2]//neighbor/@name",
+    "country/rank/(//year/text())",
+    "country[@name eq 'Panama']/rank/text()",
+    "country['Singapore' eq @name][last()]/@name",
+    "//neighbor[@name eq 'Malaysia']/@direction",
+    "country/neighbor[@direction eq 'W'][1]/@name",
+    "country[@missing eq 'x']",
+    "country[@name='Panama']/rank/text()",
+    "//neighbor[@direction='W'][2]/@name",
+    "descendant::neighbor[@direction eq 'E'][last()]/@name",
+]
+
+
+@pytest.fixture(autouse=True)
+def index_size():
+    pyopath.set_index_size(1000)
+    yield
+    pyopath.set_index_size(0)
+    pyopath.clear_index()
+
+
+def results(expression: str, data: Any) -> Any:
+    return [unwrap(item) for item in evaluate(pyopath.compile(expression).plan, create_context(data))]
+
+
+@pytest.mark.parametrize("evaluator", pyopath.compiled.EVALUATORS)
+@pytest.mark.parametrize("query", indexed_queries)
+def test_index_matches_walk(evaluator: str, query: str):
+    pyopath.set_index_size(0)
+    expected = pyopath.query(xml_data, query)
+    pyopath.set_index_size(1000)
+    pyopath.compiled.set_default_evaluator(evaluator)
+    try:
+        assert pyopath.query(xml_data, query) == expected
+        assert pyopath.query(xml_data, query) == expected
+    finally:
+        pyopath.compiled.set_default_evaluator("codegen")
+    assert results(query, xml_data) == expected
+
+
+def test_index_is_built_once():
+    assert pyopath.index_info().currsize == 0
+    assert pyopath.query(xml_data, "country/@name") == ["Liechtenstein", "Singapore", "Panama"]
+    assert pyopath.index_info().currsize == 0
+    pyopath.query(xml_data, "//rank")
+    info = pyopath.index_info()
+    assert (info.hits, info.misses, info.currsize) == (0, 1, 17)
+    pyopath.query(xml_data, "//neighbor")
+    assert pyopath.index_info().hits == 1
+
+
+def test_clear_index():
+    data = XMLET.fromstring("<data><a/></data>")
+    assert len(pyopath.query(data, "//a")) == 1
+    XMLET.SubElement(data, "a")
+    # The index still has the document as it was
+    assert len(pyopath.query(data, "//a")) == 1
+    pyopath.clear_index(data)
+    assert len(pyopath.query(data, "//a")) == 2
+
+
+def test_index_size():
+    small = XMLET.fromstring("<data>" + "<a/>" * 10 + "</data>")
+    large = XMLET.fromstring("<data>" + "<a/>" * 20 + "</data>")
+    pyopath.set_index_size(15)
+    assert len(pyopath.query(small, "//a")) == 10
+    assert pyopath.index_info().currsize == 10
+    # Too large to index, only remembered as such
+    assert len(pyopath.query(large, "//a")) == 20
+    assert document_index(wrap(large)).parts["names"] is None  # type: ignore
+    assert pyopath.index_info().currsize == 11
+    pyopath.set_index_size(5)
+    assert pyopath.index_info().currsize <= 5
+    assert len(pyopath.query(small, "//a")) == 10
+
+
+def test_index_larger_than_size_is_kept():
+    data = XMLET.fromstring("<data>" + "<a x='1'/>" * 10 + "</data>")
+    pyopath.set_index_size(10)
+    assert len(pyopath.query(data, "//a")) == 10
+    # The attribute index does not fit beside the names, and is remembered as too large
+    assert len(pyopath.query(data, "a[@x eq '1']")) == 10
+    index = document_index(wrap(data))
+    assert index.parts["names"] is not None
+    assert [part for key, part in index.parts.items() if key != "names"] == [None]
+    assert pyopath.index_info().currsize == 10
+    hits = pyopath.index_info().hits
+    assert len(pyopath.query(data, "a[@x eq '1']")) == 10
+    assert pyopath.index_info().hits == hits + 1
+    assert document_index(wrap(data)) is index
+
+
+@pytest.mark.parametrize("evaluator", pyopath.compiled.EVALUATORS)
+@pytest.mark.parametrize("name, expected", [("Panama", ["2011"]), ("Nowhere", []), (5, TypeError)])
+def test_attribute_index_variable(evaluator: str, name: Any, expected: Any):
+    pyopath.compiled.set_default_evaluator(evaluator)
+    try:
+        for _ in range(2):
+            try:
+                assert (
+                    pyopath.query(xml_data, "country[@name eq $name]/year/text()", variables=dict(name=name))
+                    == expected
+                )
+            except TypeError as e:
+                # Only strings are looked up, the comparison of anything else is evaluated
+                assert expected is TypeError, e
+    finally:
+        pyopath.compiled.set_default_evaluator("codegen")
+
+
+def test_attribute_index_skips_predicate():
+    compiled = pyopath.compile("country[@name eq 'Singapore']/rank/text()")
+    assert compiled.evaluate(xml_data) == ["4"]
+    assert pyopath.index_info().currsize == 3
+    lines = compiled.explain_text(xml_data, analyze=True).splitlines()
+    assert "child::country" in lines[2] and "nodes 1 " in lines[2]
+    assert "Predicate" in lines[3] and "never evaluated" in lines[3]
+    assert pyopath.index_info().currsize == 3
+
+
+class Tree:
+    """
+    A tree of plain python objects.
+    """
+
+    def __init__(self, name: str, *children: "Tree"):
+        self.name = name
+        self.children = children
+
+
+class TreeNode(ElementBase):
+    def __init__(self, parent_node: Optional["TreeNode"], tree: Tree):
+        self.parent_node = parent_node
+        self.tree = tree
+
+    def node_name(self) -> str:
+        return self.tree.name
+
+    def string_value(self) -> str:
+        return ""
+
+    def attributes(self) -> Generator[Any, None, None]:
+        yield from ()
+
+    def children(self) -> Generator[NodeBase, None, None]:
+        for child in self.tree.children:
+            yield TreeNode(self, child)
+
+    def parent(self) -> Optional[NodeBase]:
+        return self.parent_node
+
+    def unwrap(self) -> Any:
+        return self.tree
+
+
+register_nodetype(Tree, lambda tree: TreeNode(None, tree))
+
+
+def test_index_any_wrapper():
+    leaves: Tuple[Tree, ...] = (Tree("leaf"), Tree("leaf"))
+    data = Tree("root", Tree("branch", leaves[0]), Tree("branch", Tree("twig", leaves[1])))
+    assert pyopath.query(data, "//leaf") == list(leaves)
+    assert pyopath.index_info().currsize == 5
+    assert pyopath.query(data, "//branch[2]//leaf") == [leaves[1]]
@@ -0,0 +1,157 @@
+from typing import Any, Iterator
+
+import lxml.etree as LXMLET
+import pytest
+from test_doer import VarType, basic_lxml_data, test_xml_cases
+
+import pyopath
+from pyopath.offload import set_offload, translate
+from pyopath.optimizer import optimize
+from pyopath.xpath.AST.parser import parse
+
+mixed_xml_str = (
+    "<root a='1'>x<item id='1' kind='a'>one<item id='2'>two<!--c--></item>tail<?pi d?></item>"
+    "<item id='3' kind='b'>three<sub><item id='4' kind='a'/></sub></item>y<other kind='a'>1.0</other></root>"
+)
+mixed_data = LXMLET.fromstring(mixed_xml_str)
+
+mixed_queries = (
+    "item",
+    "//item/@id",
+    "//item[@kind='a']/@id",
+    "//item[1]/@id",
+    "descendant::item[2]/@id",
+    "item[sub]/@id",
+    "item//item",
+    "/item[last()]/@id",
+    "item[.='onetwotail']/@id",
+    "item[position()=1]|other",
+    "(item|other)/@kind",
+    "item/sub//@id",
+    "other='1'",
+    "other[.!='1.0']",
+    "//@kind='b'",
+    "item[@id eq '3']//@id",
+) + (
+    "item/text()",
+    "//.",
+    "item//.",
+    "(//.)[1]",
+    "item/@id[sub]",
+    "//@id[x]",
+)
+
+# The ones that are not offloaded
+mixed_not_translated = mixed_queries[-6:]
+
+translated = (
+    ("country", "child::country"),
+    ("//neighbor/@name", "$top/descendant::neighbor/attribute::name"),
+    ("country[@name eq 'Panama']/rank", "child::country[attribute::name = 'Panama']/child::rank"),
+    ("country[last()][1]", "child::country[last()][1]"),
+    ("country[position() lt 3]", "child::country[position() < 3]"),
+    ("country[2]|country[1]", "child::country[2] | child::country[1]"),
+    ("(country|neighbor)/@name", "(child::country | child::neighbor)/attribute::name"),
+    ('country[neighbor/@name!="O\'Brien"]', 'child::country[child::neighbor/attribute::name != "O\'Brien"]'),
+    ("./country", "./child::country"),
+    ("country/.", "child::country/."),
+    (".", "."),
+)
+
+not_translated = (
+    "country/rank/text()",
+    "$var/country",
+    "country[rank<5]",
+    "country[rank='1'][rank=1]",
+    "country[@name<'B']",
+    "country[neighbor/@name eq 'Malaysia']",
+    "country[string(rank) eq '1']",
+    "country/(rank,year)",
+    "country intersect country[1]",
+    "country except country[1]",
+    "country/last()",
+    "country/@name eq 'Panama'",
+    "ancestor::country",
+    "country/rank/(/country)",
+    "self::country",
+    "country/self::country",
+    "@x/a",
+    "country/@name/a",
+    "(country/@name)/rank",
+    "//.",
+    "country//.",
+    "country//./.",
+    "country/@name[rank]",
+    "//@name[x]",
+)
+
+
+@pytest.fixture
+def not_offloaded() -> Iterator[None]:
+    set_offload(False)
+    try:
+        yield
+    finally:
+        set_offload(True)
+
+
+def outcome(data: Any, query: str, variables: VarType) -> Any:
+    try:
+        return pyopath.query(data, query, variables=variables)
+    except Exception as e:
+        return type(e)
+
+
+def both_ways(data: Any, query: str, variables: VarType = None) -> Any:
+    offloaded = outcome(data, query, variables)
+    set_offload(False)
+    try:
+        evaluated = outcome(data, query, variables)
+    finally:
+        set_offload(True)
+    return offloaded, evaluated
+
+
+@pytest.mark.parametrize("lang_version, query, reference, variables", test_xml_cases)
+def test_offload_matches_evaluators(lang_version: int, query: str, reference: Any, variables: VarType):
+    model = basic_lxml_data
+    if variables:
+        variables = {key: value(model) if callable(value) else value for key, value in variables.items()}
+    offloaded, evaluated = both_ways(model, query, variables)
+    assert offloaded == evaluated
+
+
+@pytest.mark.parametrize("query", mixed_queries)
+@pytest.mark.parametrize("top", ["root", "item"])
+def test_offload_matches_evaluators_mixed(query: str, top: str):
+    data = mixed_data if top == "root" else mixed_data[0]
+    assert (pyopath.compile(query).xpath is None) == (query in mixed_not_translated)
+    offloaded, evaluated = both_ways(data, query)
+    assert offloaded == evaluated
+
+
+@pytest.mark.parametrize("query, expected", translated)
+def test_translate(query: str, expected: str):
+    assert translate(optimize(parse(query))) == expected
+
+
+@pytest.mark.parametrize("query", not_translated)
+def test_not_translated(query: str):
+    assert translate(optimize(parse(query))) is None
+
+
+def test_compiled_query_xpath(not_offloaded: None):
+    assert pyopath.compile("country[1]/@name").xpath == "child::country[1]/attribute::name"
+    assert pyopath.compile("country/rank/text()").xpath is None
+    # Translated whether offloaded or not, but only evaluated by lxml when offloaded
+    assert pyopath.query(basic_lxml_data, "country[1]/@name") == ["Liechtenstein"]
+
+
+def test_offloaded_results(not_offloaded: None):
+    set_offload(True)
+    assert pyopath.query(basic_lxml_data, "/country[2]/@name") == ["Singapore"]
+    assert type(pyopath.query(basic_lxml_data, "country[2]/@name")[0]) is str
+    assert pyopath.query(basic_lxml_data, "country/@name='Panama'") == [True]
+    # Wrapped nodes are evaluated as before
+    nodes = pyopath.query(basic_lxml_data, "country[2]", unwrap_nodes=False)
+    assert nodes[0].unwrap() is basic_lxml_data[1]
@@ -0,0 +1,74 @@
+import pytest
+from test_closures import outcome
+
+import pyopath
+from pyopath.doer import evaluate
+from pyopath.optimizer import RULES, enabled_rules, optimize, set_rule
+from pyopath.xpath.AST.ast import AxisStep, Literal, NameTest, PathOperator
+from pyopath.xpath.AST.parser import parse
+
+rewritten = [
+    ("fold_constants", "2 eq 2"),
+    ("fold_constants", "country[rank/text() eq '4'][2 eq 3]"),
+    ("fold_constants", "country['x' ne 'y']/@name"),
+    ("fuse_descendant", ".//neighbor/@name"),
+    ("fuse_descendant", "country//neighbor[@direction eq 'W']/@name"),
+    ("fuse_descendant", "country//text()"),
+    ("fuse_descendant", ".//country//@name"),
+    ("fuse_descendant", "//neighbor[@direction eq 'E']/@name"),
+    ("fuse_descendant", "/country//neighbor/@name"),
+    ("drop_true_predicates", "country[.]/@name"),
+    ("drop_true_predicates", "country['x'][2]/@name"),
+    ("drop_true_predicates", "country[1 eq 1]/rank"),
+]
+
+kept = [
+    # Positions within each parent differ from positions among all the descendants
+    ".//neighbor[1]/@name",
+    "//neighbor[1]/@name",
+    ".//neighbor[last()]/@name",
+    ".//neighbor[position() eq 1]/@name",
+    ".//@name",
+    "country['']",
+    "country[2]",
+    "1 eq 'a'",
+]
+
+
+@pytest.mark.parametrize("rule, query", rewritten)
+def test_rule_changes_plan_not_results(rule: str, query: str):
+    node = parse(query)
+    without = optimize(node, set(RULES) - {rule})
+    optimized = optimize(node, RULES)
+    assert optimized is not without
+    expected = outcome(lambda context: evaluate(node, context))
+    assert outcome(lambda context: evaluate(without, context)) == expected
+    assert outcome(lambda context: evaluate(optimized, context)) == expected
+
+
+@pytest.mark.parametrize("query", kept)
+def test_not_rewritten(query: str):
+    node = parse(query)
+    assert optimize(node, RULES) is node
+
+
+def test_fused_plan():
+    assert optimize(parse("a//b")) is PathOperator(
+        AxisStep("child", NameTest("a")), AxisStep("descendant", NameTest("b"))
+    )
+    assert optimize(parse("2 eq 2")) is Literal(True)
+
+
+def test_rule_switch():
+    node = parse("country[.]")
+    try:
+        set_rule("drop_true_predicates", False)
+        assert "drop_true_predicates" not in enabled_rules()
+        assert optimize(node) is node
+        pyopath.clear_cache()
+        assert pyopath.compile("country[.]").plan is node
+    finally:
+        set_rule("drop_true_predicates", True)
+        pyopath.clear_cache()
+    assert optimize(node) is parse("country")
+    assert pyopath.compile("country[.]").plan is parse("country")
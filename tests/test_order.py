@@ -0,0 +1,95 @@
+import random
+import xml.etree.ElementTree as XMLET
+from typing import Any, List
+
+import lxml.etree as LXMLET
+import pytest
+from test_doer import basic_xml_str
+
+import pyopath
+from pyopath.closures import compile_node
+from pyopath.doer import create_context, evaluate
+from pyopath.nodewrappers.base import NodeBase, ancestry_key, attributes, descendants, order_key
+from pyopath.nodewrappers.etree import clear_document_order
+from pyopath.nodewrappers.registry import wrap
+from pyopath.xpath.AST.parser import parse
+
+
+@pytest.fixture(params=[XMLET, LXMLET], ids=["xml", "lxml"])
+def document(request: Any) -> Any:
+    return request.param.fromstring(basic_xml_str)
+
+
+def all_nodes(top: NodeBase) -> List[NodeBase]:
+    """
+    Every node in document order, attributes right after their element.
+    """
+    nodes = [top] + list(attributes(top))
+    for node in descendants(top):
+        nodes.append(node)
+        nodes.extend(attributes(node))
+    return nodes
+
+
+def test_order_key_sorts_in_document_order(document: Any):
+    nodes = all_nodes(wrap(document))
+    shuffled = list(nodes)
+    random.Random(1).shuffle(shuffled)
+    assert sorted(shuffled, key=order_key) == nodes
+    assert sorted(shuffled, key=ancestry_key) == nodes
+    assert len(set(map(order_key, nodes))) == len(nodes)
+
+
+def test_order_key_is_the_same_for_rewrapped_nodes(document: Any):
+    first = all_nodes(wrap(document))
+    second = all_nodes(wrap(document))
+    assert [order_key(node) for node in first] == [order_key(node) for node in second]
+
+
+def test_changed_documents_are_numbered_again(document: Any):
+    assert order_key(wrap(document))
+    added = document.makeelement("country", {"name": "Added"})
+    document[0].append(added)
+    # Keys of added elements are found by numbering the document again
+    assert all(order_key(node) for node in all_nodes(wrap(document)))
+    # But nodes are only sure to be in order with the document numbered since it changed
+    clear_document_order(document)
+    nodes = all_nodes(wrap(document))
+    assert sorted(reversed(nodes), key=order_key) == nodes
+    assert pyopath.query(document, "country/@name|country/country/@name") == [
+        "Liechtenstein",
+        "Added",
+        "Singapore",
+        "Panama",
+    ]
+
+
+def test_combining_atomic_values_is_an_error(document: Any):
+    with pytest.raises(TypeError):
+        pyopath.query(document, "1|country")
+    with pytest.raises(TypeError):
+        pyopath.query(document, "country except 'x'")
+
+
+@pytest.mark.parametrize(
+    "query, ranks",
+    [
+        ("country[1]/rank|$var/rank", [0]),
+        ("country/rank intersect $var/rank", [0]),
+        ("country/rank except $var/rank", [1, 2]),
+        ("($var,country[1])/rank", [0]),
+        ("country[3]/rank|$var/rank|country/rank", [0, 1, 2]),
+    ],
+)
+def test_nodes_of_a_variable_inside_the_tree(document: Any, query: str, ranks: List[int]):
+    expected = [document[rank][0] for rank in ranks]
+    variables = dict(var=[document[0]])
+    node = parse(query)
+    interpreted = list(evaluate(node, create_context(document, None, variables)))
+    closures = [item.item for item in compile_node(node)(create_context(document, None, variables))]
+    for nodes in (interpreted, closures):
+        elements = [node.unwrap() for node in nodes]
+        if isinstance(document, XMLET.Element):
+            # Nodes of trees that are not known to be one are in some order with xml.etree
+            elements.sort(key=expected.index)
+        assert elements == expected
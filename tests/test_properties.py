@@ -0,0 +1,50 @@
+import pytest
+
+from pyopath.optimizer import optimize
+from pyopath.properties import ATOMIC, SORTED, needs_sorting, properties
+from pyopath.xpath.AST.parser import parse
+
+unsorted = [
+    "country/rank",
+    "country/neighbor/@name",
+    "country[2]/descendant::neighbor",
+    "descendant::country/@name",
+    "./country/./rank/.",
+    "country/(rank|year)",
+    "country/(./rank)",
+    "country/rank/text() eq '1'",
+    "country/position()",
+]
+
+sorted_after = [
+    # The children of each node come before the children of its descendants
+    "//neighbor[1]/@name",
+    "country//text()",
+    "descendant::country/descendant::neighbor",
+    "descendant::country/rank",
+    # The sequence may be in any order
+    "(country[2],country[1])/@name",
+    "country/(neighbor,.)",
+    # Every country gives the same nodes
+    "country/(/country)",
+    "country/rank/(//year)",
+]
+
+
+@pytest.mark.parametrize("query", unsorted)
+def test_path_is_not_sorted(query: str):
+    node = optimize(parse(query))
+    assert not needs_sorting(node)
+    assert properties(node) & SORTED == SORTED or properties(node) & ATOMIC
+
+
+@pytest.mark.parametrize("query", sorted_after)
+def test_path_is_sorted(query: str):
+    node = parse(query)
+    assert needs_sorting(node)
+    assert properties(node) & SORTED == SORTED
+
+
+def test_fused_descendants_are_not_sorted():
+    assert needs_sorting(parse("country//neighbor"))
+    assert not needs_sorting(optimize(parse("country//neighbor")))
@@ -0,0 +1,136 @@
+import xml.etree.ElementTree as XMLET
+from typing import Any
+
+import lxml.etree as LXMLET
+import pytest
+from test_doer import basic_xml_str
+
+import pyopath
+from pyopath.nodewrappers import etree as wrappers
+from pyopath.nodewrappers.base import attributes, children, descendants
+from pyopath.nodewrappers.etree import (
+    WRAPPER_CACHE_SIZE,
+    clear_document_order,
+    clear_wrappers,
+    document_changed,
+    set_string_cache,
+    set_wrapper_cache_size,
+)
+from pyopath.nodewrappers.registry import wrap
+
+
+@pytest.fixture(params=[XMLET, LXMLET], ids=["xml", "lxml"])
+def document(request: Any) -> Any:
+    return request.param.fromstring(basic_xml_str)
+
+
+def test_nodes_are_wrapped_once(document: Any):
+    top = wrap(document)
+    assert wrap(document) is top
+    first = list(descendants(top))
+    assert [node for node in descendants(top)] == first
+    assert all(a is b for a, b in zip(descendants(top), first))
+    country = first[0]
+    assert list(attributes(country))[0] is list(attributes(country))[0]
+    assert not hasattr(country, "__dict__")
+
+
+def test_wrappers_are_kept_across_queries(document: Any):
+    first = pyopath.compile("country/neighbor").evaluate(document, unwrap_nodes=False)
+    second = pyopath.compile("descendant::neighbor").evaluate(document, unwrap_nodes=False)
+    assert all(a is b for a, b in zip(first, second))
+    clear_wrappers(document)
+    third = pyopath.compile("country/neighbor").evaluate(document, unwrap_nodes=False)
+    assert not any(a is b for a, b in zip(first, third))
+
+
+def test_changed_nodes_are_wrapped_anew(document: Any):
+    top = wrap(document)
+    first, second = list(children(top))[:2]
+    name = list(attributes(first))[0]
+    neighbor = list(children(first))[3]
+    first.element.set("name", "Changed")
+    assert list(attributes(first))[0] is not name
+    assert list(attributes(first))[0].string_value() == "Changed"
+    # Moved to the second country
+    second.element.append(neighbor.element)
+    moved = [node for node in children(second) if node.unwrap() is neighbor.element]
+    assert moved[0].parent() is second
+    assert neighbor.parent() is first
+
+
+def test_no_wrappers_kept(document: Any):
+    try:
+        set_wrapper_cache_size(0)
+        assert wrap(document) is not wrap(document)
+        top = wrap(document)
+        assert list(children(top))[0] is list(children(top))[0]
+    finally:
+        set_wrapper_cache_size(WRAPPER_CACHE_SIZE)
+
+
+@pytest.mark.parametrize("etree", [XMLET, LXMLET], ids=["xml", "lxml"])
+def test_small_documents_are_evicted(etree: Any):
+    size = 100
+    try:
+        clear_wrappers()
+        set_wrapper_cache_size(size)
+        trees = [etree.fromstring("<a><b x='1'/></a>") for _ in range(3 * size)]
+        for tree in trees:
+            # Wrapped, rather than offloaded to lxml
+            assert len(pyopath.query(tree, "b/@x", unwrap_nodes=False)) == 1
+        assert len(wrappers._documents) <= size
+        assert 0 < wrappers._documents.info().currsize <= size
+        assert wrappers._documents.get(id(trees[0])) is None
+        assert wrappers._documents.get(id(trees[-1])) is not None
+        # Weighed again as it grows
+        large = etree.fromstring("<a>" + "<b x='1'/>" * 40 + "</a>")
+        pyopath.query(large, "b/@x", unwrap_nodes=False)
+        assert wrappers._documents.info().currsize >= 80
+    finally:
+        set_wrapper_cache_size(WRAPPER_CACHE_SIZE)
+        clear_wrappers()
+
+
+@pytest.mark.parametrize("etree", [XMLET, LXMLET], ids=["xml", "lxml"])
+def test_string_value(etree: Any):
+    document = etree.fromstring("<a>x<b>y<c>z</c>tail</b>w<!--comment--><?pi data?>v<d/></a>")
+    top = wrap(document)
+    assert top.string_value() == "xyztailwv"
+    elements = {node.node_name(): node for node in children(top) if node.node_kind() == "element"}
+    assert elements["b"].string_value() == "yztail"
+    assert elements["d"].string_value() == ""
+
+
+def test_changed_document_through_a_variable(document: Any):
+    variables = dict(v=document[0])
+    try:
+        set_string_cache(True)
+        assert "2008" in pyopath.query(document, "string($v)", variables=variables)[0]
+        document[0].find("year").text = "2009"
+        document_changed(document)
+        assert "2009" in pyopath.query(document, "string($v)", variables=variables)[0]
+    finally:
+        set_string_cache(False)
+    order = "$v/rank|$v/neighbor"
+    assert pyopath.query(document, order, variables=variables, unwrap_nodes=False)[0].node_name() == "rank"
+    # Moved to the end of the first country; its rank comes after its neighbors then
+    document[0].append(document[0][0])
+    clear_document_order(document)
+    assert pyopath.query(document, order, variables=variables, unwrap_nodes=False)[-1].node_name() == "rank"
+
+
+def test_cached_string_value(document: Any):
+    try:
+        set_string_cache(True)
+        top = wrap(document)
+        country = list(children(top))[0]
+        assert "2008" in country.string_value()
+        document[0].find("year").text = "2009"
+        assert "2008" in country.string_value()
+        document_changed(document)
+        assert "2009" in country.string_value()
+    finally:
+        set_string_cache(False)
+    document[0].find("year").text = "2010"
+    assert "2010" in country.string_value()
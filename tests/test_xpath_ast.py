@@ -0,0 +1,48 @@
+import dataclasses
+import gc
+
+import pytest
+
+from pyopath.xpath.AST import ast
+from pyopath.xpath.AST.ast import AxisStep, Literal, NameTest, PathOperator, Predicate, StaticFunctionCall
+from pyopath.xpath.AST.parser import parse
+
+
+def test_nodes_are_interned():
+    assert parse("a/b[1]") is parse("a/b[1]")
+    assert AxisStep("child", NameTest("a")) is AxisStep("child", NameTest("a"))
+    assert AxisStep("child", NameTest("a")) is not AxisStep("child", NameTest("b"))
+    assert NameTest(name="a") is NameTest("a")
+
+
+def test_subtrees_are_shared():
+    first = parse("a/b/c")
+    second = parse("x[a/b/c]")
+    assert isinstance(first, PathOperator)
+    assert second.predicates[0].predicate is first
+
+
+def test_literal_types_are_kept():
+    assert Literal(1) is not Literal(1.0)
+    assert Literal(1) is not Literal(True)
+    assert type(Literal(1.0).value) is float
+
+
+def test_lists_are_frozen():
+    node = StaticFunctionCall("f", [Literal(1), [Literal(2)]])
+    assert node.arguments == (Literal(1), (Literal(2),))
+    assert node is StaticFunctionCall("f", (Literal(1), (Literal(2),)))
+
+
+def test_nodes_are_immutable():
+    node = NameTest("a")
+    assert not hasattr(node, "__dict__")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        node.name = "b"  # type: ignore
+    assert hash(node) == hash(NameTest("a"))
+
+
+def test_dead_nodes_are_forgotten():
+    Predicate(NameTest("forgotten"))
+    gc.collect()
+    assert not any(key[0] is NameTest and key[1] == "forgotten" for key in ast._interned)
@@ -1,8 +1,9 @@
 from typing import Any, Sequence, Tuple
 
 import pytest
+from test_xpath_parser_backends import generate_corpus
 
-from pyopath.xpath.AST.lexer import lex
+from pyopath.xpath.AST.lexer import lex, ply_lex
 
 test_cases: Sequence[Tuple[str, Any]] = (
     ("a", (("EQNAME", "a"),)),
@@ -20,6 +21,10 @@ test_cases: Sequence[Tuple[str, Any]] = (
     ("'hello'", (("STRING", "hello"),)),
     ('"hello"', (("STRING", "hello"),)),
     ("$variable", (("$", "$"), ("EQNAME", "variable"))),
+    ("f(a,1)", (("EQNAME", "f"), ("(", "("), ("EQNAME", "a"), (",", ","), ("NUMBER", "1"), (")", ")"))),
+    ("a|b", (("EQNAME", "a"), ("|", "|"), ("EQNAME", "b"))),
+    ("a union b", (("EQNAME", "a"), ("UNION", " union "), ("EQNAME", "b"))),
+    ("a except b", (("EQNAME", "a"), ("EXCEPT", " except "), ("EQNAME", "b"))),
 )
 
 
@@ -30,3 +35,62 @@ def test_lexer(query: str, reference: Tuple[str, str]):
         print(query)
         print(res)
         assert res == reference
+
+
+def ply_outcome(query: str) -> Any:
+    try:
+        return tuple((token.type, token.value, token.lexpos) for token in ply_lex(query))
+    except ValueError:
+        return ValueError
+
+
+def outcome(query: str) -> Any:
+    try:
+        return tuple((token.type, token.value, token.lexpos) for token in lex(query))
+    except ValueError:
+        return ValueError
+
+
+@pytest.mark.parametrize(
+    "query",
+    [case[0] for case in test_cases]
+    + generate_corpus(200, seed=4321)
+    + [
+        "child::a",
+        "childish::a",
+        "text()",
+        "textual()",
+        "text::a",
+        "node(",
+        "'a\\'b'",
+        '"a\\"b"',
+        "'unterminated",
+        "1 eq 2",
+        "1 eq2",
+        "a ! b",
+        "..5",
+        "a<=b>=c<d>e!=f==g=h",
+        "{a}",
+        "a intersect b",
+        "a|b||c",
+        "union",
+        "a unionb",
+    ],
+)
+def test_lexer_matches_ply(query: str):
+    assert outcome(query) == ply_outcome(query)
+
+
+def test_lexer_axis_name_at_end():
+    # ply used to look ahead past the end of input here
+    assert [(token.type, token.value) for token in lex("a/child")] == [
+        ("EQNAME", "a"),
+        ("SLASH", "/"),
+        ("EQNAME", "child"),
+    ]
+
+
+def test_lexer_error_is_not_printed(capsys: Any):
+    with pytest.raises(ValueError, match="Illegal character ' '"):
+        list(lex("a b"))
+    assert capsys.readouterr().out == ""
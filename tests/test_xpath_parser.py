@@ -7,12 +7,17 @@ from pyopath.xpath.AST.ast import (
     ASTNode,
     AxisStep,
     Context,
+    Expressions,
+    IntersectExpr,
     Literal,
     NameTest,
     PathOperator,
     PostfixExpr,
     Predicate,
+    Root,
+    StaticFunctionCall,
     TextTest,
+    UnionExpr,
     ValueCompare,
     VarRef,
 )
@@ -62,7 +67,7 @@ test_cases: Sequence[Tuple[str, Any]] = (
     ("self::text()", AxisStep("self", TextTest())),
     ("text()", AxisStep("child", TextTest())),
     # Comparisons
-    ("1 eq 2", ValueCompare(Literal(2), Literal(1), "eq")),
+    ("1 eq 2", ValueCompare(Literal(1), Literal(2), "eq")),
     # Variable reference
     ("$variable", VarRef("variable")),
     # StringConcat expressions
@@ -70,8 +75,50 @@ test_cases: Sequence[Tuple[str, Any]] = (
     # to-expresisons
     # ("9 to 5", None),
     ## Rooted expressions
-    # ("/a", ("ROOT", AxisStep("child", NameTest("a")))),
-    # ("//a", ("DESCENCANTS", AxisStep("child", NameTest("a")))),
+    ("/", Root()),
+    ("/a", PathOperator(Root(), AxisStep("child", NameTest("a")))),
+    (
+        "//a",
+        PathOperator(
+            PathOperator(Root(), AxisStep("descendant-or-self", AnyKindTest())), AxisStep("child", NameTest("a"))
+        ),
+    ),
+    ("/a/b", PathOperator(Root(), PathOperator(AxisStep("child", NameTest("a")), AxisStep("child", NameTest("b"))))),
+    ("/ eq 1", ValueCompare(Root(), Literal(1), "eq")),
+    ("descendant::a", AxisStep("descendant", NameTest("a"))),
+    # Combining node sequences
+    ("a|b", UnionExpr(AxisStep("child", NameTest("a")), AxisStep("child", NameTest("b")))),
+    (
+        "a union b|c",
+        UnionExpr(
+            UnionExpr(AxisStep("child", NameTest("a")), AxisStep("child", NameTest("b"))),
+            AxisStep("child", NameTest("c")),
+        ),
+    ),
+    (
+        "a|b intersect c except d",
+        UnionExpr(
+            AxisStep("child", NameTest("a")),
+            IntersectExpr(
+                IntersectExpr(AxisStep("child", NameTest("b")), AxisStep("child", NameTest("c")), "intersect"),
+                AxisStep("child", NameTest("d")),
+                "except",
+            ),
+        ),
+    ),
+    (
+        "(a|b)/c",
+        PathOperator(
+            UnionExpr(AxisStep("child", NameTest("a")), AxisStep("child", NameTest("b"))),
+            AxisStep("child", NameTest("c")),
+        ),
+    ),
+    # Sequences and arguments
+    ("1,2", Expressions((Literal(1), Literal(2)))),
+    (
+        "f(1,(2,3))",
+        StaticFunctionCall("f", ("ARGLIST", "(", ((Literal(1),), (Expressions((Literal(2), Literal(3))),)), ")")),
+    ),
 )
 
 
@@ -85,3 +132,29 @@ def test_parser(query: str, reference: ASTNode):
         print(tokens)
         print(res)
     assert res == reference, f"{res} != {reference}"
+
+
+def test_parse_tables_up_to_date():
+    """
+    parsetab.py is generated from the grammar, run `python -m pyopath.xpath.AST.build_tables` if this fails.
+    """
+    import ply.yacc
+
+    import pyopath.xpath.AST.parsetab as parsetab
+    from pyopath.xpath.AST.lexer import PathLexer
+    from pyopath.xpath.AST.parser import PathParser
+
+    path_parser = PathParser()
+    path_parser.tokens = PathLexer.tokens  # type: ignore
+    pdict = {name: getattr(path_parser, name) for name in dir(path_parser)}
+    pdict["__file__"] = parsetab.__file__
+    reflect = ply.yacc.ParserReflect(pdict, log=ply.yacc.NullLogger())
+    reflect.get_all()
+    assert reflect.signature() == parsetab._lr_signature
+
+
+def test_parse_reuses_parser():
+    from pyopath.xpath.AST.parser import get_parser
+
+    assert get_parser() is get_parser()
+    assert parse("a") == parse("a")
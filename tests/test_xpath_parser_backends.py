@@ -0,0 +1,115 @@
+"""
+Differential tests, the ply and descent parser backends must agree on every expression.
+"""
+
+import random
+from typing import Any, List
+
+import pytest
+from test_doer import test_xml_cases
+from test_xpath_parser import test_cases as parser_cases
+
+from pyopath.xpath.AST.parser import parse
+
+NAMES = ("a", "b2", "country", "rank", "neighbor")
+AXES = ("child", "attribute", "self", "descendant", "parent", "ancestor")
+LITERALS = ("1", "1.5", "-3", "'str'", '"dq"')
+COMPARISONS = (" eq ", " ne ", " lt ", " ge ", "=", "==", "!=", "<", "<=", ">", ">=")
+
+
+def generate_step(rnd: random.Random, depth: int) -> str:
+    kind = rnd.randrange(9)
+    if kind == 0:
+        step = "@" + rnd.choice(NAMES)
+    elif kind == 1:
+        step = rnd.choice(AXES) + "::" + rnd.choice(NAMES + ("text()",))
+    elif kind == 2:
+        step = "text()"
+    elif kind == 3:
+        step = "."
+    elif kind == 4:
+        step = rnd.choice(LITERALS)
+    elif kind == 5:
+        step = "$" + rnd.choice(NAMES)
+    elif kind == 6 and depth > 0:
+        step = "(" + generate_expr(rnd, depth - 1) + ")"
+    else:
+        step = rnd.choice(NAMES)
+    while depth > 0 and rnd.random() < 0.3:
+        step += "[" + generate_expr(rnd, depth - 1) + "]"
+    return step
+
+
+def generate_path(rnd: random.Random, depth: int) -> str:
+    path = generate_step(rnd, depth)
+    while rnd.random() < 0.4:
+        path += rnd.choice(("/", "/", "//")) + generate_step(rnd, depth)
+    return path
+
+
+def generate_expr(rnd: random.Random, depth: int) -> str:
+    expr = generate_path(rnd, depth)
+    if rnd.random() < 0.25:
+        expr += rnd.choice(COMPARISONS) + generate_path(rnd, depth)
+    return expr
+
+
+def generate_corpus(count: int, seed: int = 1234) -> List[str]:
+    rnd = random.Random(seed)
+    return [generate_expr(rnd, 3) for _ in range(count)]
+
+
+corpus = sorted(set([case[0] for case in parser_cases] + [case[1] for case in test_xml_cases] + generate_corpus(400)))
+
+invalid_expressions = (
+    "a[",
+    "a[1",
+    "a]",
+    "a/",
+    "@",
+    "child::",
+    "$",
+    "1 eq",
+    "1 eq 2 eq 3",
+    "text(",
+    "text(1)",
+    "a//",
+    "//",
+    "/a/",
+    "..",
+    "node()",
+)
+
+
+def outcome(query: str, backend: str) -> Any:
+    try:
+        return parse(query, backend=backend)
+    except Exception as e:
+        return type(e)
+
+
+@pytest.mark.parametrize("query", corpus)
+def test_backends_agree(query: str):
+    reference = outcome(query, "ply")
+    result = outcome(query, "descent")
+    assert result == reference, f"{query}: {result} != {reference}"
+
+
+def test_corpus_is_mostly_valid():
+    parsed = [query for query in corpus if not isinstance(outcome(query, "ply"), type)]
+    assert len(parsed) > 0.9 * len(corpus)
+
+
+@pytest.mark.parametrize("query", invalid_expressions)
+def test_backends_agree_on_errors(query: str):
+    with pytest.raises(Exception) as ply_error:
+        parse(query, backend="ply")
+    with pytest.raises(Exception) as descent_error:
+        parse(query, backend="descent")
+    assert type(ply_error.value) is type(descent_error.value)
+
+
+def test_descent_error_is_not_printed(capsys: Any):
+    with pytest.raises(RuntimeError, match="ERROR!!"):
+        parse("a[", backend="descent")
+    assert capsys.readouterr().out == ""